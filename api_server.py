@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+Read-only JSON API for Web3 Job Board
+Serves jobs and companies from the database with gzip and ETag caching
+
+Endpoints:
+    GET /api/jobs                     ?limit=&after=&sector=&min_salary= (or &offset=)
+    GET /api/jobs/search              ?q=&sector=&limit=&min_salary=
+    GET /api/jobs/export              ?q=&sector=&min_salary= every match, streamed (chunked)
+    GET /api/jobs/<id>                full description and requirements
+    GET /api/sectors/<sector>/jobs    ?limit=&min_salary=
+    GET /api/companies
+    GET /api/skills                   ?limit=
+    GET /api/skills/jobs              ?skill=a,b&match=any|all&sector=&limit=&min_salary=
+    GET /api/facets                   ?facet=&limit=&sector=&company=&ats_type=&location=
+
+Run:
+    python3 api_server.py --port 5000
+"""
+
+import os
+import sys
+import gzip
+import zlib
+import json
+import time
+import hashlib
+import argparse
+import threading
+from collections import OrderedDict
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+from urllib.parse import urlparse, parse_qs, unquote
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from database import Database, JobRow, job_rows_to_json
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip (an explicit q=0 refuses it)"""
+    accepted = None
+    wildcard = False
+    for item in accept_encoding.split(','):
+        coding, _, params = item.strip().partition(';')
+        coding = coding.strip().lower()
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding in ('gzip', 'x-gzip'):
+            accepted = quality > 0
+        elif coding == '*':
+            wildcard = quality > 0
+    return wildcard if accepted is None else accepted
+
+
+class DataVersion:
+    """
+    Tracks the data generation without hitting SQLite on every request
+    
+    The generation combines the latest scrape_logs id with the database's
+    commit generation, so batches committed in the middle of a scrape run
+    invalidate cached responses too. It is prefixed with the server's start
+    time because SQLite's data_version restarts with each connection.
+    
+    The database files are stat()ed at most once per check_interval; the
+    generation is only re-read from SQLite when they have changed.
+    """
+
+    def __init__(self, db: Database, check_interval: float = 1.0):
+        self.db = db
+        self.check_interval = check_interval
+        self._started = format(time.time_ns(), 'x')
+        self.generation = self._read_generation()
+        self._fingerprint = self._file_fingerprint()
+        self._checked_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _read_generation(self) -> str:
+        writes, data_version = self.db.get_data_generation()
+        return f"{self._started}.{self.db.get_latest_scrape_id()}.{writes}.{data_version}"
+
+    def _file_fingerprint(self) -> Tuple:
+        fingerprint = []
+        for path in (self.db.db_path, f"{self.db.db_path}-wal"):
+            try:
+                stat = os.stat(path)
+                fingerprint.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                fingerprint.append(None)
+        return tuple(fingerprint)
+
+    def current(self) -> str:
+        """Get the current generation"""
+        with self._lock:
+            now = time.monotonic()
+            if now - self._checked_at >= self.check_interval:
+                self._checked_at = now
+                fingerprint = self._file_fingerprint()
+                if fingerprint != self._fingerprint:
+                    self._fingerprint = fingerprint
+                    self.generation = self._read_generation()
+            return self.generation
+
+
+class ResponseCache:
+    """LRU cache of encoded responses for one data generation"""
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self.generation = None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, generation: str, key: str) -> Optional[Dict]:
+        with self._lock:
+            if generation != self.generation:
+                self._entries.clear()
+                self.generation = generation
+                return None
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, generation: str, key: str, entry: Dict):
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class JobBoardAPI:
+    """Routes API requests to Database read methods"""
+
+    MAX_LIMIT = 500
+
+    def __init__(self, db: Database, check_interval: float = 1.0, cache_entries: int = 512):
+        self.db = db
+        self.version = DataVersion(db, check_interval)
+        self.cache = ResponseCache(cache_entries)
+
+    @staticmethod
+    def etag_for(generation: str, key: str, gzipped: bool) -> str:
+        """Strong ETag for one representation of a resource"""
+        digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+        return f'"g{generation}-{digest}{"-gz" if gzipped else ""}"'
+
+    def _int_param(self, params: Dict, name: str, default: Optional[int] = None,
+                   maximum: Optional[int] = None) -> Optional[int]:
+        values = params.get(name)
+        if not values or values[0] == '':
+            return default
+        value = int(values[0])
+        if value < 0:
+            raise ValueError(f"{name} must not be negative")
+        return min(value, maximum) if maximum else value
+
+    @staticmethod
+    def _str_param(params: Dict, name: str) -> Optional[str]:
+        values = params.get(name)
+        return values[0] if values else None
+
+    def export_rows(self, params: Dict) -> Iterator[JobRow]:
+        """
+        Stream the jobs behind /api/jobs/export (a search when q is given)
+        
+        Raises:
+            ValueError: if a query parameter is invalid
+        """
+        query = self._str_param(params, 'q')
+        sector = self._str_param(params, 'sector')
+        min_salary = self._int_param(params, 'min_salary')
+
+        if query:
+            return self.db.iter_search(query, sector=sector, min_salary=min_salary)
+        return self.db.iter_jobs(sector=sector, min_salary=min_salary)
+
+    def handle(self, path: str, params: Dict) -> Optional[Dict]:
+        """
+        Run the query behind an API path
+        
+        Returns:
+            JSON-serializable response body, or None for an unknown path
+        
+        Raises:
+            ValueError: if a query parameter is invalid
+        """
+        parts = [unquote(part) for part in path.split('/') if part]
+        limit = self._int_param(params, 'limit', 100, self.MAX_LIMIT)
+        min_salary = self._int_param(params, 'min_salary')
+
+        if parts == ['api', 'jobs']:
+            offset = self._int_param(params, 'offset')
+            if offset is not None:
+                jobs = self.db.get_all_jobs(limit=limit, offset=offset, min_salary=min_salary)
+                return {'jobs': jobs, 'count': len(jobs)}
+
+            page = self.db.get_jobs_page(
+                limit=limit,
+                after=self._str_param(params, 'after'),
+                sector=self._str_param(params, 'sector'),
+                min_salary=min_salary
+            )
+            return {'jobs': page['jobs'], 'count': len(page['jobs']), 'next_cursor': page['next_cursor']}
+
+        if parts == ['api', 'jobs', 'search']:
+            jobs = self.db.search_jobs(
+                self._str_param(params, 'q') or '',
+                sector=self._str_param(params, 'sector'),
+                limit=limit,
+                min_salary=min_salary
+            )
+            return {'jobs': jobs, 'count': len(jobs)}
+
+        if len(parts) == 3 and parts[:2] == ['api', 'jobs'] and parts[2].isdigit():
+            job = self.db.get_job_detail(int(parts[2]))
+            return {'job': job} if job else None
+
+        if len(parts) == 4 and parts[:2] == ['api', 'sectors'] and parts[3] == 'jobs':
+            jobs = self.db.get_jobs_by_sector(parts[2], limit=limit, min_salary=min_salary)
+            return {'jobs': jobs, 'count': len(jobs)}
+
+        if parts == ['api', 'skills']:
+            skills = self.db.get_skills(limit=limit)
+            return {'skills': skills, 'count': len(skills)}
+
+        if parts == ['api', 'skills', 'jobs']:
+            skills = [skill for value in params.get('skill', []) for skill in value.split(',')]
+            jobs = self.db.get_jobs_by_skills(
+                skills,
+                match=self._str_param(params, 'match') or 'any',
+                sector=self._str_param(params, 'sector'),
+                limit=limit,
+                min_salary=min_salary
+            )
+            return {'jobs': jobs, 'count': len(jobs)}
+
+        if parts == ['api', 'facets']:
+            filters = {
+                name: self._str_param(params, name)
+                for name in self.db.FACET_COLUMNS if self._str_param(params, name)
+            }
+            return self.db.get_facets(
+                filters,
+                facets=params.get('facet'),
+                limit=self._int_param(params, 'limit', 50, self.MAX_LIMIT)
+            )
+
+        if parts == ['api', 'companies']:
+            companies = self.db.get_all_companies(active_only=True)
+            return {'companies': companies, 'count': len(companies)}
+
+        return None
+
+
+def make_handler(api: JobBoardAPI):
+    """Build the request handler class bound to an API instance"""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        server_version = 'Web3JobBoardAPI/1.0'
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status: int, body: bytes = b'', headers: Optional[Dict] = None):
+            self.send_response(status)
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.send_header('Vary', 'Accept-Encoding')
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            if body and self.command != 'HEAD':
+                self.wfile.write(body)
+
+        def _send_error(self, status: int, message: str):
+            body = json.dumps({'error': message}).encode()
+            self._send(status, body, {'Content-Type': 'application/json', 'Cache-Control': 'no-store'})
+
+        def do_OPTIONS(self):
+            self._send(204, headers={
+                'Access-Control-Allow-Methods': 'GET, HEAD, OPTIONS',
+                'Access-Control-Allow-Headers': 'If-None-Match'
+            })
+
+        def _send_export(self, params: Dict, etag: str, gzipped: bool):
+            """Stream an export with chunked encoding; it is never held in memory or cached"""
+            try:
+                rows = api.export_rows(params)
+            except ValueError as e:
+                self._send_error(400, str(e))
+                return
+
+            self.send_response(200)
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.send_header('Vary', 'Accept-Encoding')
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Transfer-Encoding', 'chunked')
+            if gzipped:
+                self.send_header('Content-Encoding', 'gzip')
+            self.end_headers()
+
+            if self.command == 'HEAD':
+                return
+
+            # wbits 31: gzip container, streamed
+            compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if gzipped else None
+            chunks = job_rows_to_json(rows)
+            try:
+                for chunk in chunks:
+                    if compressor:
+                        chunk = compressor.compress(chunk)
+                    if chunk:
+                        self.wfile.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+                if compressor:
+                    chunk = compressor.flush()
+                    self.wfile.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+                self.wfile.write(b'0\r\n\r\n')
+            finally:
+                # Hand the read connection back even if the client went away
+                chunks.close()
+
+        def do_HEAD(self):
+            self.do_GET()
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            key = f"{url.path}?{url.query}"
+            gzipped = accepts_gzip(self.headers.get('Accept-Encoding', ''))
+
+            generation = api.version.current()
+            etag = api.etag_for(generation, key, gzipped)
+
+            # Revalidation needs nothing but the generation: no SQLite access
+            if etag in self.headers.get('If-None-Match', ''):
+                self._send(304, headers={'ETag': etag, 'Cache-Control': 'no-cache'})
+                return
+
+            if url.path.rstrip('/') == '/api/jobs/export':
+                self._send_export(parse_qs(url.query), etag, gzipped)
+                return
+
+            entry = api.cache.get(generation, key)
+            if entry is None:
+                try:
+                    data = api.handle(url.path, parse_qs(url.query))
+                except ValueError as e:
+                    self._send_error(400, str(e))
+                    return
+                except Exception as e:
+                    self._send_error(500, f"Internal error: {e}")
+                    return
+
+                if data is None:
+                    self._send_error(404, f"Not found: {url.path}")
+                    return
+
+                raw = json.dumps(data, default=str, separators=(',', ':')).encode()
+                entry = {'raw': raw, 'gzip': gzip.compress(raw, compresslevel=6)}
+                api.cache.put(generation, key, entry)
+
+            headers = {
+                'Content-Type': 'application/json; charset=utf-8',
+                'ETag': etag,
+                'Cache-Control': 'no-cache'
+            }
+            if gzipped:
+                headers['Content-Encoding'] = 'gzip'
+                self._send(200, entry['gzip'], headers)
+            else:
+                self._send(200, entry['raw'], headers)
+
+    return Handler
+
+
+def create_server(db_path: str = "web3_jobs.db", host: str = '127.0.0.1', port: int = 5000,
+                  read_pool_size: int = 8) -> ThreadingHTTPServer:
+    """
+    Create the API server over a WAL-mode, thread-safe Database
+    
+    Args:
+        db_path: Path to SQLite database file
+        host: Interface to bind
+        port: Port to listen on (0 picks a free port)
+        read_pool_size: Number of pooled read-only connections
+    
+    Returns:
+        Server ready for serve_forever()
+    """
+    db = Database(db_path, production=True, read_pool_size=read_pool_size)
+    api = JobBoardAPI(db)
+    server = ThreadingHTTPServer((host, port), make_handler(api))
+    server.daemon_threads = True
+    server.api = api
+    return server
+
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Read-only JSON API for the job board")
+    parser.add_argument('--db', default='web3_jobs.db', help="Database path (default: web3_jobs.db)")
+    parser.add_argument('--host', default='127.0.0.1', help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=5000, help="Port to listen on (default: 5000)")
+    parser.add_argument('--readers', type=int, default=8, help="Pooled reader connections (default: 8)")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    server = create_server(args.db, args.host, args.port, args.readers)
+    print(f"🌐 Serving job board API on http://{args.host}:{server.server_port}/api/jobs")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.api.db.close()
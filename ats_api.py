@@ -0,0 +1,366 @@
+"""
+Native ATS API Scrapers for Web3 Job Board
+Pulls whole boards from the public JSON posting feeds of Lever, Greenhouse
+and Ashby: one request per board, descriptions included, no HTML parsing
+
+Every scraper takes an optional base_url so it can be pointed at recorded
+fixture payloads served locally (see StandInATSServer in benchmark.py).
+"""
+
+import re
+import abc
+import html
+import time
+import hashlib
+import http.client
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+from compensation import format_compensation
+from http_transport import HttpTransport, HttpError
+
+
+SUMMARY_CHARS = 280
+
+# Word prefixes per sector, tried in order against the department, then the title
+SECTOR_KEYWORDS = [
+    ('engineering', r'engineer|developer|devops|security|protocol|research|data|infrastructure|'
+                    r'smart contract|blockchain|technical'),
+    ('design', r'design|ux\b|ui\b'),
+    ('product', r'product'),
+    ('marketing', r'marketing|growth|community|content|brand|communications'),
+    ('sales', r'sales|business development|account|partnership'),
+    ('operations', r'operations|finance|legal|compliance|people|recruit|talent|hr\b'),
+]
+
+_SECTOR_PATTERNS = [
+    (sector, re.compile(r'\b(?:' + keywords + r')', re.IGNORECASE))
+    for sector, keywords in SECTOR_KEYWORDS
+]
+
+KNOWN_SKILLS = [
+    'Solidity', 'Rust', 'Go', 'Python', 'TypeScript', 'JavaScript', 'React', 'Node.js',
+    'Java', 'C++', 'Kubernetes', 'AWS', 'SQL', 'GraphQL', 'Web3', 'DeFi', 'EVM',
+    'Cairo', 'Zero Knowledge', 'Cryptography', 'Figma', 'Salesforce'
+]
+
+# Short names ("Go", "AWS") only count with their usual capitalisation
+_SKILL_PATTERNS = [
+    (skill, re.compile(
+        r'(?<![\w.+#])' + re.escape(skill) + r'(?![\w+#-])',
+        re.IGNORECASE if len(skill) > 3 else 0
+    ))
+    for skill in KNOWN_SKILLS
+]
+
+_TAG_PATTERN = re.compile(r'<[^>]+>')
+_SPACE_PATTERN = re.compile(r'\s+')
+
+LEVER_PERIODS = {
+    'per-year-salary': 'year',
+    'per-month-salary': 'month',
+    'per-hour-wage': 'hour'
+}
+
+
+class FeedUnavailable(Exception):
+    """The board has no usable JSON feed; the HTML scraper should be used"""
+
+
+def html_to_text(markup: Optional[str]) -> str:
+    """Plain text of an HTML fragment (tags removed, then entities decoded)"""
+    if not markup:
+        return ''
+    text = _TAG_PATTERN.sub(' ', markup)
+    return _SPACE_PATTERN.sub(' ', html.unescape(text)).strip()
+
+
+def classify_sector(title: str, department: Optional[str] = None) -> str:
+    """Map a job's department and title to one of the board's sectors"""
+    for text in (department, title):
+        for sector, pattern in _SECTOR_PATTERNS:
+            if text and pattern.search(text):
+                return sector
+    return 'other'
+
+
+def extract_skills(text: str) -> List[str]:
+    """Known skills mentioned in a job's text, in KNOWN_SKILLS order"""
+    return [skill for skill, pattern in _SKILL_PATTERNS if pattern.search(text)]
+
+
+def _date(value) -> Optional[str]:
+    """YYYY-MM-DD from an ISO timestamp or epoch milliseconds"""
+    if not value:
+        return None
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value / 1000, tz=timezone.utc).strftime('%Y-%m-%d')
+    return str(value)[:10]
+
+
+class AtsApiScraper(abc.ABC):
+    """Base class: fetches one JSON feed per board and maps it to job dictionaries"""
+
+    ATS_TYPE = None
+    API_BASE = None
+    BOARD_HOST = None
+
+    def __init__(self, url: str, company_name: str, logo: str = '',
+                 transport: Optional[HttpTransport] = None, base_url: Optional[str] = None):
+        """
+        Initialize the scraper
+        
+        Args:
+            url: Public job board URL
+            company_name: Company the board belongs to
+            logo: Unused, kept for the scraper constructor signature
+            transport: Shared HTTP transport (a private one is created if not given)
+            base_url: API base URL overriding API_BASE (for local fixtures)
+        """
+        self.url = url
+        self.company_name = company_name
+        self.transport = transport or HttpTransport()
+        self.base_url = (base_url or self.API_BASE).rstrip('/')
+        # Time spent decoding and mapping feeds (the orchestrator's parse stage)
+        self.parse_ms = 0.0
+
+    def board_token(self) -> str:
+        """
+        Board identifier used by the API, taken from the board URL
+        
+        It is the path segment after the ATS host; the host may also appear
+        as the first path segment (boards proxied under another domain).
+        """
+        parts = urlsplit(self.url)
+        segments = [parts.hostname or ''] + [segment for segment in parts.path.split('/') if segment]
+
+        for index, segment in enumerate(segments[:-1]):
+            if re.search(self.BOARD_HOST, segment):
+                return segments[index + 1]
+
+        raise FeedUnavailable(f"No board token in {self.url}")
+
+    @abc.abstractmethod
+    def feed_url(self, token: str) -> str:
+        """URL of the board's JSON feed"""
+
+    @abc.abstractmethod
+    def parse_feed(self, data) -> List[Dict]:
+        """Map the decoded feed to job dictionaries"""
+
+    def scrape(self) -> List[Dict]:
+        """
+        Fetch and convert the whole board
+        
+        Raises:
+            FeedUnavailable: if the feed is missing, errors or isn't valid JSON
+        """
+        return self._parse_response(self._fetch_feed())
+
+    def scrape_conditional(self, validators: Dict) -> Optional[Tuple[List[Dict], Dict]]:
+        """
+        Fetch the feed only if it changed since the stored validators
+        
+        The feed request itself carries If-None-Match / If-Modified-Since,
+        and a full response whose body hashes to the stored content digest
+        also counts as unchanged, so a board costs one request either way.
+        
+        Args:
+            validators: Stored fetch cache entry (etag, last_modified, content_digest)
+        
+        Returns:
+            None if the board is unchanged, else (jobs, new validators)
+        
+        Raises:
+            FeedUnavailable: if the feed is missing, errors or isn't valid JSON
+        """
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+
+        response = self._fetch_feed(headers)
+        if response.status == 304:
+            return None
+
+        digest = hashlib.sha256(response.body).hexdigest()
+        if digest == validators.get('content_digest'):
+            return None
+
+        return self._parse_response(response), {
+            'etag': response.headers.get('etag'),
+            'last_modified': response.headers.get('last-modified'),
+            'content_digest': digest
+        }
+
+    def _fetch_feed(self, headers: Optional[Dict[str, str]] = None):
+        url = self.feed_url(self.board_token())
+        request_headers = {'Accept': 'application/json'}
+        request_headers.update(headers or {})
+        try:
+            response = self.transport.get(url, headers=request_headers)
+        except (OSError, http.client.HTTPException) as e:
+            raise FeedUnavailable(f"{url}: {e}")
+        if not response.ok and response.status != 304:
+            raise FeedUnavailable(str(HttpError(response.status, url)))
+        return response
+
+    def _parse_response(self, response) -> List[Dict]:
+        start = time.perf_counter()
+        try:
+            return self.parse_feed(response.json())
+        except ValueError as e:
+            raise FeedUnavailable(str(e))
+        finally:
+            self.parse_ms += (time.perf_counter() - start) * 1000
+
+    def make_job(self, title: str, job_url: str, location: Optional[str], department: Optional[str],
+                 text: str, posted, requirements: Optional[str] = None,
+                 salary: Optional[str] = None) -> Dict:
+        """Build a job dictionary in the format the orchestrator expects"""
+        return {
+            'title': title,
+            'company_name': self.company_name,
+            'location': location or 'Remote',
+            'salary': salary,
+            'sector': classify_sector(title, department),
+            'description': text[:SUMMARY_CHARS],
+            'full_description': text,
+            'requirements': requirements,
+            'skills': extract_skills(f"{title} {text}"),
+            'job_url': job_url,
+            'posted_date': _date(posted)
+        }
+
+
+class LeverApiScraper(AtsApiScraper):
+    """Lever postings API: GET /v0/postings/<company>?mode=json"""
+
+    ATS_TYPE = 'lever'
+    API_BASE = 'https://api.lever.co'
+    BOARD_HOST = r'lever\.co$'
+
+    def feed_url(self, token: str) -> str:
+        return f"{self.base_url}/v0/postings/{token}?mode=json"
+
+    def parse_feed(self, data) -> List[Dict]:
+        if not isinstance(data, list):
+            raise FeedUnavailable("Unexpected Lever feed shape")
+
+        jobs = []
+        for posting in data:
+            job_url = posting.get('hostedUrl') or posting.get('applyUrl')
+            if not job_url:
+                continue
+            categories = posting.get('categories') or {}
+            text = posting.get('descriptionPlain') or html_to_text(posting.get('description'))
+
+            # Requirements and responsibilities come as titled lists
+            requirements = []
+            for section in posting.get('lists') or []:
+                content = html_to_text(section.get('content'))
+                requirements.append(f"{section.get('text', '')}: {content}".strip(': '))
+                text = f"{text} {section.get('text', '')} {content}"
+            additional = posting.get('additionalPlain') or html_to_text(posting.get('additional'))
+            if additional:
+                text = f"{text} {additional}"
+
+            salary = None
+            salary_range = posting.get('salaryRange') or {}
+            if salary_range.get('min') and salary_range.get('max'):
+                salary = format_compensation({
+                    'salary_min': int(salary_range['min']),
+                    'salary_max': int(salary_range['max']),
+                    'salary_currency': salary_range.get('currency') or 'USD',
+                    'salary_period': LEVER_PERIODS.get(salary_range.get('interval'), 'year')
+                })
+
+            jobs.append(self.make_job(
+                title=posting.get('text', ''),
+                job_url=job_url,
+                location=categories.get('location'),
+                department=categories.get('team') or categories.get('department'),
+                text=text.strip(),
+                posted=posting.get('createdAt'),
+                requirements='\n'.join(requirements) or None,
+                salary=salary
+            ))
+        return jobs
+
+
+class GreenhouseApiScraper(AtsApiScraper):
+    """Greenhouse job board API: GET /v1/boards/<token>/jobs?content=true"""
+
+    ATS_TYPE = 'greenhouse'
+    API_BASE = 'https://boards-api.greenhouse.io'
+    BOARD_HOST = r'greenhouse\.io$'
+
+    def board_token(self) -> str:
+        # Embedded boards: boards.greenhouse.io/embed/job_board?for=<token>
+        token = parse_qs(urlsplit(self.url).query).get('for')
+        if token:
+            return token[0]
+        return super().board_token()
+
+    def feed_url(self, token: str) -> str:
+        return f"{self.base_url}/v1/boards/{token}/jobs?content=true"
+
+    def parse_feed(self, data) -> List[Dict]:
+        if not isinstance(data, dict) or 'jobs' not in data:
+            raise FeedUnavailable("Unexpected Greenhouse feed shape")
+
+        jobs = []
+        for posting in data['jobs']:
+            if not posting.get('absolute_url'):
+                continue
+            departments = posting.get('departments') or [{}]
+            jobs.append(self.make_job(
+                title=posting.get('title', ''),
+                job_url=posting.get('absolute_url'),
+                location=(posting.get('location') or {}).get('name'),
+                department=departments[0].get('name'),
+                # content is HTML with its entities escaped once more
+                text=html_to_text(html.unescape(posting.get('content') or '')),
+                posted=posting.get('first_published') or posting.get('updated_at')
+            ))
+        return jobs
+
+
+class AshbyApiScraper(AtsApiScraper):
+    """Ashby posting API: GET /posting-api/job-board/<org>?includeCompensation=true"""
+
+    ATS_TYPE = 'ashby'
+    API_BASE = 'https://api.ashbyhq.com'
+    BOARD_HOST = r'ashbyhq\.com$'
+
+    def feed_url(self, token: str) -> str:
+        return f"{self.base_url}/posting-api/job-board/{token}?includeCompensation=true"
+
+    def parse_feed(self, data) -> List[Dict]:
+        if not isinstance(data, dict) or 'jobs' not in data:
+            raise FeedUnavailable("Unexpected Ashby feed shape")
+
+        jobs = []
+        for posting in data['jobs']:
+            job_url = posting.get('jobUrl') or posting.get('applyUrl')
+            if posting.get('isListed') is False or not job_url:
+                continue
+            compensation = posting.get('compensation') or {}
+            jobs.append(self.make_job(
+                title=posting.get('title', ''),
+                job_url=job_url,
+                location=posting.get('location'),
+                department=posting.get('department') or posting.get('team'),
+                text=posting.get('descriptionPlain') or html_to_text(posting.get('descriptionHtml')),
+                posted=posting.get('publishedAt'),
+                salary=compensation.get('compensationTierSummary')
+            ))
+        return jobs
+
+
+API_SCRAPERS = {
+    scraper.ATS_TYPE: scraper
+    for scraper in (LeverApiScraper, GreenhouseApiScraper, AshbyApiScraper)
+}
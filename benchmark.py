@@ -0,0 +1,620 @@
+#!/usr/bin/env python3
+"""
+Offline Benchmark Suite for Web3 Job Board
+Measures scrape throughput against a local ATS stand-in server and
+read-query latency at several table sizes, without touching the network
+
+Usage:
+    python3 benchmark.py                              # full run
+    python3 benchmark.py --skip-queries --boards 20   # scrape pipeline only
+    python3 benchmark.py --sizes 10000,100000 --compare old_results.json
+"""
+
+import sys
+import os
+import json
+import time
+import random
+import argparse
+import resource
+import tempfile
+import platform
+import sqlite3
+import statistics
+import subprocess
+import threading
+from datetime import datetime, timedelta
+from functools import wraps
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from typing import Dict, List
+from urllib.parse import urlparse
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from database import Database
+
+
+ATS_TYPES = ['lever', 'greenhouse', 'ashby', 'breezy', 'workable']
+
+# Host each stand-in board is namespaced under, so detect_ats_type() still works
+ATS_HOSTS = {
+    'lever': 'jobs.lever.co',
+    'greenhouse': 'job-boards.greenhouse.io',
+    'ashby': 'jobs.ashbyhq.com',
+    'breezy': 'breezy.hr',
+    'workable': 'apply.workable.com'
+}
+
+TITLES = [
+    "Senior Blockchain Engineer", "Smart Contract Developer", "Head of Marketing",
+    "Enterprise Sales Manager", "Product Designer", "Security Engineer",
+    "Community Manager", "Full Stack Engineer", "Business Development Lead",
+    "Protocol Researcher", "DevOps Engineer", "Growth Marketing Manager"
+]
+
+SECTORS = ['engineering', 'marketing', 'sales', 'design', 'operations']
+
+SKILLS = ['Solidity', 'Rust', 'React', 'Node.js', 'TypeScript', 'Go', 'Python', 'Web3', 'DeFi', 'EVM']
+
+LOCATIONS = ['Remote', 'New York, NY', 'San Francisco, CA', 'London, UK', 'Singapore', 'Lisbon, PT']
+
+PARAGRAPH = (
+    "We are building the financial infrastructure of the decentralized web. "
+    "You will work with a distributed team across protocol, product and go-to-market, "
+    "own critical systems end to end, and help shape how millions of people use crypto. "
+)
+
+
+# ==================== SYNTHETIC DATA ====================
+
+def synthetic_job(rng: random.Random, company: str, index: int, url: str) -> Dict:
+    """Build one synthetic job posting"""
+    title = TITLES[index % len(TITLES)]
+    low = rng.randrange(80, 200) * 1000
+    skills = rng.sample(SKILLS, rng.randint(2, 5))
+    description = f"{title} at {company}. " + PARAGRAPH * rng.randint(3, 12)
+    if rng.random() < 0.6:
+        description += f" Compensation: ${low:,} - ${low + 50000:,} per year."
+
+    return {
+        'id': f"{company.lower().replace(' ', '-')}-{index}",
+        'title': title,
+        'company_name': company,
+        'location': rng.choice(LOCATIONS),
+        'sector': SECTORS[index % len(SECTORS)],
+        'description': description[:280],
+        'full_description': description,
+        'skills': skills,
+        'job_url': url,
+        'posted_date': (datetime(2026, 1, 1) + timedelta(days=rng.randrange(365))).strftime('%Y-%m-%d')
+    }
+
+
+def synthetic_rows(count: int, seed: int = 7):
+    """Yield ready-to-insert job dictionaries for the query benchmarks"""
+    rng = random.Random(seed)
+    scraped_at = datetime(2026, 1, 1)
+
+    for i in range(count):
+        company = f"Company {i % 500}"
+        job = synthetic_job(rng, company, i, f"https://bench.local/{i}")
+        job.pop('id')
+        job['job_hash'] = f"bench-{i}"
+        job['company_id'] = None
+        job['ats_type'] = ATS_TYPES[i % len(ATS_TYPES)]
+        job['scraped_at'] = (scraped_at + timedelta(seconds=i)).isoformat()
+        yield job
+
+
+# ==================== ATS STAND-IN SERVER ====================
+
+class StandInATSServer:
+    """
+    Local HTTP server serving synthetic boards shaped like each supported ATS
+    
+    Every board lives under /<ats host>/<slug>, with job detail pages below
+    it. Each ATS's public JSON feed is served on the same path as the real
+    API (e.g. /v0/postings/<slug> for Lever), so both HTML and API-based
+    scrapers can run against it.
+    """
+
+    def __init__(self, boards_per_ats: int = 4, jobs_per_board: int = 50, seed: int = 7):
+        self.boards = {}
+        rng = random.Random(seed)
+
+        for ats_type in ATS_TYPES:
+            for b in range(boards_per_ats):
+                slug = f"{ats_type}-co-{b}"
+                company = f"{ats_type.title()} Co {b}"
+                self.boards[slug] = {
+                    'ats_type': ats_type,
+                    'company': company,
+                    'jobs': [
+                        synthetic_job(rng, company, j, '')
+                        for j in range(jobs_per_board)
+                    ]
+                }
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_port}"
+
+    def board_url(self, slug: str) -> str:
+        """Listing URL of a stand-in board"""
+        return f"{self.base_url}/{ATS_HOSTS[self.boards[slug]['ats_type']]}/{slug}"
+
+    def job_url(self, slug: str, job: Dict) -> str:
+        """Detail URL of a stand-in job"""
+        return f"{self.board_url(slug)}/{job['id']}"
+
+    def companies(self) -> List[Dict]:
+        """Company rows for every stand-in board"""
+        return [
+            {
+                'name': board['company'],
+                'job_board_url': self.board_url(slug),
+                'ats_type': board['ats_type']
+            }
+            for slug, board in self.boards.items()
+        ]
+
+    def total_jobs(self) -> int:
+        return sum(len(board['jobs']) for board in self.boards.values())
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    # ---------- rendering ----------
+
+    def render_listing(self, slug: str) -> str:
+        """Listing page in the markup style of the board's ATS"""
+        board = self.boards[slug]
+        items = []
+
+        for job in board['jobs']:
+            url = self.job_url(slug, job)
+            if board['ats_type'] == 'lever':
+                items.append(
+                    f'<div class="posting" data-qa-posting-id="{job["id"]}">'
+                    f'<a class="posting-title" href="{url}"><h5>{job["title"]}</h5>'
+                    f'<span class="sort-by-location posting-category">{job["location"]}</span></a></div>'
+                )
+            elif board['ats_type'] == 'greenhouse':
+                items.append(
+                    f'<tr class="job-post"><td><a href="{url}">'
+                    f'<p class="body body--medium">{job["title"]}</p>'
+                    f'<p class="body body__secondary body--metadata">{job["location"]}</p></a></td></tr>'
+                )
+            elif board['ats_type'] == 'breezy':
+                items.append(
+                    f'<li class="position"><a href="{url}"><h2>{job["title"]}</h2>'
+                    f'<ul class="meta"><li class="location"><span>{job["location"]}</span></li></ul></a></li>'
+                )
+            else:
+                items.append(
+                    f'<li data-ui="job"><a href="{url}"><h3 data-ui="job-title">{job["title"]}</h3>'
+                    f'<span data-ui="job-location">{job["location"]}</span></a></li>'
+                )
+
+        return f"<html><head><title>{board['company']} Jobs</title></head><body>{''.join(items)}</body></html>"
+
+    def render_detail(self, slug: str, job: Dict) -> str:
+        """Job detail page"""
+        return (
+            f"<html><head><title>{job['title']}</title></head><body>"
+            f"<h2>{job['title']}</h2><div class='location'>{job['location']}</div>"
+            f"<div class='content'><p>{job['full_description']}</p>"
+            f"<ul>{''.join(f'<li>{skill}</li>' for skill in job['skills'])}</ul></div>"
+            f"</body></html>"
+        )
+
+    def render_feed(self, slug: str) -> Dict:
+        """Public JSON feed in the shape of the board's ATS API"""
+        board = self.boards[slug]
+        jobs = board['jobs']
+
+        if board['ats_type'] == 'lever':
+            return [
+                {
+                    'id': job['id'],
+                    'text': job['title'],
+                    'hostedUrl': self.job_url(slug, job),
+                    'categories': {'location': job['location'], 'team': job['sector'].title()},
+                    'descriptionPlain': job['full_description'],
+                    'description': f"<p>{job['full_description']}</p>",
+                    'createdAt': int(datetime.strptime(job['posted_date'], '%Y-%m-%d').timestamp() * 1000)
+                }
+                for job in jobs
+            ]
+
+        if board['ats_type'] == 'greenhouse':
+            return {'jobs': [
+                {
+                    'id': job['id'],
+                    'title': job['title'],
+                    'absolute_url': self.job_url(slug, job),
+                    'location': {'name': job['location']},
+                    'content': f"&lt;p&gt;{job['full_description']}&lt;/p&gt;",
+                    'departments': [{'name': job['sector'].title()}],
+                    'updated_at': f"{job['posted_date']}T00:00:00-00:00"
+                }
+                for job in jobs
+            ]}
+
+        if board['ats_type'] == 'ashby':
+            return {'jobs': [
+                {
+                    'id': job['id'],
+                    'title': job['title'],
+                    'jobUrl': self.job_url(slug, job),
+                    'location': job['location'],
+                    'department': job['sector'].title(),
+                    'descriptionPlain': job['full_description'],
+                    'descriptionHtml': f"<p>{job['full_description']}</p>",
+                    'publishedAt': f"{job['posted_date']}T00:00:00.000+00:00"
+                }
+                for job in jobs
+            ]}
+
+        if board['ats_type'] == 'workable':
+            return {'results': [
+                {
+                    'shortcode': job['id'],
+                    'title': job['title'],
+                    'location': {'city': job['location']},
+                    'department': [job['sector'].title()],
+                    'published': job['posted_date']
+                }
+                for job in jobs
+            ]}
+
+        return [
+            {
+                'id': job['id'],
+                'name': job['title'],
+                'url': self.job_url(slug, job),
+                'location': {'name': job['location']},
+                'department': job['sector'].title(),
+                'published_date': job['posted_date']
+            }
+            for job in jobs
+        ]
+
+    # Public feed paths, mirroring each ATS's real API layout
+    FEED_ROUTES = [
+        ('lever', ('v0', 'postings', None)),
+        ('greenhouse', ('v1', 'boards', None, 'jobs')),
+        ('ashby', ('posting-api', 'job-board', None)),
+        ('workable', ('api', 'v3', 'accounts', None, 'jobs')),
+        ('breezy', (ATS_HOSTS['breezy'], None, 'json')),
+    ]
+
+    def _route(self, path: str):
+        """Resolve a request path to (content type, body) or None"""
+        parts = [part for part in urlparse(path).path.split('/') if part]
+
+        for ats_type, template in self.FEED_ROUTES:
+            if len(parts) != len(template):
+                continue
+            slug = parts[template.index(None)]
+            fixed = all(want is None or want == got for want, got in zip(template, parts))
+            if fixed and self.boards.get(slug, {}).get('ats_type') == ats_type:
+                return 'application/json', json.dumps(self.render_feed(slug))
+
+        if len(parts) == 2 and parts[1] in self.boards:
+            return 'text/html; charset=utf-8', self.render_listing(parts[1])
+
+        if len(parts) == 3 and parts[1] in self.boards:
+            for job in self.boards[parts[1]]['jobs']:
+                if job['id'] == parts[2]:
+                    return 'text/html; charset=utf-8', self.render_detail(parts[1], job)
+
+        return None
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                routed = server._route(self.path)
+                if not routed:
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                content_type, body = routed
+                payload = body.encode()
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
+
+
+# ==================== MEASUREMENT ====================
+
+class StageTimer:
+    """Accumulates wall time per named stage, safe to use from worker threads"""
+
+    def __init__(self):
+        self.totals = {}
+        self.calls = {}
+        self._lock = threading.Lock()
+
+    def wrap(self, stage: str, func):
+        @wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    self.totals[stage] = self.totals.get(stage, 0.0) + elapsed
+                    self.calls[stage] = self.calls.get(stage, 0) + 1
+        return timed
+
+    def report(self) -> Dict:
+        return {
+            stage: {'seconds': round(total, 4), 'calls': self.calls[stage]}
+            for stage, total in sorted(self.totals.items())
+        }
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far, in MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux but bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def time_call(func, repeat: int) -> Dict:
+    """Run func `repeat` times and summarise its latency in milliseconds"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    return {
+        'median_ms': round(statistics.median(samples), 3),
+        'p95_ms': round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        'min_ms': round(samples[0], 3)
+    }
+
+
+# ==================== BENCHMARKS ====================
+
+def run_scrape_benchmark(workdir: str, boards_per_ats: int, jobs_per_board: int,
+                         max_workers: int, per_host_limit: int, use_ats_api: bool = True) -> Dict:
+    """
+    Scrape every stand-in board into a fresh database
+    
+    Returns:
+        Throughput, per-stage timings and peak memory of the run
+    """
+    from scraper_orchestrator import JobBoardOrchestrator
+
+    server = StandInATSServer(boards_per_ats, jobs_per_board).start()
+
+    try:
+        db = Database(os.path.join(workdir, 'scrape_bench.db'))
+        for company in server.companies():
+            db.add_company(company['name'], company['job_board_url'], ats_type=company['ats_type'])
+
+        orchestrator = JobBoardOrchestrator(
+            db,
+            max_workers=max_workers,
+            per_host_limit=per_host_limit,
+            use_fetch_cache=False,
+            use_ats_api=use_ats_api,
+            # The stand-in serves every ATS feed on its real API path
+            api_base_urls={ats_type: server.base_url for ats_type in ATS_TYPES}
+        )
+
+        timer = StageTimer()
+        orchestrator.fetch_job_board = timer.wrap('fetch', orchestrator.fetch_job_board)
+        orchestrator.process_jobs = timer.wrap('process', orchestrator.process_jobs)
+        orchestrator.apply_compensation = timer.wrap('compensation', orchestrator.apply_compensation)
+        db.get_existing_hashes = timer.wrap('dedup', db.get_existing_hashes)
+        db.insert_jobs_bulk = timer.wrap('insert', db.insert_jobs_bulk)
+
+        companies = db.get_all_companies(active_only=True)
+
+        start = time.perf_counter()
+        summary = orchestrator.scrape_all_boards(companies)
+        elapsed = time.perf_counter() - start
+
+        db.close()
+
+        return {
+            'boards': len(companies),
+            'jobs_served': server.total_jobs(),
+            'jobs_inserted': summary['new_jobs_added'],
+            'seconds': round(elapsed, 3),
+            'jobs_per_second': round(summary['new_jobs_added'] / elapsed, 1) if elapsed else None,
+            'stages': timer.report(),
+            'peak_rss_mb': peak_rss_mb(),
+            'max_workers': max_workers,
+            'per_host_limit': per_host_limit,
+            'use_ats_api': use_ats_api,
+            'http_requests': sum(host['requests'] for host in summary['http_hosts'].values())
+        }
+
+    finally:
+        server.stop()
+
+
+def build_query_database(path: str, rows: int) -> Database:
+    """Create a database holding `rows` synthetic jobs"""
+    # Query cache off: the query stage measures SQL, not cache hits
+    db = Database(path, query_cache_size=0)
+    batch = []
+
+    for job in synthetic_rows(rows):
+        batch.append(job)
+        if len(batch) >= 5000:
+            db.insert_jobs_bulk(batch, chunk_size=5000)
+            batch = []
+
+    if batch:
+        db.insert_jobs_bulk(batch, chunk_size=5000)
+
+    db.conn.execute("ANALYZE")
+    return db
+
+
+def run_query_benchmark(workdir: str, rows: int, repeat: int) -> Dict:
+    """
+    Measure read-query latency on a table of `rows` jobs
+    
+    Returns:
+        Build time and latency summary per query
+    """
+    start = time.perf_counter()
+    db = build_query_database(os.path.join(workdir, f'query_bench_{rows}.db'), rows)
+    build_seconds = time.perf_counter() - start
+
+    queries = {
+        'get_all_jobs_first_page': lambda: db.get_all_jobs(limit=50),
+        'get_all_jobs_deep_offset': lambda: db.get_all_jobs(limit=50, offset=rows // 2),
+        'get_jobs_by_sector': lambda: db.get_jobs_by_sector('engineering', limit=50),
+        'search_jobs_common_term': lambda: db.search_jobs('engineer', limit=50),
+        'search_jobs_rare_term': lambda: db.search_jobs('protocol researcher', limit=50),
+        'search_jobs_with_sector': lambda: db.search_jobs('solidity', sector='engineering', limit=50)
+    }
+
+    results = {name: time_call(query, repeat) for name, query in queries.items()}
+    db.close()
+
+    return {
+        'rows': rows,
+        'build_seconds': round(build_seconds, 2),
+        'queries': results,
+        'peak_rss_mb': peak_rss_mb()
+    }
+
+
+def git_commit() -> str:
+    """Current git commit of the repository, if available"""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=Path(__file__).parent, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return 'unknown'
+
+
+def compare_results(previous: Dict, current: Dict):
+    """Print the latency/throughput change of every metric present in both runs"""
+    print(f"\n📈 Compared with {previous.get('commit', '?')} ({previous.get('timestamp', '?')})")
+
+    old_scrape, new_scrape = previous.get('scrape'), current.get('scrape')
+    if old_scrape and new_scrape and old_scrape.get('jobs_per_second') and new_scrape.get('jobs_per_second'):
+        change = (new_scrape['jobs_per_second'] / old_scrape['jobs_per_second'] - 1) * 100
+        print(f"   scrape throughput: {old_scrape['jobs_per_second']} -> "
+              f"{new_scrape['jobs_per_second']} jobs/s ({change:+.1f}%)")
+
+    old_sizes = {str(run['rows']): run for run in previous.get('queries', [])}
+    for run in current.get('queries', []):
+        old_run = old_sizes.get(str(run['rows']))
+        if not old_run:
+            continue
+        for name, stats in run['queries'].items():
+            old_stats = old_run['queries'].get(name)
+            if not old_stats or not old_stats['median_ms']:
+                continue
+            change = (stats['median_ms'] / old_stats['median_ms'] - 1) * 100
+            print(f"   {run['rows']:>8} rows {name}: {old_stats['median_ms']} -> "
+                  f"{stats['median_ms']} ms ({change:+.1f}%)")
+
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Offline benchmark for the job board pipeline")
+    parser.add_argument('--boards', type=int, default=4,
+                        help="Stand-in boards per ATS type (default: 4)")
+    parser.add_argument('--jobs-per-board', type=int, default=100,
+                        help="Jobs on each stand-in board (default: 100)")
+    parser.add_argument('--workers', type=int, default=8,
+                        help="Orchestrator max_workers (default: 8)")
+    parser.add_argument('--per-host-limit', type=int, default=2,
+                        help="Orchestrator per_host_limit (default: 2)")
+    parser.add_argument('--no-ats-api', action='store_true',
+                        help="Scrape stand-in boards with the HTML scrapers instead of the JSON feeds")
+    parser.add_argument('--sizes', default='10000,100000,1000000',
+                        help="Comma-separated table sizes for query latency (default: 10k,100k,1M)")
+    parser.add_argument('--repeat', type=int, default=20,
+                        help="Repetitions per query (default: 20)")
+    parser.add_argument('--skip-scrape', action='store_true', help="Skip the scrape benchmark")
+    parser.add_argument('--skip-queries', action='store_true', help="Skip the query benchmarks")
+    parser.add_argument('--output', default='benchmark_results.json',
+                        help="Where to write the JSON results (default: benchmark_results.json)")
+    parser.add_argument('--compare', help="Previous results file to compare against")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    results = {
+        'commit': git_commit(),
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'scrape': None,
+        'queries': []
+    }
+
+    with tempfile.TemporaryDirectory(prefix='jobboard-bench-') as workdir:
+        if not args.skip_scrape:
+            print(f"🏁 Scrape benchmark: {args.boards * len(ATS_TYPES)} boards x {args.jobs_per_board} jobs")
+            results['scrape'] = run_scrape_benchmark(
+                workdir, args.boards, args.jobs_per_board, args.workers, args.per_host_limit,
+                use_ats_api=not args.no_ats_api
+            )
+            print(f"   {results['scrape']['jobs_per_second']} jobs/s "
+                  f"in {results['scrape']['seconds']}s, {results['scrape']['http_requests']} HTTP requests")
+
+        if not args.skip_queries:
+            for size in [int(size) for size in args.sizes.split(',') if size]:
+                print(f"🏁 Query benchmark: {size:,} rows")
+                run = run_query_benchmark(workdir, size, args.repeat)
+                results['queries'].append(run)
+                for name, stats in run['queries'].items():
+                    print(f"   {name}: {stats['median_ms']} ms (p95 {stats['p95_ms']} ms)")
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\n💾 Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare_results(json.load(f), results)
+
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Compensation Parsing for Web3 Job Board
+Extracts structured salary ranges from job titles and descriptions
+"""
+
+import re
+from typing import Dict, Optional
+
+
+CURRENCY_SYMBOLS = {
+    '$': 'USD',
+    '€': 'EUR',
+    '£': 'GBP'
+}
+
+DISPLAY_SYMBOLS = {code: symbol for symbol, code in CURRENCY_SYMBOLS.items()}
+
+_AMOUNT = r'(\d{1,3}(?:,\d{3})*(?:\.\d+)?)'
+_SEPARATOR = r'\s*(?:-|–|—|to)\s*'
+
+# Compiled once at import; tried in order, first match wins
+COMPENSATION_PATTERNS = [
+    # $120,000 - $180,000 / $120k - $180k / €90k to 110k
+    re.compile(
+        r'([$€£])\s*' + _AMOUNT + r'\s*([kK])?' + _SEPARATOR + r'[$€£]?\s*' + _AMOUNT + r'\s*([kK])?',
+        re.IGNORECASE
+    ),
+    # USD 120,000 - 180,000
+    re.compile(
+        r'\b(USD|EUR|GBP|CAD|AUD|CHF|SGD)\s*' + _AMOUNT + r'\s*([kK])?' + _SEPARATOR + _AMOUNT + r'\s*([kK])?',
+        re.IGNORECASE
+    ),
+    # 120k - 180k
+    re.compile(
+        r'()\b(\d{1,3})\s*([kK])' + _SEPARATOR + r'(\d{1,3})\s*([kK])\b',
+        re.IGNORECASE
+    ),
+]
+
+PERIOD_PATTERNS = [
+    ('hour', re.compile(r'^\s*(?:/\s*h(?:ou)?r\b|per\s+hour|an\s+hour|hourly)', re.IGNORECASE)),
+    ('month', re.compile(r'^\s*(?:/\s*mo(?:nth)?\b|per\s+month|a\s+month|monthly)', re.IGNORECASE)),
+]
+
+
+def parse_compensation(text: str) -> Optional[Dict]:
+    """
+    Parse the first salary range found in a piece of text
+    
+    Args:
+        text: Free text such as a job title plus description
+    
+    Returns:
+        Dictionary with salary_min, salary_max (integers in salary_currency
+        units per salary_period), salary_currency and salary_period
+        ('year', 'month' or 'hour'), or None if no range was found
+    """
+    if not text:
+        return None
+
+    for pattern in COMPENSATION_PATTERNS:
+        match = pattern.search(text)
+        if not match:
+            continue
+
+        currency_token, low, low_k, high, high_k = match.groups()
+        currency = CURRENCY_SYMBOLS.get(currency_token) or (currency_token or 'USD').upper()
+
+        period = 'year'
+        following = text[match.end():match.end() + 20]
+        for name, period_pattern in PERIOD_PATTERNS:
+            if period_pattern.search(following):
+                period = name
+                break
+
+        low_value = float(low.replace(',', ''))
+        high_value = float(high.replace(',', ''))
+
+        # "$120 - $180k" and "$120k - $180k" both mean thousands
+        thousands = bool(low_k or high_k)
+        if thousands or (period == 'year' and high_value < 1000):
+            low_value *= 1000
+            high_value *= 1000
+
+        if high_value < low_value:
+            low_value, high_value = high_value, low_value
+
+        return {
+            'salary_min': int(low_value),
+            'salary_max': int(high_value),
+            'salary_currency': currency,
+            'salary_period': period
+        }
+
+    return None
+
+
+def format_compensation(compensation: Dict) -> str:
+    """
+    Format a parsed salary range for display, e.g. "$120k - $180k"
+    
+    Args:
+        compensation: Dictionary returned by parse_compensation
+    
+    Returns:
+        Display string
+    """
+    currency = compensation['salary_currency']
+    symbol = DISPLAY_SYMBOLS.get(currency, f"{currency} ")
+
+    def amount(value: int) -> str:
+        if value >= 1000:
+            return f"{symbol}{value // 1000}k"
+        return f"{symbol}{value}"
+
+    display = f"{amount(compensation['salary_min'])} - {amount(compensation['salary_max'])}"
+
+    if compensation['salary_period'] == 'hour':
+        display += "/hr"
+    elif compensation['salary_period'] == 'month':
+        display += "/mo"
+
+    return display
@@ -6,10 +6,16 @@ Run this script daily via cron to automatically scrape job boards
 Setup cron job (runs daily at 3 AM):
 0 3 * * * /usr/bin/python3 /path/to/daily_scraper.py >> /path/to/logs/scraper.log 2>&1
 
+Or poll only the boards that are due, hourly, within a 50 minute budget
+(busy boards come up every hour, quiet ones back off to once a week):
+0 * * * * /usr/bin/python3 /path/to/daily_scraper.py --due --budget-minutes 50 >> /path/to/logs/scraper.log 2>&1
+
 Or use the included systemd service/timer for more robust scheduling
 """
 
 import sys
+import time
+import argparse
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -19,6 +25,9 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from database import Database
 from scraper_orchestrator import JobBoardOrchestrator
+from scrape_scheduler import ScrapeScheduler
+from scrape_workers import ScrapeWorkerPool
+from snapshot_exporter import export_snapshot
 
 
 # Setup logging
@@ -34,30 +43,75 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def run_daily_scrape():
-    """Execute the daily scraping routine"""
+def run_daily_scrape(max_workers: int = 1, per_host_limit: int = 2, production: bool = False,
+                     export_dir: str = None, due_only: bool = False, budget_minutes: float = None,
+                     processes: int = 1):
+    """
+    Execute the daily scraping routine
+    
+    Args:
+        max_workers: Number of boards to scrape in parallel
+        per_host_limit: Maximum parallel scrapes against one ATS host
+        production: Open the database in WAL mode so readers aren't blocked
+        export_dir: If set, export a static snapshot here after the scrape
+        due_only: Only scrape boards the adaptive scheduler says are due
+        budget_minutes: Stop starting new boards after this many minutes
+        processes: Number of worker processes claiming boards from the
+            lease table (more than 1 implies production/WAL mode)
+    """
     logger.info("=" * 60)
     logger.info("Starting Daily Web3 Job Board Scrape")
     logger.info("=" * 60)
     
     try:
         # Initialize database
-        db = Database("web3_jobs.db")
+        db = Database("web3_jobs.db", production=production or processes > 1)
         logger.info("Database connection established")
         
-        # Get active companies
-        companies = db.get_all_companies(active_only=True)
-        logger.info(f"Found {len(companies)} active companies to scrape")
+        scheduler = ScrapeScheduler(db)
+        deadline = time.monotonic() + budget_minutes * 60 if budget_minutes else None
         
-        if not companies:
-            logger.warning("No active companies found! Please add companies to the database.")
-            return
+        # Get active companies
+        if due_only:
+            if budget_minutes:
+                companies = scheduler.plan(budget_minutes * 60, workers=max_workers)
+            else:
+                companies = scheduler.due_companies()
+            logger.info(f"Found {len(companies)} due companies to scrape")
+            
+            if not companies:
+                logger.info("No boards are due yet")
+                db.close()
+                return
+        else:
+            companies = db.get_all_companies(active_only=True)
+            logger.info(f"Found {len(companies)} active companies to scrape")
+            
+            if not companies:
+                logger.warning("No active companies found! Please add companies to the database.")
+                return
         
         # Create orchestrator
-        orchestrator = JobBoardOrchestrator(db)
+        if processes > 1:
+            orchestrator = ScrapeWorkerPool(db, processes=processes)
+        else:
+            orchestrator = JobBoardOrchestrator(
+                db,
+                max_workers=max_workers,
+                per_host_limit=per_host_limit
+            )
         
         # Run the scrape
-        summary = orchestrator.scrape_all_boards(companies)
+        summary = orchestrator.scrape_all_boards(companies, deadline=deadline)
+        
+        # Record the run and its per-company telemetry
+        db.log_scrape_run(summary)
+        
+        # Move each scraped board's next due time based on what changed
+        scheduler.record_run(summary)
+        
+        # Keep only live postings in the hot jobs table
+        archived = db.archive_jobs()
         
         # Log results
         logger.info("Scraping completed successfully")
@@ -65,9 +119,21 @@ def run_daily_scrape():
         logger.info(f"  - Total jobs scraped: {summary['total_scraped']}")
         logger.info(f"  - New jobs added: {summary['new_jobs_added']}")
         logger.info(f"  - Duplicates skipped: {summary['duplicates_skipped']}")
+        logger.info(f"  - Near-duplicates skipped: {summary['near_duplicates_skipped']}")
+        logger.info(f"  - Jobs closed: {summary['jobs_closed']}")
+        logger.info(f"  - Detail pages skipped: {summary['details_skipped']}")
+        logger.info(f"  - Jobs archived: {archived}")
         logger.info(f"  - Companies processed: {summary['boards_processed']}")
+        logger.info(f"  - Unchanged boards skipped: {summary['boards_unchanged']}")
+        logger.info(f"  - Boards deferred (time budget): {summary['boards_deferred']}")
         
         db.close()
+        
+        if export_dir:
+            manifest = export_snapshot("web3_jobs.db", export_dir)
+            logger.info(f"Exported static snapshot to {export_dir} "
+                        f"({manifest['jobs']['total']} jobs)")
+        
         logger.info("Daily scrape completed successfully!")
         
         return summary
@@ -162,10 +228,131 @@ def setup_sample_boards():
     logger.info("Sample companies setup complete!")
 
 
+def rebuild_search_index():
+    """Build the full-text search index for an existing database"""
+    logger.info("Rebuilding full-text search index...")
+    
+    db = Database("web3_jobs.db")
+    indexed = db.rebuild_search_index()
+    db.close()
+    
+    logger.info(f"Indexed {indexed} jobs")
+
+
+def backfill_salaries():
+    """Parse structured salary columns for jobs scraped before they existed"""
+    logger.info("Backfilling salary columns...")
+    
+    db = Database("web3_jobs.db")
+    updated = db.backfill_salary_columns()
+    db.close()
+    
+    logger.info(f"Parsed salaries for {updated} jobs")
+
+
+def compact_descriptions():
+    """Move inline job descriptions into the compressed job_texts table"""
+    logger.info("Compacting job descriptions...")
+    
+    db = Database("web3_jobs.db")
+    moved = db.compact_job_texts()
+    db.close()
+    
+    logger.info(f"Moved descriptions for {moved} jobs")
+
+
+def dedupe_near_duplicates(dry_run: bool = False):
+    """Fingerprint existing jobs and merge reposted near-duplicates"""
+    logger.info("Finding near-duplicate jobs...")
+    
+    db = Database("web3_jobs.db")
+    result = db.dedupe_near_duplicates(dry_run=dry_run)
+    db.close()
+    
+    logger.info(f"Fingerprinted {result['fingerprinted']} jobs")
+    for duplicate_id, kept_id in result['duplicates']:
+        logger.info(f"  - Job {duplicate_id} duplicates job {kept_id}")
+    
+    action = "Would merge" if dry_run else "Merged"
+    logger.info(f"{action} {len(result['duplicates'])} near-duplicate jobs")
+
+
+def report_slowest_boards(runs: int, limit: int = 10):
+    """Print the boards with the highest average scrape time over recent runs"""
+    db = Database("web3_jobs.db")
+    boards = db.get_slowest_boards(runs=runs, limit=limit)
+    db.close()
+    
+    logger.info(f"Slowest boards over the last {runs} runs:")
+    for board in boards:
+        logger.info(
+            f"  - {board['company_name']} ({board['ats_type']}): "
+            f"avg {board['avg_total_ms']:.0f} ms, max {board['max_total_ms']:.0f} ms "
+            f"[fetch {board['avg_fetch_ms']:.0f} / parse {board['avg_parse_ms']:.0f} / "
+            f"dedup {board['avg_dedup_ms']:.0f} / comp {board['avg_compensation_ms']:.0f} / "
+            f"insert {board['avg_insert_ms']:.0f}] errors: {board['errors']}"
+        )
+
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Web3 job board daily scraper")
+    parser.add_argument('--setup', action='store_true',
+                        help="Add the sample companies to the database and exit")
+    parser.add_argument('--rebuild-search-index', action='store_true',
+                        help="Rebuild the full-text search index from the jobs table and exit")
+    parser.add_argument('--backfill-salaries', action='store_true',
+                        help="Parse structured salary columns for existing jobs and exit")
+    parser.add_argument('--compact-descriptions', action='store_true',
+                        help="Move existing job descriptions into compressed storage and exit")
+    parser.add_argument('--dedupe-near-duplicates', action='store_true',
+                        help="Merge reposted near-duplicate jobs already in the database and exit")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="With --dedupe-near-duplicates, only report what would be merged")
+    parser.add_argument('--slowest-boards', type=int, metavar='RUNS',
+                        help="Report the slowest boards over the last RUNS runs and exit")
+    parser.add_argument('--export', metavar='DIR',
+                        help="Export a static JSON snapshot to DIR after scraping (e.g. public/data)")
+    parser.add_argument('--due', action='store_true',
+                        help="Only scrape boards that are due under the adaptive schedule")
+    parser.add_argument('--budget-minutes', type=float,
+                        help="Stop starting new boards after this many minutes (with --due, "
+                             "also picks only the due boards expected to fit)")
+    parser.add_argument('--production', action='store_true',
+                        help="Use WAL mode so API readers aren't blocked while scraping")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Number of job boards to scrape in parallel (default: 1)")
+    parser.add_argument('--processes', type=int, default=1,
+                        help="Number of worker processes sharing the scrape via leases (default: 1)")
+    parser.add_argument('--per-host-limit', type=int, default=2,
+                        help="Maximum parallel scrapes per ATS host (default: 2)")
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
+    args = parse_args()
+    
     # Check if we should setup sample boards
-    if len(sys.argv) > 1 and sys.argv[1] == "--setup":
+    if args.setup:
         setup_sample_boards()
+    elif args.rebuild_search_index:
+        rebuild_search_index()
+    elif args.backfill_salaries:
+        backfill_salaries()
+    elif args.compact_descriptions:
+        compact_descriptions()
+    elif args.dedupe_near_duplicates:
+        dedupe_near_duplicates(dry_run=args.dry_run)
+    elif args.slowest_boards:
+        report_slowest_boards(args.slowest_boards)
     else:
         # Run the daily scrape
-        run_daily_scrape()
+        run_daily_scrape(
+            max_workers=args.workers,
+            per_host_limit=args.per_host_limit,
+            production=args.production,
+            export_dir=args.export,
+            due_only=args.due,
+            budget_minutes=args.budget_minutes,
+            processes=args.processes
+        )
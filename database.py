@@ -4,33 +4,447 @@ Handles all database operations for jobs, job boards, and scraper logs
 """
 
 import sqlite3
-from typing import List, Dict, Optional
-from datetime import datetime
+import re
+import zlib
+import base64
+import queue
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from itertools import islice
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import List, Dict, Iterable, Iterator, Optional, Set
+from datetime import datetime, timedelta
 import json
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from compensation import parse_compensation, format_compensation
+from fingerprint import (
+    MAX_DISTANCE, NearDuplicateIndex, bucket_keys, job_fingerprint,
+    posting_key, to_signed, to_unsigned
+)
+
+
+def _serialized(method):
+    """Run a method while holding the database's writer lock"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._write_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _invalidates(method):
+    """Bump the data generation after a method that changes cached data"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._generation += 1
+    return wrapper
+
+
+def _cached(method):
+    """Serve a read method from the query cache while the data generation is unchanged"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._query_cache is None:
+            return method(self, *args, **kwargs)
+        
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        # Read the generation before querying, so a result that raced a
+        # write is filed under the old generation and never served again
+        generation = self._current_generation()
+        
+        hit, result = self._query_cache.get(key, generation)
+        if not hit:
+            result = method(self, *args, **kwargs)
+            self._query_cache.put(key, generation, result)
+        
+        return _copy_result(result)
+    return wrapper
+
+
+def _copy_result(result):
+    """Copy a cached result's containers so callers can't mutate the cache"""
+    if isinstance(result, list):
+        return [dict(item) if isinstance(item, dict) else item for item in result]
+    if isinstance(result, dict):
+        return {key: _copy_result(value) for key, value in result.items()}
+    return result
+
+
+def _compress_texts(texts: List[Optional[str]], codec: str) -> tuple:
+    """
+    Compress long text fields for the job_texts table
+    
+    Falls back to storing the UTF-8 bytes as-is ('raw') when compression
+    wouldn't make them smaller, which is common for short texts.
+    
+    Returns:
+        (codec, list of blobs aligned with texts)
+    """
+    raw = [text.encode('utf-8') if text else None for text in texts]
+    
+    if codec == 'zstd':
+        compressor = zstandard.ZstdCompressor(level=10)
+        compressed = [compressor.compress(blob) if blob else None for blob in raw]
+    else:
+        compressed = [zlib.compress(blob, 9) if blob else None for blob in raw]
+    
+    if sum(len(blob) for blob in compressed if blob) >= sum(len(blob) for blob in raw if blob):
+        return 'raw', raw
+    return codec, compressed
+
+
+def _decompress_text(blob: Optional[bytes], codec: Optional[str]) -> Optional[str]:
+    """Decompress one job_texts field"""
+    if blob is None:
+        return None
+    if codec == 'zlib':
+        blob = zlib.decompress(blob)
+    elif codec == 'zstd':
+        if zstandard is None:
+            raise RuntimeError("job text is zstd-compressed but the zstandard package is not installed")
+        blob = zstandard.ZstdDecompressor().decompress(blob)
+    return bytes(blob).decode('utf-8')
+
+
+# Compact job row yielded by the streaming readers (Database.iter_jobs/iter_search),
+# in the column order of Database.SUMMARY_COLUMNS plus the company's URLs
+JobRow = namedtuple('JobRow', [
+    'id', 'job_hash', 'title', 'company_id', 'company_name', 'location',
+    'salary', 'sector', 'description', 'job_url', 'ats_type',
+    'posted_date', 'scraped_at', 'created_at', 'updated_at',
+    'salary_min', 'salary_max', 'salary_currency', 'salary_period',
+    'skills', 'logo_url', 'website_url'
+])
+
+_SKILLS_INDEX = JobRow._fields.index('skills')
+
+
+def job_rows_to_json(rows: Iterable[JobRow], batch_size: int = 500) -> Iterator[bytes]:
+    """
+    Serialize job rows as one JSON array of objects, yielded in byte chunks
+    
+    Each batch is encoded in a single json call, and only one batch is
+    held in memory at a time.
+    
+    Args:
+        rows: Rows from iter_jobs/iter_search
+        batch_size: Number of rows encoded per chunk
+        
+    Yields:
+        UTF-8 chunks that concatenate to a JSON array
+    """
+    encoder = json.JSONEncoder(separators=(',', ':'), default=str)
+    fields = JobRow._fields
+    rows = iter(rows)
+    
+    yield b'['
+    separator = b''
+    while True:
+        batch = [dict(zip(fields, row)) for row in islice(rows, batch_size)]
+        if not batch:
+            break
+        yield separator + encoder.encode(batch)[1:-1].encode('utf-8')
+        separator = b','
+    yield b']'
+
+
+class QueryCache:
+    """
+    LRU cache of read-query results for one data generation
+    
+    Size is bounded both by number of entries and by the total number of
+    rows held, so a few huge results can't push memory up unbounded.
+    """
+    
+    def __init__(self, max_entries: int = 256, max_rows: int = 50000):
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self.generation = None
+        self.rows = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _weight(result) -> int:
+        if isinstance(result, list):
+            return max(1, len(result))
+        if isinstance(result, dict) and isinstance(result.get('jobs'), list):
+            return max(1, len(result['jobs']))
+        return 1
+    
+    def get(self, key, generation):
+        """Look up a result; returns (hit, result)"""
+        with self._lock:
+            if generation != self.generation:
+                self._entries.clear()
+                self.rows = 0
+                self.generation = generation
+            
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[0]
+    
+    def put(self, key, generation, result):
+        """Store a result computed at the given generation"""
+        weight = self._weight(result)
+        
+        with self._lock:
+            if generation != self.generation or weight > self.max_rows:
+                return
+            
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.rows -= previous[1]
+            
+            self._entries[key] = (result, weight)
+            self.rows += weight
+            
+            while len(self._entries) > self.max_entries or self.rows > self.max_rows:
+                _, (_, evicted_weight) = self._entries.popitem(last=False)
+                self.rows -= evicted_weight
+                self.evictions += 1
+    
+    def clear(self):
+        """Drop every cached result"""
+        with self._lock:
+            self._entries.clear()
+            self.rows = 0
+    
+    def stats(self) -> Dict:
+        """Get hit/miss statistics"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'rows': self.rows,
+                'max_entries': self.max_entries,
+                'max_rows': self.max_rows
+            }
+
 
 class Database:
     """Database manager for Web3 job board"""
     
-    def __init__(self, db_path: str = "web3_jobs.db"):
+    def __init__(self, db_path: str = "web3_jobs.db", production: bool = False,
+                 read_pool_size: int = 4, busy_timeout_ms: int = 5000,
+                 mmap_size: int = 256 * 1024 * 1024, query_cache_size: int = 256,
+                 query_cache_max_rows: int = 50000, text_codec: str = 'zlib'):
         """
         Initialize database connection
         
         Args:
             db_path: Path to SQLite database file
+            production: Use WAL mode with a dedicated writer connection and a
+                pool of read-only connections, so the object can be shared
+                across threads and readers never block on the scraper
+            read_pool_size: Maximum number of pooled reader connections
+                (production mode only)
+            busy_timeout_ms: How long to wait on a locked database before failing
+            mmap_size: Bytes of the database file to memory-map (production mode only)
+            query_cache_size: Maximum number of cached read-query results
+                (0 disables the cache)
+            query_cache_max_rows: Maximum total rows held by the query cache
+            text_codec: Compression for full descriptions and requirements,
+                'zlib' or 'zstd' (needs the zstandard package)
         """
         self.db_path = db_path
+        self.production = production
+        self.read_pool_size = max(1, read_pool_size)
+        self.busy_timeout_ms = busy_timeout_ms
+        self.mmap_size = mmap_size
+        self.text_codec = 'zstd' if text_codec == 'zstd' and zstandard is not None else 'zlib'
         self.conn = None
         self.cursor = None
+        self.fts_enabled = False
+        self._write_lock = threading.RLock()
+        self._readers = None
+        self._readers_opened = 0
+        self._generation = 0
+        self._watcher = None
+        self._watch_lock = threading.Lock()
+        self._query_cache = QueryCache(query_cache_size, query_cache_max_rows) if query_cache_size > 0 else None
         self._connect()
         self._create_tables()
+        
+        if self.production:
+            self._readers = queue.LifoQueue()
     
     def _connect(self):
         """Establish database connection"""
-        self.conn = sqlite3.connect(self.db_path)
+        self.conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout_ms / 1000,
+            check_same_thread=not self.production
+        )
         self.conn.row_factory = sqlite3.Row
+        self.conn.create_function('decompress_text', 2, _decompress_text, deterministic=True)
+        
+        if self.production:
+            # WAL lets readers keep reading while the writer commits
+            self.conn.execute("PRAGMA journal_mode = WAL")
+            self.conn.execute("PRAGMA synchronous = NORMAL")
+            self.conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+            self.conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        
         self.cursor = self.conn.cursor()
     
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a read-only connection for the reader pool"""
+        uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(
+            uri,
+            uri=True,
+            timeout=self.busy_timeout_ms / 1000,
+            check_same_thread=False
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+        conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        return conn
+    
+    def _acquire_reader(self) -> sqlite3.Connection:
+        """Take a reader from the pool, opening one if the pool isn't full yet"""
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._write_lock:
+            if self._readers_opened < self.read_pool_size:
+                self._readers_opened += 1
+                return self._open_reader()
+        
+        return self._readers.get()
+    
+    @contextmanager
+    def _read_cursor(self):
+        """
+        Yield a fresh cursor for a read query
+        
+        In production mode the cursor comes from a pooled read-only
+        connection; otherwise it shares the writer connection.
+        """
+        if self._readers is None:
+            with self._write_lock:
+                cursor = self.conn.cursor()
+                try:
+                    yield cursor
+                finally:
+                    cursor.close()
+            return
+        
+        conn = self._acquire_reader()
+        cursor = conn.cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+            self._readers.put(conn)
+    
+    def _current_generation(self) -> tuple:
+        """
+        Get the data generation used to validate cached query results
+        
+        Combines the counter bumped by this object's writers with SQLite's
+        data_version, which changes when another connection (e.g. a scraper
+        in a different process) commits.
+        """
+        if self._readers is None:
+            with self._write_lock:
+                data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        else:
+            # A dedicated connection, so the check never waits on the writer lock
+            with self._watch_lock:
+                if self._watcher is None:
+                    self._watcher = self._open_reader()
+                data_version = self._watcher.execute("PRAGMA data_version").fetchone()[0]
+        
+        return (self._generation, data_version)
+    
+    def get_data_generation(self) -> tuple:
+        """
+        Get a value that changes whenever any connection commits to the database
+        
+        Comparable within this object's lifetime only (see _current_generation).
+        """
+        return self._current_generation()
+    
+    def cache_stats(self) -> Dict:
+        """Get query cache hit/miss statistics"""
+        if self._query_cache is None:
+            return {'enabled': False}
+        
+        stats = self._query_cache.stats()
+        stats['enabled'] = True
+        stats['generation'] = self._generation
+        return stats
+    
+    def clear_query_cache(self):
+        """Drop every cached query result"""
+        if self._query_cache is not None:
+            self._query_cache.clear()
+    
+    def _fetchall(self, sql: str, params=()) -> List[sqlite3.Row]:
+        """Run a read query and return all rows"""
+        with self._read_cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+    
+    def _fetchone(self, sql: str, params=()) -> Optional[sqlite3.Row]:
+        """Run a read query and return the first row"""
+        with self._read_cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchone()
+    
+    def _iter_job_rows(self, sql: str, params=(), chunk_size: int = 1000) -> Iterator[JobRow]:
+        """
+        Run a job list query and yield JobRows, fetching chunk_size rows at a time
+        
+        Rows are read as plain tuples, skipping sqlite3.Row and dict
+        construction. The read connection (the writer connection outside
+        production mode) is held until the iterator is exhausted or closed.
+        """
+        separator = self.SKILL_SEPARATOR
+        
+        with self._read_cursor() as cursor:
+            cursor.row_factory = None
+            cursor.execute(sql, params)
+            
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                for row in rows:
+                    skills = row[_SKILLS_INDEX]
+                    yield JobRow(
+                        *row[:_SKILLS_INDEX],
+                        tuple(skills.split(separator)) if skills else (),
+                        *row[_SKILLS_INDEX + 1:]
+                    )
+    
     def _create_tables(self):
         """Create database tables if they don't exist"""
         
@@ -90,6 +504,153 @@ class Database:
             )
         """)
         
+        # Per-board conditional fetch cache (ETag / Last-Modified / body digest)
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS board_fetch_cache (
+                company_id INTEGER PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                content_digest TEXT,
+                fetched_at TEXT NOT NULL,
+                FOREIGN KEY (company_id) REFERENCES companies(id)
+            )
+        """)
+        
+        # Adaptive polling schedule per company (see scrape_scheduler.py)
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS company_schedule (
+                company_id INTEGER PRIMARY KEY,
+                interval_minutes REAL NOT NULL,
+                next_due_at TEXT NOT NULL,
+                change_rate REAL DEFAULT 0,
+                failures INTEGER DEFAULT 0,
+                last_scraped_at TEXT,
+                last_changed_at TEXT,
+                FOREIGN KEY (company_id) REFERENCES companies(id)
+            )
+        """)
+        
+        # Boards handed out to scraper processes during a multi-process run
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS scrape_leases (
+                run_token TEXT NOT NULL,
+                company_id INTEGER NOT NULL,
+                position INTEGER NOT NULL,
+                status TEXT NOT NULL DEFAULT 'queued',
+                worker_id TEXT,
+                leased_until REAL,
+                attempts INTEGER DEFAULT 0,
+                result TEXT,
+                PRIMARY KEY (run_token, company_id)
+            )
+        """)
+        
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_scrape_leases_claim
+            ON scrape_leases(run_token, status, position)
+        """)
+        
+        # Per-company, per-stage telemetry for each scrape run
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS scrape_company_stats (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_id INTEGER NOT NULL,
+                company_id INTEGER,
+                company_name TEXT,
+                ats_type TEXT,
+                status TEXT,
+                fetch_ms REAL DEFAULT 0,
+                parse_ms REAL DEFAULT 0,
+                dedup_ms REAL DEFAULT 0,
+                compensation_ms REAL DEFAULT 0,
+                insert_ms REAL DEFAULT 0,
+                total_ms REAL DEFAULT 0,
+                http_bytes INTEGER DEFAULT 0,
+                jobs_found INTEGER DEFAULT 0,
+                jobs_new INTEGER DEFAULT 0,
+                jobs_duplicate INTEGER DEFAULT 0,
+                error TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (run_id) REFERENCES scrape_logs(id),
+                FOREIGN KEY (company_id) REFERENCES companies(id)
+            )
+        """)
+        
+        # Long job text, compressed, kept out of the jobs table so list
+        # queries read small rows and more of jobs stays in the page cache
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS job_texts (
+                job_id INTEGER PRIMARY KEY,
+                codec TEXT NOT NULL,
+                full_description BLOB,
+                requirements BLOB,
+                FOREIGN KEY (job_id) REFERENCES jobs(id)
+            )
+        """)
+        
+        self.cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS job_texts_delete AFTER DELETE ON jobs BEGIN
+                DELETE FROM job_texts WHERE job_id = old.id;
+            END
+        """)
+        
+        # SimHash fingerprints for near-duplicate detection; each job sits in
+        # one bucket per band (see fingerprint.bucket_keys)
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS job_fingerprints (
+                job_id INTEGER PRIMARY KEY,
+                fingerprint INTEGER NOT NULL,
+                FOREIGN KEY (job_id) REFERENCES jobs(id)
+            )
+        """)
+        
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS job_fingerprint_buckets (
+                bucket INTEGER NOT NULL,
+                job_id INTEGER NOT NULL,
+                PRIMARY KEY (bucket, job_id)
+            ) WITHOUT ROWID
+        """)
+        
+        self.cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS job_fingerprints_delete AFTER DELETE ON jobs BEGIN
+                DELETE FROM job_fingerprint_buckets WHERE job_id = old.id;
+                DELETE FROM job_fingerprints WHERE job_id = old.id;
+            END
+        """)
+        
+        # Closed and old postings, moved out of jobs by archive_jobs() so the
+        # hot table and its indexes only hold live postings
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS jobs_archive (
+                id INTEGER PRIMARY KEY,
+                job_hash TEXT UNIQUE NOT NULL,
+                title TEXT NOT NULL,
+                company_id INTEGER,
+                company_name TEXT NOT NULL,
+                location TEXT,
+                salary TEXT,
+                sector TEXT,
+                description TEXT,
+                full_description TEXT,
+                requirements TEXT,
+                skills TEXT,
+                job_url TEXT NOT NULL,
+                ats_type TEXT,
+                posted_date TEXT,
+                scraped_at TEXT NOT NULL,
+                created_at TIMESTAMP,
+                updated_at TIMESTAMP,
+                salary_min INTEGER,
+                salary_max INTEGER,
+                salary_currency TEXT,
+                salary_period TEXT,
+                status TEXT,
+                closed_at TEXT,
+                archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
         # User saved jobs table (for future use)
         self.cursor.execute("""
             CREATE TABLE IF NOT EXISTS saved_jobs (
@@ -125,6 +686,17 @@ class Database:
             CREATE INDEX IF NOT EXISTS idx_jobs_posted_date ON jobs(posted_date DESC)
         """)
         
+        # Composite indexes matching the feed ordering, used for keyset pagination
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_jobs_feed
+            ON jobs(posted_date DESC, scraped_at DESC, id DESC)
+        """)
+        
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_jobs_sector_feed
+            ON jobs(sector, posted_date DESC, scraped_at DESC, id DESC)
+        """)
+        
         self.cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_jobs_company_id ON jobs(company_id)
         """)
@@ -137,165 +709,1452 @@ class Database:
             CREATE INDEX IF NOT EXISTS idx_companies_active ON companies(active)
         """)
         
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_company_stats_run ON scrape_company_stats(run_id)
+        """)
+        
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_fingerprint_buckets_job ON job_fingerprint_buckets(job_id)
+        """)
+        
+        # Columns added after the original schema
+        self._ensure_column('scrape_logs', 'boards_unchanged', 'INTEGER DEFAULT 0')
+        self._ensure_column('scrape_logs', 'near_duplicates_skipped', 'INTEGER DEFAULT 0')
+        self._ensure_column('scrape_company_stats', 'jobs_near_duplicate', 'INTEGER DEFAULT 0')
+        self._ensure_column('scrape_company_stats', 'details_skipped', 'INTEGER DEFAULT 0')
+        self._ensure_column('scrape_logs', 'details_skipped', 'INTEGER DEFAULT 0')
+        self._ensure_column('jobs', 'salary_min', 'INTEGER')
+        self._ensure_column('jobs', 'salary_max', 'INTEGER')
+        self._ensure_column('jobs', 'salary_currency', 'TEXT')
+        self._ensure_column('jobs', 'salary_period', 'TEXT')
+        self._ensure_column('jobs', 'status', "TEXT NOT NULL DEFAULT 'open'")
+        self._ensure_column('jobs', 'closed_at', 'TEXT')
+        self._ensure_column('scrape_logs', 'jobs_closed', 'INTEGER DEFAULT 0')
+        # job_hash of a similar posting listed on the same board at the same time
+        self._ensure_column('jobs', 'near_duplicate_of', 'TEXT')
+        
+        # Rows stored before posted_date was defaulted; keyset pagination
+        # compares on it and would never reach them
+        self.cursor.execute("""
+            UPDATE jobs SET posted_date = substr(scraped_at, 1, 10)
+            WHERE posted_date IS NULL
+        """)
+        
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_jobs_salary ON jobs(salary_period, salary_min)
+        """)
+        
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_jobs_company_status ON jobs(company_id, status)
+        """)
+        
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_jobs_archive_company ON jobs_archive(company_id)
+        """)
+        
         self.conn.commit()
         
+        self._create_search_index()
+        self._create_facet_counts()
+        self._create_job_skills()
+        
         # Initialize superadmin if not exists
         self._init_superadmin()
     
-    def _init_superadmin(self):
-        """Initialize superadmin account if it doesn't exist"""
-        import hashlib
+    def _ensure_column(self, table: str, column: str, definition: str):
+        """Add a column to an existing table if it isn't there yet"""
+        columns = {row[1] for row in self.cursor.execute(f"PRAGMA table_info({table})")}
+        if column not in columns:
+            self.cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+    
+    def _create_search_index(self):
+        """
+        Create the FTS5 full-text index over jobs and the triggers that keep it in sync
         
-        email = "shardulbuzo@gmail.com"
-        password = "birdisthewordA1$"
+        The index stores its own copy of the text rather than pointing at
+        jobs as external content, so it keeps working however the jobs
+        columns are laid out. Falls back to LIKE search when the SQLite build
+        has no FTS5 module.
+        """
+        try:
+            self.cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                    title, company_name, description, full_description, skills,
+                    tokenize = 'unicode61 remove_diacritics 2',
+                    prefix = '2 3'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            print(f"Full-text search unavailable, using LIKE search: {e}")
+            return
         
-        # Check if superadmin exists
-        existing = self.cursor.execute(
-            "SELECT id FROM superadmins WHERE email = ?", 
-            (email,)
-        ).fetchone()
+        self.cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+                INSERT INTO jobs_fts (rowid, title, company_name, description, full_description, skills)
+                VALUES (new.id, new.title, new.company_name, new.description, new.full_description, new.skills);
+            END
+        """)
         
-        if not existing:
-            # Hash the password
-            password_hash = hashlib.sha256(password.encode()).hexdigest()
-            
-            self.cursor.execute("""
-                INSERT INTO superadmins (email, password_hash)
-                VALUES (?, ?)
-            """, (email, password_hash))
-            
-            self.conn.commit()
-            print(f"✅ Superadmin account created: {email}")
+        self.cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+                DELETE FROM jobs_fts WHERE rowid = old.id;
+            END
+        """)
+        
+        # Full descriptions live in job_texts and reach the index from
+        # Python, so an update leaves the indexed one alone unless the row
+        # still carries its own (databases from before job_texts)
+        update_trigger = self.cursor.execute("""
+            SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'jobs_fts_update'
+        """).fetchone()
+        if update_trigger and 'COALESCE' not in update_trigger[0]:
+            self.cursor.execute("DROP TRIGGER jobs_fts_update")
+        
+        self.cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS jobs_fts_update
+            AFTER UPDATE OF title, company_name, description, full_description, skills ON jobs BEGIN
+                UPDATE jobs_fts SET
+                    title = new.title,
+                    company_name = new.company_name,
+                    description = new.description,
+                    full_description = COALESCE(new.full_description, full_description),
+                    skills = new.skills
+                WHERE rowid = old.id;
+            END
+        """)
         
         self.conn.commit()
+        self.fts_enabled = True
     
-    def insert_job(self, job_data: Dict) -> Optional[int]:
+    def _create_facet_counts(self):
         """
-        Insert a new job into the database
+        Create the job_facets count table and the triggers that keep it in sync
+        
+        Holds the number of open jobs per value of each facet in
+        FACET_COLUMNS. Triggers adjust the counts on insert, delete and any
+        update of status or a facet column, so reads never scan jobs.
+        """
+        exists = self.cursor.execute("""
+            SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'job_facets'
+        """).fetchone()
+        
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS job_facets (
+                facet TEXT NOT NULL,
+                value TEXT NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (facet, value)
+            ) WITHOUT ROWID
+        """)
+        
+        def increment(row: str, condition: str = '') -> str:
+            return ''.join(f"""
+                INSERT INTO job_facets (facet, value, count)
+                SELECT '{facet}', COALESCE({row}.{column}, ''), 1 WHERE {row}.status = 'open' {condition}
+                ON CONFLICT(facet, value) DO UPDATE SET count = count + 1;"""
+                for facet, column in self.FACET_COLUMNS.items())
+        
+        def decrement(row: str) -> str:
+            return ''.join(f"""
+                UPDATE job_facets SET count = count - 1
+                WHERE facet = '{facet}' AND value = COALESCE({row}.{column}, '') AND {row}.status = 'open';"""
+                for facet, column in self.FACET_COLUMNS.items())
+        
+        columns = ', '.join(['status'] + list(self.FACET_COLUMNS.values()))
+        
+        self.cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS job_facets_insert AFTER INSERT ON jobs BEGIN
+                {increment('new')}
+            END
+        """)
+        
+        self.cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS job_facets_delete AFTER DELETE ON jobs BEGIN
+                {decrement('old')}
+            END
+        """)
+        
+        self.cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS job_facets_update AFTER UPDATE OF {columns} ON jobs BEGIN
+                {decrement('old')}
+                {increment('new')}
+            END
+        """)
+        
+        self.conn.commit()
+        
+        # Count the jobs already stored when upgrading an older database
+        if not exists:
+            self.rebuild_job_facets()
+    
+    @_invalidates
+    @_serialized
+    def rebuild_job_facets(self) -> int:
+        """
+        Recount job_facets from the jobs table
         
-        Args:
-            job_data: Dictionary containing job information
-            
         Returns:
-            Job ID if successful, None otherwise
+            Number of facet values stored
         """
         try:
-            # Convert skills list to JSON string
-            skills_json = json.dumps(job_data.get('skills', []))
-            
-            self.cursor.execute("""
-                INSERT INTO jobs (
-                    job_hash, title, company_id, company_name, location, salary,
-                    sector, description, full_description, requirements, skills, job_url,
-                    ats_type, posted_date, scraped_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                job_data['job_hash'],
-                job_data['title'],
-                job_data.get('company_id'),
-                job_data['company_name'],
-                job_data.get('location', 'Remote'),
-                job_data.get('salary'),
-                job_data.get('sector', 'other'),
-                job_data.get('description', ''),
-                job_data.get('full_description', ''),
-                job_data.get('requirements', ''),
-                skills_json,
-                job_data['job_url'],
-                job_data.get('ats_type', 'unknown'),
-                job_data.get('posted_date', datetime.now().strftime('%Y-%m-%d')),
-                job_data.get('scraped_at', datetime.now().isoformat())
-            ))
-            
+            self.cursor.execute("DELETE FROM job_facets")
+            for facet, column in self.FACET_COLUMNS.items():
+                self.cursor.execute(f"""
+                    INSERT INTO job_facets (facet, value, count)
+                    SELECT ?, COALESCE({column}, ''), COUNT(*) FROM jobs
+                    WHERE status = 'open'
+                    GROUP BY COALESCE({column}, '')
+                """, (facet,))
             self.conn.commit()
-            return self.cursor.lastrowid
+            return self.cursor.execute("SELECT COUNT(*) FROM job_facets").fetchone()[0]
             
-        except sqlite3.IntegrityError:
-            # Job already exists (duplicate job_hash)
-            return None
         except Exception as e:
-            print(f"Error inserting job: {e}")
+            print(f"Error rebuilding facet counts: {e}")
             self.conn.rollback()
-            return None
+            return 0
+    
+    # Inserts one job's skills (from the JSON skills column of `row`)
+    JOB_SKILLS_SQL = """
+        INSERT OR IGNORE INTO skills (name)
+        SELECT trim(value) FROM json_each({row}.skills)
+        WHERE type = 'text' AND trim(value) != '';
+        INSERT OR IGNORE INTO job_skills (job_id, skill_id, position)
+        SELECT {row}.id, s.id, e.key
+        FROM json_each({row}.skills) e
+        JOIN skills s ON s.name = trim(e.value)
+        WHERE e.type = 'text';
+    """
     
-    def get_all_jobs(self, limit: int = 100, offset: int = 0) -> List[Dict]:
+    def _create_job_skills(self):
         """
-        Get all jobs ordered by posted date (newest first) with company logos
+        Create the normalized skills tables and the triggers that fill them
+        
+        skills holds each distinct skill name once (case-insensitive);
+        job_skills links jobs to skills in their original order. Triggers
+        on jobs keep job_skills in step with the JSON skills column, which
+        is still stored for full-text search and the archive.
+        """
+        exists = self.cursor.execute("""
+            SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'job_skills'
+        """).fetchone()
+        
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS skills (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT UNIQUE NOT NULL COLLATE NOCASE
+            )
+        """)
+        
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS job_skills (
+                job_id INTEGER NOT NULL,
+                skill_id INTEGER NOT NULL,
+                position INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (job_id, skill_id)
+            ) WITHOUT ROWID
+        """)
+        
+        # Skill filters start from the skill and walk to its jobs
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_job_skills_skill ON job_skills(skill_id, job_id)
+        """)
+        
+        self.cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS job_skills_insert AFTER INSERT ON jobs
+            WHEN json_valid(new.skills) BEGIN
+                {self.JOB_SKILLS_SQL.format(row='new')}
+            END
+        """)
+        
+        self.cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS job_skills_delete AFTER DELETE ON jobs BEGIN
+                DELETE FROM job_skills WHERE job_id = old.id;
+            END
+        """)
+        
+        self.cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS job_skills_update AFTER UPDATE OF skills ON jobs BEGIN
+                DELETE FROM job_skills WHERE job_id = old.id;
+                {self.JOB_SKILLS_SQL.format(row='new')}
+            END
+        """)
+        
+        self.conn.commit()
+        
+        # Index the jobs already stored when upgrading an older database
+        if not exists:
+            self.rebuild_job_skills()
+    
+    @_invalidates
+    @_serialized
+    def rebuild_job_skills(self) -> int:
+        """
+        Rebuild skills and job_skills from the jobs table's JSON skills
+        
+        Returns:
+            Number of job-skill links stored
+        """
+        try:
+            self.cursor.execute("DELETE FROM job_skills")
+            self.cursor.execute("""
+                INSERT OR IGNORE INTO skills (name)
+                SELECT trim(e.value) FROM jobs j, json_each(j.skills) e
+                WHERE json_valid(j.skills) AND e.type = 'text' AND trim(e.value) != ''
+            """)
+            self.cursor.execute("""
+                INSERT OR IGNORE INTO job_skills (job_id, skill_id, position)
+                SELECT j.id, s.id, e.key
+                FROM jobs j, json_each(j.skills) e
+                JOIN skills s ON s.name = trim(e.value)
+                WHERE json_valid(j.skills) AND e.type = 'text'
+            """)
+            self.conn.commit()
+            return self.cursor.execute("SELECT COUNT(*) FROM job_skills").fetchone()[0]
+            
+        except Exception as e:
+            print(f"Error rebuilding job skills: {e}")
+            self.conn.rollback()
+            return 0
+    
+    @_invalidates
+    @_serialized
+    def rebuild_search_index(self) -> int:
+        """
+        Rebuild the full-text index from the jobs table
+        
+        Needed once for databases created before the index existed.
+        
+        Returns:
+            Number of jobs indexed
+        """
+        if not self.fts_enabled:
+            print("Full-text search is not available in this SQLite build")
+            return 0
+        
+        try:
+            self.cursor.execute("DELETE FROM jobs_fts")
+            self.cursor.execute("""
+                INSERT INTO jobs_fts (rowid, title, company_name, description, full_description, skills)
+                SELECT
+                    j.id, j.title, j.company_name, j.description,
+                    COALESCE(j.full_description, decompress_text(t.full_description, t.codec)),
+                    j.skills
+                FROM jobs j
+                LEFT JOIN job_texts t ON t.job_id = j.id
+            """)
+            indexed = self.cursor.rowcount
+            self.cursor.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('optimize')")
+            self.conn.commit()
+            return indexed
+            
+        except Exception as e:
+            print(f"Error rebuilding search index: {e}")
+            self.conn.rollback()
+            return 0
+    
+    @_invalidates
+    @_serialized
+    def backfill_salary_columns(self, batch_size: int = 1000) -> int:
+        """
+        Parse structured salary columns for jobs stored before they existed
+        
+        Args:
+            batch_size: Number of jobs updated per transaction
+            
+        Returns:
+            Number of jobs that got a parsed salary range
+        """
+        updated = 0
+        last_id = 0
+        
+        while True:
+            rows = self.cursor.execute("""
+                SELECT
+                    j.id, j.salary, j.title, j.description,
+                    COALESCE(j.full_description, decompress_text(t.full_description, t.codec)) AS full_description
+                FROM jobs j
+                LEFT JOIN job_texts t ON t.job_id = j.id
+                WHERE j.id > ? AND j.salary_min IS NULL
+                ORDER BY j.id
+                LIMIT ?
+            """, (last_id, batch_size)).fetchall()
+            
+            if not rows:
+                break
+            last_id = rows[-1]['id']
+            
+            updates = []
+            for row in rows:
+                compensation = parse_compensation(row['salary'] or '') or parse_compensation(
+                    f"{row['title']} {row['full_description'] or row['description'] or ''}"
+                )
+                if compensation:
+                    updates.append((
+                        row['salary'] or format_compensation(compensation),
+                        compensation['salary_min'],
+                        compensation['salary_max'],
+                        compensation['salary_currency'],
+                        compensation['salary_period'],
+                        row['id']
+                    ))
+            
+            try:
+                self.cursor.executemany("""
+                    UPDATE jobs
+                    SET salary = ?, salary_min = ?, salary_max = ?, salary_currency = ?, salary_period = ?
+                    WHERE id = ?
+                """, updates)
+                self.conn.commit()
+                updated += len(updates)
+                
+            except Exception as e:
+                print(f"Error backfilling salaries: {e}")
+                self.conn.rollback()
+                break
+        
+        return updated
+    
+    @_invalidates
+    @_serialized
+    def compact_job_texts(self, batch_size: int = 1000, vacuum: bool = True) -> int:
+        """
+        Move full descriptions and requirements stored inline in jobs into
+        the compressed job_texts table
+        
+        Needed once for databases created before job_texts existed. The
+        search index keeps its copy of the text.
+        
+        Args:
+            batch_size: Number of jobs moved per transaction
+            vacuum: VACUUM afterwards so the freed pages are reclaimed
+            
+        Returns:
+            Number of jobs whose text was moved
+        """
+        moved = 0
+        last_id = 0
+        
+        while True:
+            rows = self.cursor.execute("""
+                SELECT id, full_description, requirements FROM jobs
+                WHERE id > ? AND (full_description IS NOT NULL OR requirements IS NOT NULL)
+                ORDER BY id
+                LIMIT ?
+            """, (last_id, batch_size)).fetchall()
+            
+            if not rows:
+                break
+            last_id = rows[-1]['id']
+            
+            try:
+                self._store_job_texts([
+                    (row['id'], {'full_description': row['full_description'], 'requirements': row['requirements']})
+                    for row in rows
+                ], index=False)
+                self.cursor.executemany("""
+                    UPDATE jobs SET full_description = NULL, requirements = NULL WHERE id = ?
+                """, [(row['id'],) for row in rows])
+                self.conn.commit()
+                moved += len(rows)
+                
+            except Exception as e:
+                print(f"Error compacting job texts: {e}")
+                self.conn.rollback()
+                return moved
+        
+        if vacuum and moved:
+            self.cursor.execute("VACUUM")
+        
+        return moved
+    
+    @_invalidates
+    @_serialized
+    def dedupe_near_duplicates(self, max_distance: int = MAX_DISTANCE, dry_run: bool = False,
+                               batch_size: int = 1000) -> Dict:
+        """
+        One-off pass that fingerprints existing jobs and merges near-duplicates
+        
+        Jobs are visited oldest first; a job that is a near-duplicate of an
+        earlier one is deleted, and any saved_jobs entries move to the job
+        that is kept.
+        
+        Args:
+            max_distance: Maximum Hamming distance counted as a near-duplicate
+            dry_run: Only report what would be merged
+            batch_size: Number of jobs fingerprinted per transaction
+            
+        Returns:
+            Dictionary with `fingerprinted` (jobs newly indexed) and
+            `duplicates` (list of (duplicate_id, kept_id) pairs)
+        """
+        fingerprinted = 0
+        last_id = 0
+        
+        # Index jobs stored before fingerprints existed
+        while True:
+            rows = self.cursor.execute("""
+                SELECT
+                    j.id, j.title, j.company_name, j.location, j.description,
+                    COALESCE(j.full_description, decompress_text(t.full_description, t.codec)) AS full_description
+                FROM jobs j
+                LEFT JOIN job_texts t ON t.job_id = j.id
+                LEFT JOIN job_fingerprints f ON f.job_id = j.id
+                WHERE j.id > ? AND f.job_id IS NULL
+                ORDER BY j.id
+                LIMIT ?
+            """, (last_id, batch_size)).fetchall()
+            
+            if not rows:
+                break
+            last_id = rows[-1]['id']
+            
+            try:
+                self._store_fingerprints([(row['id'], dict(row)) for row in rows])
+                self.conn.commit()
+                fingerprinted += len(rows)
+            except Exception as e:
+                print(f"Error fingerprinting jobs: {e}")
+                self.conn.rollback()
+                return {'fingerprinted': fingerprinted, 'duplicates': []}
+        
+        # Walk the table oldest first against an in-memory index of kept jobs
+        index = NearDuplicateIndex(max_distance)
+        duplicates = []
+        
+        for row in self.cursor.execute("""
+            SELECT f.job_id, f.fingerprint, j.title, j.company_name, j.location
+            FROM job_fingerprints f
+            JOIN jobs j ON j.id = f.job_id
+            ORDER BY f.job_id
+        """).fetchall():
+            fingerprint = to_unsigned(row['fingerprint'])
+            posting = posting_key(row['title'], row['company_name'], row['location'])
+            original = index.find(fingerprint, posting)
+            if original is None:
+                index.add(row['job_id'], fingerprint, posting)
+            else:
+                duplicates.append((row['job_id'], original))
+        
+        if dry_run or not duplicates:
+            return {'fingerprinted': fingerprinted, 'duplicates': duplicates}
+        
+        try:
+            self.cursor.executemany("""
+                UPDATE OR IGNORE saved_jobs SET job_id = ? WHERE job_id = ?
+            """, [(original, duplicate) for duplicate, original in duplicates])
+            self.cursor.execute("""
+                DELETE FROM saved_jobs WHERE job_id IN (SELECT value FROM json_each(?))
+            """, (json.dumps([duplicate for duplicate, _ in duplicates]),))
+            self.cursor.execute("""
+                DELETE FROM jobs WHERE id IN (SELECT value FROM json_each(?))
+            """, (json.dumps([duplicate for duplicate, _ in duplicates]),))
+            self.conn.commit()
+            
+        except Exception as e:
+            print(f"Error merging near-duplicate jobs: {e}")
+            self.conn.rollback()
+            return {'fingerprinted': fingerprinted, 'duplicates': []}
+        
+        return {'fingerprinted': fingerprinted, 'duplicates': duplicates}
+    
+    def _init_superadmin(self):
+        """Initialize superadmin account if it doesn't exist"""
+        import hashlib
+        
+        email = "shardulbuzo@gmail.com"
+        password = "birdisthewordA1$"
+        
+        # Check if superadmin exists
+        existing = self.cursor.execute(
+            "SELECT id FROM superadmins WHERE email = ?", 
+            (email,)
+        ).fetchone()
+        
+        if not existing:
+            # Hash the password
+            password_hash = hashlib.sha256(password.encode()).hexdigest()
+            
+            self.cursor.execute("""
+                INSERT INTO superadmins (email, password_hash)
+                VALUES (?, ?)
+            """, (email, password_hash))
+            
+            self.conn.commit()
+            print(f"✅ Superadmin account created: {email}")
+        
+        self.conn.commit()
+    
+    # Facets counted in job_facets, by facet name -> jobs column
+    FACET_COLUMNS = {
+        'sector': 'sector',
+        'company': 'company_name',
+        'ats_type': 'ats_type',
+        'location': 'location'
+    }
+    
+    # Separator of the aggregated skill_names column (never part of a skill name)
+    SKILL_SEPARATOR = '\x1f'
+    
+    # Columns a job list needs; full text is fetched per job by get_job_detail.
+    # Skills come pre-aggregated from job_skills instead of as JSON.
+    SUMMARY_COLUMNS = """
+        j.id, j.job_hash, j.title, j.company_id, j.company_name, j.location,
+        j.salary, j.sector, j.description, j.job_url, j.ats_type,
+        j.posted_date, j.scraped_at, j.created_at, j.updated_at,
+        j.salary_min, j.salary_max, j.salary_currency, j.salary_period,
+        (SELECT group_concat(name, char(31)) FROM (
+            SELECT s.name FROM job_skills js
+            JOIN skills s ON s.id = js.skill_id
+            WHERE js.job_id = j.id
+            ORDER BY js.position
+        )) AS skill_names
+    """.strip()
+    
+    # insert_jobs_bulk result for a row whose chunk failed to write (never a job ID)
+    INSERT_FAILED = -1
+    
+    JOB_INSERT_SQL = """
+        INSERT INTO jobs (
+            job_hash, title, company_id, company_name, location, salary,
+            sector, description, full_description, requirements, skills, job_url,
+            ats_type, posted_date, scraped_at,
+            salary_min, salary_max, salary_currency, salary_period, near_duplicate_of
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    def _job_params(self, job_data: Dict) -> tuple:
+        """Build the INSERT parameters for a job dictionary"""
+        # Convert skills list to JSON string
+        skills_json = json.dumps(job_data.get('skills', []))
+        
+        return (
+            job_data['job_hash'],
+            job_data['title'],
+            job_data.get('company_id'),
+            job_data['company_name'],
+            job_data.get('location', 'Remote'),
+            job_data.get('salary'),
+            job_data.get('sector', 'other'),
+            job_data.get('description', ''),
+            # Long text goes to job_texts (see _store_job_texts)
+            None,
+            None,
+            skills_json,
+            job_data['job_url'],
+            job_data.get('ats_type', 'unknown'),
+            # Never NULL: keyset pagination compares on posted_date
+            job_data.get('posted_date') or datetime.now().strftime('%Y-%m-%d'),
+            job_data.get('scraped_at', datetime.now().isoformat()),
+            job_data.get('salary_min'),
+            job_data.get('salary_max'),
+            job_data.get('salary_currency'),
+            job_data.get('salary_period'),
+            job_data.get('near_duplicate_of')
+        )
+    
+    def _store_job_texts(self, jobs: List[tuple], index: bool = True):
+        """
+        Write compressed full descriptions and requirements for inserted jobs
+        
+        Runs inside the caller's transaction; does not commit.
+        
+        Args:
+            jobs: List of (job_id, job dictionary) pairs
+            index: Also put the full description into the search index
+        """
+        rows = []
+        indexed = []
+        
+        for job_id, job in jobs:
+            full_description = job.get('full_description') or None
+            requirements = job.get('requirements') or None
+            if not full_description and not requirements:
+                continue
+            
+            codec, (full_blob, requirements_blob) = _compress_texts(
+                [full_description, requirements], self.text_codec
+            )
+            rows.append((job_id, codec, full_blob, requirements_blob))
+            if full_description:
+                indexed.append((full_description, job_id))
+        
+        if rows:
+            self.cursor.executemany("""
+                INSERT OR REPLACE INTO job_texts (job_id, codec, full_description, requirements)
+                VALUES (?, ?, ?, ?)
+            """, rows)
+        
+        if index and indexed and self.fts_enabled:
+            self.cursor.executemany("""
+                UPDATE jobs_fts SET full_description = ? WHERE rowid = ?
+            """, indexed)
+    
+    def _store_fingerprints(self, jobs: List[tuple]):
+        """
+        Index inserted jobs for near-duplicate lookups
+        
+        Uses job['fingerprint'] when the caller already computed it. Runs
+        inside the caller's transaction; does not commit.
+        
+        Args:
+            jobs: List of (job_id, job dictionary) pairs
+        """
+        fingerprints = []
+        buckets = []
+        
+        for job_id, job in jobs:
+            fingerprint = job.get('fingerprint')
+            if fingerprint is None:
+                fingerprint = job_fingerprint(job)
+            fingerprints.append((job_id, to_signed(fingerprint)))
+            posting = posting_key(job.get('title'), job.get('company_name'), job.get('location'))
+            buckets.extend((bucket, job_id) for bucket in bucket_keys(fingerprint, posting))
+        
+        self.cursor.executemany("""
+            INSERT OR REPLACE INTO job_fingerprints (job_id, fingerprint) VALUES (?, ?)
+        """, fingerprints)
+        self.cursor.executemany("""
+            INSERT OR IGNORE INTO job_fingerprint_buckets (bucket, job_id) VALUES (?, ?)
+        """, buckets)
+    
+    @_invalidates
+    @_serialized
+    def insert_job(self, job_data: Dict) -> Optional[int]:
+        """
+        Insert a new job into the database
+        
+        Args:
+            job_data: Dictionary containing job information
+            
+        Returns:
+            Job ID if successful, None otherwise
+        """
+        try:
+            self.cursor.execute(self.JOB_INSERT_SQL, self._job_params(job_data))
+            job_id = self.cursor.lastrowid
+            self._store_job_texts([(job_id, job_data)])
+            self._store_fingerprints([(job_id, job_data)])
+            
+            self.conn.commit()
+            return job_id
+            
+        except sqlite3.IntegrityError:
+            # Job already exists (duplicate job_hash)
+            return None
+        except Exception as e:
+            print(f"Error inserting job: {e}")
+            self.conn.rollback()
+            return None
+    
+    @_invalidates
+    @_serialized
+    def insert_jobs_bulk(self, jobs: List[Dict], chunk_size: int = 500) -> List[Optional[int]]:
+        """
+        Insert many jobs with one transaction (and one commit) per chunk
+        
+        Rows whose job_hash already exists are skipped via ON CONFLICT DO
+        NOTHING instead of aborting the chunk. If the caller already has a
+        transaction open, each chunk runs in a savepoint instead and the
+        caller's transaction is left uncommitted.
+        
+        Args:
+            jobs: List of job dictionaries
+            chunk_size: Number of jobs written per transaction
+            
+        Returns:
+            List aligned with `jobs`: the new job ID for each inserted row,
+            None for duplicates and INSERT_FAILED for rows in a chunk that
+            failed to write
+        """
+        sql = self.JOB_INSERT_SQL + " ON CONFLICT(job_hash) DO NOTHING"
+        results = []
+        outer_transaction = self.conn.in_transaction
+        
+        for start in range(0, len(jobs), max(1, chunk_size)):
+            chunk = jobs[start:start + max(1, chunk_size)]
+            
+            try:
+                # Take the write lock first so the id watermark below can't
+                # be raced by another writer
+                if outer_transaction:
+                    self.cursor.execute("SAVEPOINT insert_jobs_bulk")
+                else:
+                    self.cursor.execute("BEGIN IMMEDIATE")
+                
+                # AUTOINCREMENT ids only grow, so anything above the current
+                # maximum after executemany was inserted by this chunk
+                # (sqlite3's executemany discards RETURNING rows)
+                max_id = self.cursor.execute(
+                    "SELECT COALESCE(MAX(id), 0) FROM jobs"
+                ).fetchone()[0]
+                
+                self.cursor.executemany(sql, [self._job_params(job) for job in chunk])
+                
+                self.cursor.execute("""
+                    SELECT id, job_hash FROM jobs
+                    WHERE id > ? AND job_hash IN (SELECT value FROM json_each(?))
+                """, (max_id, json.dumps([job['job_hash'] for job in chunk])))
+                inserted = {row[1]: row[0] for row in self.cursor.fetchall()}
+                
+                first_by_hash = {}
+                for job in chunk:
+                    first_by_hash.setdefault(job['job_hash'], job)
+                inserted_jobs = [(job_id, first_by_hash[job_hash]) for job_hash, job_id in inserted.items()]
+                self._store_job_texts(inserted_jobs)
+                self._store_fingerprints(inserted_jobs)
+                
+                if outer_transaction:
+                    self.cursor.execute("RELEASE SAVEPOINT insert_jobs_bulk")
+                else:
+                    self.conn.commit()
+                
+            except Exception as e:
+                print(f"Error bulk inserting jobs: {e}")
+                if outer_transaction:
+                    self.cursor.execute("ROLLBACK TO SAVEPOINT insert_jobs_bulk")
+                    self.cursor.execute("RELEASE SAVEPOINT insert_jobs_bulk")
+                else:
+                    self.conn.rollback()
+                results.extend([self.INSERT_FAILED] * len(chunk))
+                continue
+            
+            # Only the first occurrence of a hash within the chunk was inserted
+            for job in chunk:
+                results.append(inserted.pop(job['job_hash'], None))
+        
+        return results
+    
+    def get_existing_hashes(self, job_hashes: List[str]) -> Set[str]:
+        """
+        Find which job hashes are already stored, in a single query
+        
+        Args:
+            job_hashes: Job hashes to check
+            
+        Returns:
+            Set of the given hashes that already exist in the jobs table
+            (or were archived, so old postings aren't ingested again)
+        """
+        if not job_hashes:
+            return set()
+        
+        # json_each lets one bound parameter carry the whole batch, so the
+        # lookup stays one query regardless of SQLITE_MAX_VARIABLE_NUMBER
+        rows = self._fetchall("""
+            SELECT job_hash FROM jobs
+            WHERE job_hash IN (SELECT value FROM json_each(?1))
+            UNION
+            SELECT job_hash FROM jobs_archive
+            WHERE job_hash IN (SELECT value FROM json_each(?1))
+        """, (json.dumps(list(job_hashes)),))
+        
+        return {row[0] for row in rows}
+    
+    def get_company_job_hashes(self, company_ids: List[int]) -> Dict[int, Set[str]]:
+        """
+        Get the hashes of every stored job (open, closed or archived) per company
+        
+        Lets scrapers skip detail pages of postings already stored without
+        touching the database from worker threads. Archived hashes are
+        included because get_existing_hashes drops those postings anyway.
+        
+        Args:
+            company_ids: Companies to load
+            
+        Returns:
+            Dictionary mapping company_id to its set of job hashes
+        """
+        known = {company_id: set() for company_id in company_ids}
+        if not company_ids:
+            return known
+        
+        rows = self._fetchall("""
+            SELECT company_id, job_hash FROM jobs
+            WHERE company_id IN (SELECT value FROM json_each(?1))
+            UNION ALL
+            SELECT company_id, job_hash FROM jobs_archive
+            WHERE company_id IN (SELECT value FROM json_each(?1))
+        """, (json.dumps(list(company_ids)),))
+        
+        for row in rows:
+            known[row[0]].add(row[1])
+        return known
+    
+    def find_near_duplicates(self, fingerprints: List[tuple],
+                             max_distance: int = MAX_DISTANCE) -> List[Optional[int]]:
+        """
+        Find stored jobs that are near-duplicates of new postings, in a single query
+        
+        Only jobs sharing a fingerprint bucket (same normalized title, company
+        and location, and at least one identical band) are compared, so the
+        cost depends on the batch size rather than the table size.
+        
+        Args:
+            fingerprints: List of (fingerprint, posting key) pairs, see
+                fingerprint.job_fingerprint and fingerprint.posting_key
+            max_distance: Maximum Hamming distance counted as a near-duplicate
+                (at most fingerprint.MAX_DISTANCE)
+            
+        Returns:
+            List aligned with `fingerprints`: ID of the closest stored job, or
+            None if there is no near-duplicate
+        """
+        if not fingerprints:
+            return []
+        
+        job_buckets = [bucket_keys(fingerprint, posting) for fingerprint, posting in fingerprints]
+        
+        rows = self._fetchall("""
+            SELECT b.bucket, f.job_id, f.fingerprint
+            FROM job_fingerprint_buckets b
+            JOIN job_fingerprints f ON f.job_id = b.job_id
+            WHERE b.bucket IN (SELECT value FROM json_each(?))
+        """, (json.dumps(sorted({bucket for buckets in job_buckets for bucket in buckets})),))
+        
+        candidates = {}
+        for bucket, job_id, fingerprint in rows:
+            candidates.setdefault(bucket, []).append((job_id, to_unsigned(fingerprint)))
+        
+        matches = []
+        for (fingerprint, _), buckets in zip(fingerprints, job_buckets):
+            best_id = None
+            best_distance = max_distance + 1
+            for bucket in buckets:
+                for job_id, candidate in candidates.get(bucket, ()):
+                    distance = bin(fingerprint ^ candidate).count('1')
+                    if distance < best_distance:
+                        best_id, best_distance = job_id, distance
+            matches.append(best_id)
+        
+        return matches
+    
+    def get_job_hashes_by_id(self, job_ids: List[int]) -> Dict[int, str]:
+        """
+        Look up the job hashes of stored jobs, in a single query
+        
+        Args:
+            job_ids: Job IDs (e.g. near-duplicate matches)
+            
+        Returns:
+            Dictionary of job ID to job_hash for the IDs that exist
+        """
+        if not job_ids:
+            return {}
+        
+        rows = self._fetchall("""
+            SELECT id, job_hash FROM jobs
+            WHERE id IN (SELECT value FROM json_each(?))
+        """, (json.dumps(sorted(set(job_ids))),))
+        
+        return {row[0]: row[1] for row in rows}
+    
+    @_cached
+    def get_all_jobs(self, limit: int = 100, offset: int = 0,
+                     min_salary: Optional[int] = None) -> List[Dict]:
+        """
+        Get all jobs ordered by posted date (newest first) with company logos
+        
+        Args:
+            limit: Maximum number of jobs to return
+            offset: Number of jobs to skip
+            min_salary: Only return jobs whose annual salary_min is at least this
+            
+        Returns:
+            List of job dictionaries
+        """
+        sql = f"""
+            SELECT 
+                {self.SUMMARY_COLUMNS},
+                c.logo_url,
+                c.website_url
+            FROM jobs j
+            LEFT JOIN companies c ON j.company_id = c.id
+            WHERE j.status = 'open'
+        """
+        params = []
+        
+        sql += self._salary_filter(min_salary, params)
+        
+        sql += " ORDER BY j.posted_date DESC, j.scraped_at DESC, j.id DESC LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+        
+        rows = self._fetchall(sql, params)
+        
+        return [self._row_to_dict(row) for row in rows]
+    
+    @_cached
+    def search_jobs(self, query: str, sector: str = None, limit: int = 100,
+                    min_salary: Optional[int] = None) -> List[Dict]:
+        """
+        Search jobs by keyword and/or sector
+        
+        Uses the FTS5 index when available: every word in the query must
+        match (as a prefix) in the title, company, descriptions or skills,
+        and results are ranked by bm25 with title and company matches
+        weighted highest.
+        
+        Args:
+            query: Search query string
+            sector: Job sector filter
+            limit: Maximum number of results
+            min_salary: Only return jobs whose annual salary_min is at least this
+            
+        Returns:
+            List of matching job dictionaries
+        """
+        sql, params = self._search_query(query, sector, min_salary)
+        
+        sql += " LIMIT ?"
+        params.append(limit)
+        
+        rows = self._fetchall(sql, params)
+        return [self._row_to_dict(row) for row in rows]
+    
+    def iter_search(self, query: str, sector: Optional[str] = None,
+                    min_salary: Optional[int] = None, chunk_size: int = 1000) -> Iterator[JobRow]:
+        """
+        Stream every job matching a search, in search_jobs order
+        
+        Args:
+            query: Search query string
+            sector: Job sector filter
+            min_salary: Only return jobs whose annual salary_min is at least this
+            chunk_size: Rows fetched from SQLite per round trip
+            
+        Yields:
+            JobRow per matching job
+        """
+        sql, params = self._search_query(query, sector, min_salary)
+        return self._iter_job_rows(sql, params, chunk_size)
+    
+    def _search_query(self, query: str, sector: Optional[str],
+                      min_salary: Optional[int]) -> tuple:
+        """Build the ordered (unlimited) search SQL and its parameters"""
+        match = self._fts_match_expression(query)
+        
+        if self.fts_enabled and match:
+            sql = f"""
+                SELECT 
+                    {self.SUMMARY_COLUMNS},
+                    c.logo_url,
+                    c.website_url
+                FROM jobs_fts
+                JOIN jobs j ON j.id = jobs_fts.rowid
+                LEFT JOIN companies c ON j.company_id = c.id
+                WHERE jobs_fts MATCH ? AND j.status = 'open'
+            """
+            params = [match]
+            order_by = " ORDER BY bm25(jobs_fts, 10.0, 5.0, 2.0, 1.0, 3.0)"
+        else:
+            sql = f"""
+                SELECT 
+                    {self.SUMMARY_COLUMNS},
+                    c.logo_url,
+                    c.website_url
+                FROM jobs j
+                LEFT JOIN companies c ON j.company_id = c.id
+                WHERE (j.title LIKE ? OR j.company_name LIKE ? OR j.description LIKE ?)
+                  AND j.status = 'open'
+            """
+            params = [f"%{query}%", f"%{query}%", f"%{query}%"]
+            order_by = " ORDER BY j.posted_date DESC, j.scraped_at DESC"
+        
+        if sector and sector != 'all':
+            sql += " AND j.sector = ?"
+            params.append(sector)
+        
+        sql += self._salary_filter(min_salary, params)
+        
+        return sql + order_by, params
+    
+    def _fts_match_expression(self, query: str) -> Optional[str]:
+        """
+        Turn free text into an FTS5 MATCH expression of quoted prefix terms
+        
+        Quoting every term keeps user input from being parsed as FTS5 syntax.
+        
+        Returns:
+            MATCH expression, or None if the query has no searchable words
+        """
+        terms = re.findall(r'\w+', query or '')
+        if not terms:
+            return None
+        return ' '.join(f'"{term}"*' for term in terms)
+    
+    @_cached
+    def get_jobs_by_sector(self, sector: str, limit: int = 100,
+                           min_salary: Optional[int] = None) -> List[Dict]:
+        """Get jobs filtered by sector (and optionally minimum annual salary)"""
+        sql = f"""
+            SELECT 
+                {self.SUMMARY_COLUMNS},
+                c.logo_url,
+                c.website_url
+            FROM jobs j
+            LEFT JOIN companies c ON j.company_id = c.id
+            WHERE j.sector = ? AND j.status = 'open'
+        """
+        params = [sector]
+        
+        sql += self._salary_filter(min_salary, params)
+        
+        sql += " ORDER BY j.posted_date DESC, j.scraped_at DESC, j.id DESC LIMIT ?"
+        params.append(limit)
+        
+        rows = self._fetchall(sql, params)
+        
+        return [self._row_to_dict(row) for row in rows]
+    
+    @_cached
+    def get_jobs_page(self, limit: int = 100, after: Optional[str] = None,
+                      sector: Optional[str] = None, min_salary: Optional[int] = None) -> Dict:
+        """
+        Get one page of jobs (newest first) using keyset pagination
+        
+        Instead of skipping `offset` rows, each page starts right after the
+        last row of the previous one, so deep pages cost the same as the
+        first page.
+        
+        Args:
+            limit: Maximum number of jobs to return
+            after: Cursor returned as `next_cursor` by the previous page
+            sector: Optional sector filter ('all' or None for every sector)
+            min_salary: Only return jobs whose annual salary_min is at least this
+            
+        Returns:
+            Dictionary with `jobs` (list of job dictionaries) and
+            `next_cursor` (None when there are no more pages)
+        """
+        sql = f"""
+            SELECT 
+                {self.SUMMARY_COLUMNS},
+                c.logo_url,
+                c.website_url
+            FROM jobs j
+            LEFT JOIN companies c ON j.company_id = c.id
+            WHERE j.status = 'open'
+        """
+        params = []
+        
+        if sector and sector != 'all':
+            sql += " AND j.sector = ?"
+            params.append(sector)
+        
+        sql += self._salary_filter(min_salary, params)
+        
+        if after:
+            sql += " AND (j.posted_date, j.scraped_at, j.id) < (?, ?, ?)"
+            params.extend(self._decode_cursor(after))
+        
+        sql += " ORDER BY j.posted_date DESC, j.scraped_at DESC, j.id DESC LIMIT ?"
+        params.append(limit)
+        
+        jobs = [self._row_to_dict(row) for row in self._fetchall(sql, params)]
+        
+        next_cursor = None
+        if jobs and len(jobs) == limit:
+            last = jobs[-1]
+            next_cursor = self._encode_cursor(last['posted_date'], last['scraped_at'], last['id'])
+        
+        return {'jobs': jobs, 'next_cursor': next_cursor}
+    
+    def iter_jobs(self, sector: Optional[str] = None, min_salary: Optional[int] = None,
+                  chunk_size: int = 1000) -> Iterator[JobRow]:
+        """
+        Stream every open job (newest first) without loading the whole list
+        
+        For exports and other full scans: rows are fetched chunk_size at a
+        time and yielded as compact JobRow tuples instead of dictionaries.
+        Pair with job_rows_to_json to write JSON without building the list.
+        
+        Args:
+            sector: Optional sector filter ('all' or None for every sector)
+            min_salary: Only return jobs whose annual salary_min is at least this
+            chunk_size: Rows fetched from SQLite per round trip
+            
+        Yields:
+            JobRow per job
+        """
+        sql = f"""
+            SELECT 
+                {self.SUMMARY_COLUMNS},
+                c.logo_url,
+                c.website_url
+            FROM jobs j
+            LEFT JOIN companies c ON j.company_id = c.id
+            WHERE j.status = 'open'
+        """
+        params = []
+        
+        if sector and sector != 'all':
+            sql += " AND j.sector = ?"
+            params.append(sector)
+        
+        sql += self._salary_filter(min_salary, params)
+        
+        sql += " ORDER BY j.posted_date DESC, j.scraped_at DESC, j.id DESC"
+        
+        return self._iter_job_rows(sql, params, chunk_size)
+    
+    @_cached
+    def get_job_detail(self, job_id: int) -> Optional[Dict]:
+        """
+        Get one job with its full description and requirements
+        
+        Closed jobs are included, and archived jobs are looked up in
+        jobs_archive, so saved jobs keep resolving.
         
         Args:
-            limit: Maximum number of jobs to return
-            offset: Number of jobs to skip
+            job_id: Job ID
             
         Returns:
-            List of job dictionaries
+            Job dictionary, or None if there is no such job
         """
-        self.cursor.execute("""
+        row = self._fetchone("""
             SELECT 
                 j.*,
                 c.logo_url,
-                c.website_url
+                c.website_url,
+                t.codec AS text_codec,
+                t.full_description AS compressed_full_description,
+                t.requirements AS compressed_requirements
             FROM jobs j
             LEFT JOIN companies c ON j.company_id = c.id
-            ORDER BY j.posted_date DESC, j.scraped_at DESC
-            LIMIT ? OFFSET ?
-        """, (limit, offset))
+            LEFT JOIN job_texts t ON t.job_id = j.id
+            WHERE j.id = ?
+        """, (job_id,))
         
-        rows = self.cursor.fetchall()
-        return [self._row_to_dict(row) for row in rows]
+        if row is None:
+            row = self._fetchone("""
+                SELECT a.*, c.logo_url, c.website_url
+                FROM jobs_archive a
+                LEFT JOIN companies c ON a.company_id = c.id
+                WHERE a.id = ?
+            """, (job_id,))
+            return self._row_to_dict(row) if row else None
+        
+        job = self._row_to_dict(row)
+        codec = job.pop('text_codec')
+        full_description = job.pop('compressed_full_description')
+        requirements = job.pop('compressed_requirements')
+        
+        if codec is not None:
+            job['full_description'] = _decompress_text(full_description, codec)
+            job['requirements'] = _decompress_text(requirements, codec)
+        
+        return job
     
-    def search_jobs(self, query: str, sector: str = None, limit: int = 100) -> List[Dict]:
+    def get_jobs_by_skills(self, skills: List[str], match: str = 'any', sector: Optional[str] = None,
+                           limit: int = 100, min_salary: Optional[int] = None) -> List[Dict]:
         """
-        Search jobs by keyword and/or sector
+        Get open jobs having any or all of the given skills (newest first)
+        
+        Uses the job_skills index, so the cost depends on how many jobs have
+        the skills rather than on the size of the jobs table.
         
         Args:
-            query: Search query string
-            sector: Job sector filter
-            limit: Maximum number of results
+            skills: Skill names (case-insensitive)
+            match: 'any' for jobs with at least one skill, 'all' for jobs with every skill
+            sector: Optional sector filter ('all' or None for every sector)
+            limit: Maximum number of jobs to return
+            min_salary: Only return jobs whose annual salary_min is at least this
             
         Returns:
-            List of matching job dictionaries
+            List of job dictionaries
+            
+        Raises:
+            ValueError: if match is not 'any' or 'all'
         """
-        sql = """
+        if match not in ('any', 'all'):
+            raise ValueError("match must be 'any' or 'all'")
+        
+        names = tuple(sorted({skill.strip().lower() for skill in skills if skill and skill.strip()}))
+        if not names:
+            return []
+        
+        return self._get_jobs_by_skills(names, len(names) if match == 'all' else 1,
+                                        sector, limit, min_salary)
+    
+    @_cached
+    def _get_jobs_by_skills(self, names: tuple, required: int, sector: Optional[str],
+                            limit: int, min_salary: Optional[int]) -> List[Dict]:
+        sql = f"""
             SELECT 
-                j.*,
+                {self.SUMMARY_COLUMNS},
                 c.logo_url,
                 c.website_url
             FROM jobs j
             LEFT JOIN companies c ON j.company_id = c.id
-            WHERE (j.title LIKE ? OR j.company_name LIKE ? OR j.description LIKE ?)
+            WHERE j.status = 'open'
+              AND j.id IN (
+                  SELECT js.job_id FROM job_skills js
+                  JOIN skills s ON s.id = js.skill_id
+                  WHERE s.name IN (SELECT value FROM json_each(?))
+                  GROUP BY js.job_id
+                  HAVING COUNT(*) >= ?
+              )
         """
-        params = [f"%{query}%", f"%{query}%", f"%{query}%"]
+        params = [json.dumps(names), required]
         
         if sector and sector != 'all':
             sql += " AND j.sector = ?"
             params.append(sector)
         
-        sql += " ORDER BY j.posted_date DESC, j.scraped_at DESC LIMIT ?"
+        sql += self._salary_filter(min_salary, params)
+        
+        sql += " ORDER BY j.posted_date DESC, j.scraped_at DESC, j.id DESC LIMIT ?"
         params.append(limit)
         
-        self.cursor.execute(sql, params)
-        rows = self.cursor.fetchall()
-        return [self._row_to_dict(row) for row in rows]
+        return [self._row_to_dict(row) for row in self._fetchall(sql, params)]
     
-    def get_jobs_by_sector(self, sector: str, limit: int = 100) -> List[Dict]:
-        """Get jobs filtered by sector"""
-        self.cursor.execute("""
-            SELECT 
-                j.*,
-                c.logo_url,
-                c.website_url
-            FROM jobs j
-            LEFT JOIN companies c ON j.company_id = c.id
-            WHERE j.sector = ?
-            ORDER BY j.posted_date DESC, j.scraped_at DESC
+    @_cached
+    def get_skills(self, limit: int = 100) -> List[Dict]:
+        """
+        Get skills by number of open jobs requiring them
+        
+        Args:
+            limit: Maximum number of skills to return
+            
+        Returns:
+            List of {'name', 'count'} dictionaries, most common first
+        """
+        rows = self._fetchall("""
+            SELECT s.name, COUNT(*) AS count
+            FROM job_skills js
+            JOIN skills s ON s.id = js.skill_id
+            JOIN jobs j ON j.id = js.job_id
+            WHERE j.status = 'open'
+            GROUP BY s.id
+            ORDER BY count DESC, s.name
             LIMIT ?
-        """, (sector, limit))
+        """, (limit,))
         
-        rows = self.cursor.fetchall()
-        return [self._row_to_dict(row) for row in rows]
+        return [dict(row) for row in rows]
+    
+    def get_facets(self, filters: Optional[Dict[str, str]] = None,
+                   facets: Optional[List[str]] = None, limit: int = 50) -> Dict:
+        """
+        Get open-job counts per sector, company, ATS type and location
+        
+        Without filters the counts are read straight from job_facets. With
+        filters (e.g. {'sector': 'engineering'}) they are counted over the
+        matching open jobs instead.
+        
+        Args:
+            filters: Facet name to required value
+            facets: Facets to return (defaults to all of FACET_COLUMNS)
+            limit: Maximum values per facet, highest count first
+            
+        Returns:
+            Dictionary with `total` open jobs matching the filters and
+            `facets`: facet name to a list of {'value', 'count'}
+            
+        Raises:
+            ValueError: for an unknown facet name
+        """
+        filters = filters or {}
+        facets = facets or list(self.FACET_COLUMNS)
+        
+        unknown = [name for name in list(filters) + list(facets) if name not in self.FACET_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown facet: {', '.join(unknown)}")
+        
+        return self._get_facets(tuple(sorted(filters.items())), tuple(facets), limit)
+    
+    @_cached
+    def _get_facets(self, filters: tuple, facets: tuple, limit: int) -> Dict:
+        result = {'total': 0, 'facets': {}}
+        
+        if not filters:
+            rows = self._fetchall(f"""
+                SELECT facet, value, count FROM (
+                    SELECT facet, value, count,
+                           ROW_NUMBER() OVER (PARTITION BY facet ORDER BY count DESC, value) AS rank
+                    FROM job_facets
+                    WHERE count > 0 AND facet IN ({','.join('?' * len(facets))})
+                )
+                WHERE rank <= ?
+                ORDER BY facet, count DESC, value
+            """, (*facets, limit))
+            
+            for facet in facets:
+                result['facets'][facet] = []
+            for row in rows:
+                result['facets'][row['facet']].append({'value': row['value'], 'count': row['count']})
+            
+            # Every open job has exactly one sector value
+            row = self._fetchone("""
+                SELECT COALESCE(SUM(count), 0) FROM job_facets WHERE facet = 'sector'
+            """)
+            result['total'] = row[0]
+            return result
+        
+        where = "status = 'open'" + ''.join(
+            f" AND {self.FACET_COLUMNS[facet]} = ?" for facet, _ in filters
+        )
+        params = [value for _, value in filters]
+        
+        result['total'] = self._fetchone(f"SELECT COUNT(*) FROM jobs WHERE {where}", params)[0]
+        for facet in facets:
+            column = self.FACET_COLUMNS[facet]
+            rows = self._fetchall(f"""
+                SELECT COALESCE({column}, '') AS value, COUNT(*) AS count
+                FROM jobs
+                WHERE {where}
+                GROUP BY COALESCE({column}, '')
+                ORDER BY count DESC, value
+                LIMIT ?
+            """, (*params, limit))
+            result['facets'][facet] = [{'value': row['value'], 'count': row['count']} for row in rows]
+        
+        return result
+    
+    @_cached
+    def get_sectors(self) -> List[str]:
+        """Get the distinct sectors that have at least one open job"""
+        rows = self._fetchall("""
+            SELECT DISTINCT sector FROM jobs
+            WHERE sector IS NOT NULL AND sector != '' AND status = 'open'
+            ORDER BY sector
+        """)
+        
+        return [row[0] for row in rows]
+    
+    @staticmethod
+    def _salary_filter(min_salary: Optional[int], params: list) -> str:
+        """
+        Build the SQL for a minimum annual salary filter, appending its parameters
+        
+        Only annual ranges are compared so hourly and monthly figures don't
+        mix with yearly ones.
+        """
+        if min_salary is None:
+            return ""
+        params.append(int(min_salary))
+        return " AND j.salary_period = 'year' AND j.salary_min >= ?"
+    
+    @staticmethod
+    def _encode_cursor(posted_date: str, scraped_at: str, job_id: int) -> str:
+        """Encode a row's sort key as an opaque pagination cursor"""
+        raw = json.dumps([posted_date, scraped_at, job_id], separators=(',', ':'))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+    
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple:
+        """Decode a pagination cursor, raising ValueError if it is malformed"""
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            posted_date, scraped_at, job_id = json.loads(base64.urlsafe_b64decode(padded))
+            if not isinstance(posted_date, str) or not isinstance(scraped_at, str):
+                raise TypeError("cursor dates must be strings")
+            return posted_date, scraped_at, int(job_id)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid pagination cursor: {cursor}") from e
     
     # ==================== COMPANY MANAGEMENT ====================
     
+    @_invalidates
+    @_serialized
     def add_company(self, name: str, job_board_url: str, logo_url: str = '', 
                    website_url: str = '', ats_type: str = '', description: str = '') -> Optional[int]:
         """
@@ -329,6 +2188,7 @@ class Database:
             self.conn.rollback()
             return None
     
+    @_cached
     def get_all_companies(self, active_only: bool = True) -> List[Dict]:
         """Get all companies"""
         sql = "SELECT * FROM companies"
@@ -336,22 +2196,21 @@ class Database:
             sql += " WHERE active = 1"
         sql += " ORDER BY name"
         
-        self.cursor.execute(sql)
-        rows = self.cursor.fetchall()
+        rows = self._fetchall(sql)
         return [dict(row) for row in rows]
     
     def get_company_by_id(self, company_id: int) -> Optional[Dict]:
         """Get company by ID"""
-        self.cursor.execute("SELECT * FROM companies WHERE id = ?", (company_id,))
-        row = self.cursor.fetchone()
+        row = self._fetchone("SELECT * FROM companies WHERE id = ?", (company_id,))
         return dict(row) if row else None
     
     def get_company_by_name(self, name: str) -> Optional[Dict]:
         """Get company by name"""
-        self.cursor.execute("SELECT * FROM companies WHERE name = ?", (name,))
-        row = self.cursor.fetchone()
+        row = self._fetchone("SELECT * FROM companies WHERE name = ?", (name,))
         return dict(row) if row else None
     
+    @_invalidates
+    @_serialized
     def update_company(self, company_id: int, **kwargs) -> bool:
         """Update company information"""
         try:
@@ -379,6 +2238,8 @@ class Database:
             self.conn.rollback()
             return False
     
+    @_invalidates
+    @_serialized
     def delete_company(self, company_id: int) -> bool:
         """Delete a company (sets active = 0)"""
         try:
@@ -396,6 +2257,8 @@ class Database:
         """Get all active companies for scraping"""
         return self.get_all_companies(active_only=True)
     
+    @_invalidates
+    @_serialized
     def update_company_last_scraped(self, company_id: int):
         """Update the last scraped timestamp for a company"""
         self.cursor.execute("""
@@ -405,6 +2268,380 @@ class Database:
         """, (company_id,))
         self.conn.commit()
     
+    @_invalidates
+    @_serialized
+    def move_reposted_jobs(self, company_id: int, reposts: List[tuple]) -> int:
+        """
+        Point stored jobs at the new URL they were reposted under
+        
+        The stored row (and its saved_jobs entries) is kept and takes over
+        the repost's URL and hash, so the board keeps linking to the live
+        posting; reconcile_board_jobs then sees it as listed.
+        
+        Args:
+            company_id: Company whose board lists the reposts
+            reposts: List of (job_id, job_hash, job_url) tuples
+            
+        Returns:
+            Number of jobs moved
+        """
+        if not reposts:
+            return 0
+        
+        scraped_at = datetime.now().isoformat()
+        try:
+            self.cursor.executemany("""
+                UPDATE jobs SET job_hash = ?, job_url = ?, scraped_at = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ? AND company_id = ?
+            """, [(job_hash, job_url, scraped_at, job_id, company_id) for job_id, job_hash, job_url in reposts])
+            moved = self.cursor.rowcount
+            self.conn.commit()
+            return moved
+            
+        except Exception as e:
+            print(f"Error moving reposted jobs for company {company_id}: {e}")
+            self.conn.rollback()
+            return 0
+    
+    @_invalidates
+    @_serialized
+    def reconcile_board_jobs(self, company_id: int, seen_hashes: Set[str]) -> Dict:
+        """
+        Close a company's open jobs that are no longer on its board
+        
+        A single set difference against the stored hashes: open jobs of the
+        company whose hash wasn't seen in this scrape are marked closed, and
+        closed jobs that reappeared (or were reposted under a new URL, see
+        move_reposted_jobs) are reopened. Only call this after a complete,
+        successful scrape of the board.
+        
+        Args:
+            company_id: Company whose board was scraped
+            seen_hashes: Job hashes of every posting on the board
+            
+        Returns:
+            Dictionary with `closed` and `reopened` counts
+        """
+        seen = json.dumps(sorted(seen_hashes))
+        
+        try:
+            self.cursor.execute("""
+                UPDATE jobs SET status = 'open', closed_at = NULL, updated_at = CURRENT_TIMESTAMP
+                WHERE company_id = ? AND status = 'closed'
+                  AND job_hash IN (SELECT value FROM json_each(?))
+            """, (company_id, seen))
+            reopened = self.cursor.rowcount
+            
+            self.cursor.execute("""
+                UPDATE jobs SET status = 'closed', closed_at = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE company_id = ? AND status = 'open'
+                  AND job_hash NOT IN (SELECT value FROM json_each(?))
+            """, (datetime.now().isoformat(), company_id, seen))
+            closed = self.cursor.rowcount
+            
+            self.conn.commit()
+            return {'closed': closed, 'reopened': reopened}
+            
+        except Exception as e:
+            print(f"Error reconciling jobs for company {company_id}: {e}")
+            self.conn.rollback()
+            return {'closed': 0, 'reopened': 0}
+    
+    @_invalidates
+    @_serialized
+    def archive_jobs(self, closed_days: int = 7, max_age_days: int = 180,
+                     batch_size: int = 1000) -> int:
+        """
+        Move closed and old jobs from jobs into jobs_archive
+        
+        Archived jobs leave the search index, text and fingerprint tables
+        with them (via the jobs delete triggers); their full text is kept
+        in jobs_archive, uncompressed.
+        
+        Args:
+            closed_days: Archive jobs closed at least this many days ago
+            max_age_days: Archive jobs posted at least this many days ago,
+                even if still open
+            batch_size: Number of jobs moved per transaction
+            
+        Returns:
+            Number of jobs archived
+        """
+        closed_cutoff = (datetime.now() - timedelta(days=closed_days)).isoformat()
+        posted_cutoff = (datetime.now() - timedelta(days=max_age_days)).strftime('%Y-%m-%d')
+        archived = 0
+        
+        while True:
+            ids = [row[0] for row in self.cursor.execute("""
+                SELECT id FROM jobs
+                WHERE (status = 'closed' AND closed_at < ?) OR posted_date < ?
+                LIMIT ?
+            """, (closed_cutoff, posted_cutoff, batch_size)).fetchall()]
+            
+            if not ids:
+                break
+            
+            batch = json.dumps(ids)
+            
+            try:
+                self.cursor.execute("""
+                    INSERT OR REPLACE INTO jobs_archive (
+                        id, job_hash, title, company_id, company_name, location, salary,
+                        sector, description, full_description, requirements, skills, job_url,
+                        ats_type, posted_date, scraped_at, created_at, updated_at,
+                        salary_min, salary_max, salary_currency, salary_period, status, closed_at
+                    )
+                    SELECT
+                        j.id, j.job_hash, j.title, j.company_id, j.company_name, j.location, j.salary,
+                        j.sector, j.description,
+                        COALESCE(j.full_description, decompress_text(t.full_description, t.codec)),
+                        COALESCE(j.requirements, decompress_text(t.requirements, t.codec)),
+                        j.skills, j.job_url, j.ats_type, j.posted_date, j.scraped_at,
+                        j.created_at, j.updated_at,
+                        j.salary_min, j.salary_max, j.salary_currency, j.salary_period,
+                        j.status, j.closed_at
+                    FROM jobs j
+                    LEFT JOIN job_texts t ON t.job_id = j.id
+                    WHERE j.id IN (SELECT value FROM json_each(?))
+                """, (batch,))
+                self.cursor.execute("""
+                    DELETE FROM jobs WHERE id IN (SELECT value FROM json_each(?))
+                """, (batch,))
+                self.conn.commit()
+                archived += len(ids)
+                
+            except Exception as e:
+                print(f"Error archiving jobs: {e}")
+                self.conn.rollback()
+                break
+        
+        return archived
+    
+    def get_board_fetch_cache(self, company_ids: List[int]) -> Dict[int, Dict]:
+        """
+        Get stored fetch validators for a set of companies
+        
+        Args:
+            company_ids: Company IDs to look up
+            
+        Returns:
+            Dictionary mapping company ID to its cache entry
+        """
+        if not company_ids:
+            return {}
+        
+        rows = self._fetchall("""
+            SELECT * FROM board_fetch_cache
+            WHERE company_id IN (SELECT value FROM json_each(?))
+        """, (json.dumps(list(company_ids)),))
+        
+        return {row['company_id']: dict(row) for row in rows}
+    
+    @_serialized
+    def save_board_fetch_cache(self, company_id: int, validators: Dict):
+        """
+        Store the fetch validators of a successfully scraped board
+        
+        Args:
+            company_id: Company ID
+            validators: Dictionary with etag, last_modified and content_digest
+        """
+        try:
+            self.cursor.execute("""
+                INSERT INTO board_fetch_cache (company_id, etag, last_modified, content_digest, fetched_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(company_id) DO UPDATE SET
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    content_digest = excluded.content_digest,
+                    fetched_at = excluded.fetched_at
+            """, (
+                company_id,
+                validators.get('etag'),
+                validators.get('last_modified'),
+                validators.get('content_digest'),
+                datetime.now().isoformat()
+            ))
+            self.conn.commit()
+            
+        except Exception as e:
+            print(f"Error saving fetch cache: {e}")
+            self.conn.rollback()
+    
+    # ==================== SCRAPE LEASES ====================
+    
+    @_serialized
+    def create_scrape_leases(self, run_token: str, company_ids: List[int]):
+        """
+        Queue companies to be claimed by scraper processes
+        
+        Args:
+            run_token: Identifier of the run the leases belong to
+            company_ids: Companies in the order they should be claimed
+        """
+        try:
+            self.cursor.executemany("""
+                INSERT INTO scrape_leases (run_token, company_id, position)
+                VALUES (?, ?, ?)
+            """, [(run_token, company_id, position) for position, company_id in enumerate(company_ids)])
+            self.conn.commit()
+            
+        except Exception as e:
+            print(f"Error creating scrape leases: {e}")
+            self.conn.rollback()
+    
+    @_serialized
+    def claim_scrape_lease(self, run_token: str, worker_id: str, lease_seconds: float = 120,
+                           max_attempts: int = 3) -> Optional[int]:
+        """
+        Claim the next queued company, or one whose lease has expired
+        
+        The claim is a single UPDATE, so two processes can never claim the
+        same company. An expired lease means its worker crashed or stalled;
+        each company is attempted at most max_attempts times.
+        
+        Args:
+            run_token: Identifier of the run
+            worker_id: Identifier of the claiming worker process
+            lease_seconds: How long the lease lasts without a heartbeat
+            max_attempts: Maximum number of claims per company
+            
+        Returns:
+            Claimed company ID, or None if nothing is left to claim
+        """
+        now = time.time()
+        try:
+            self.cursor.execute("""
+                UPDATE scrape_leases
+                SET status = 'leased', worker_id = ?, leased_until = ?, attempts = attempts + 1
+                WHERE run_token = ? AND company_id = (
+                    SELECT company_id FROM scrape_leases
+                    WHERE run_token = ?
+                      AND (status = 'queued'
+                           OR (status = 'leased' AND leased_until < ? AND attempts < ?))
+                    ORDER BY position
+                    LIMIT 1
+                )
+            """, (worker_id, now + lease_seconds, run_token, run_token, now, max_attempts))
+            claimed = self.cursor.rowcount
+            self.conn.commit()
+            
+        except Exception as e:
+            print(f"Error claiming scrape lease: {e}")
+            self.conn.rollback()
+            return None
+        
+        if not claimed:
+            return None
+        
+        # A worker holds one lease at a time
+        row = self._fetchone("""
+            SELECT company_id FROM scrape_leases
+            WHERE run_token = ? AND worker_id = ? AND status = 'leased'
+            ORDER BY leased_until DESC
+            LIMIT 1
+        """, (run_token, worker_id))
+        return row[0] if row else None
+    
+    @_serialized
+    def heartbeat_scrape_lease(self, run_token: str, company_id: int, worker_id: str,
+                               lease_seconds: float = 120) -> bool:
+        """
+        Extend a lease held by a worker
+        
+        Returns:
+            False if the worker no longer holds the lease
+        """
+        try:
+            self.cursor.execute("""
+                UPDATE scrape_leases SET leased_until = ?
+                WHERE run_token = ? AND company_id = ? AND worker_id = ? AND status = 'leased'
+            """, (time.time() + lease_seconds, run_token, company_id, worker_id))
+            extended = self.cursor.rowcount > 0
+            self.conn.commit()
+            return extended
+            
+        except Exception as e:
+            print(f"Error renewing scrape lease: {e}")
+            self.conn.rollback()
+            return False
+    
+    @_serialized
+    def complete_scrape_lease(self, run_token: str, company_id: int, worker_id: str,
+                              result: Dict, status: str = 'done') -> bool:
+        """
+        Release a lease and store the worker's result for the company
+        
+        Args:
+            run_token: Identifier of the run
+            company_id: Leased company
+            worker_id: Worker holding the lease
+            result: JSON-serializable outcome (telemetry, counts)
+            status: Final lease status ('done' or 'failed')
+            
+        Returns:
+            False if the lease had already been taken over by another worker
+        """
+        try:
+            self.cursor.execute("""
+                UPDATE scrape_leases SET status = ?, result = ?, leased_until = NULL
+                WHERE run_token = ? AND company_id = ? AND worker_id = ? AND status = 'leased'
+            """, (status, json.dumps(result), run_token, company_id, worker_id))
+            completed = self.cursor.rowcount > 0
+            self.conn.commit()
+            return completed
+            
+        except Exception as e:
+            print(f"Error completing scrape lease: {e}")
+            self.conn.rollback()
+            return False
+    
+    @_serialized
+    def expire_scrape_leases(self, run_token: str, worker_id: str) -> int:
+        """
+        Make the leases of a worker known to be dead claimable right away
+        
+        Returns:
+            Number of leases released
+        """
+        try:
+            self.cursor.execute("""
+                UPDATE scrape_leases SET leased_until = 0
+                WHERE run_token = ? AND worker_id = ? AND status = 'leased'
+            """, (run_token, worker_id))
+            expired = self.cursor.rowcount
+            self.conn.commit()
+            return expired
+            
+        except Exception as e:
+            print(f"Error expiring scrape leases: {e}")
+            self.conn.rollback()
+            return 0
+    
+    def get_scrape_leases(self, run_token: str) -> List[Dict]:
+        """Get every lease of a run in claim order, with results decoded"""
+        rows = self._fetchall("""
+            SELECT * FROM scrape_leases WHERE run_token = ? ORDER BY position
+        """, (run_token,))
+        
+        leases = []
+        for row in rows:
+            lease = dict(row)
+            lease['result'] = json.loads(lease['result']) if lease['result'] else None
+            leases.append(lease)
+        return leases
+    
+    @_serialized
+    def delete_scrape_leases(self, run_token: str):
+        """Remove the leases of a finished run"""
+        try:
+            self.cursor.execute("DELETE FROM scrape_leases WHERE run_token = ?", (run_token,))
+            self.conn.commit()
+            
+        except Exception as e:
+            print(f"Error deleting scrape leases: {e}")
+            self.conn.rollback()
+    
     # ==================== SUPERADMIN AUTHENTICATION ====================
     
     def verify_superadmin(self, email: str, password: str) -> bool:
@@ -422,52 +2659,194 @@ class Database:
         
         password_hash = hashlib.sha256(password.encode()).hexdigest()
         
-        result = self.cursor.execute("""
+        result = self._fetchone("""
             SELECT id FROM superadmins 
             WHERE email = ? AND password_hash = ?
-        """, (email, password_hash)).fetchone()
+        """, (email, password_hash))
         
         return result is not None
     
-    def log_scrape_run(self, summary: Dict):
+    STAGE_COLUMNS = ['fetch_ms', 'parse_ms', 'dedup_ms', 'compensation_ms', 'insert_ms']
+    
+    @_invalidates
+    @_serialized
+    def log_scrape_run(self, summary: Dict) -> Optional[int]:
         """
-        Log a scraping run
+        Log a scraping run, with its per-company telemetry if present
         
         Args:
-            summary: Dictionary containing scrape statistics
+            summary: Dictionary containing scrape statistics; an optional
+                `company_stats` list is stored in scrape_company_stats
+            
+        Returns:
+            ID of the scrape_logs row, or None on error
         """
         try:
             self.cursor.execute("""
                 INSERT INTO scrape_logs (
                     total_scraped, new_jobs_added, duplicates_skipped,
-                    boards_processed, status, timestamp
-                ) VALUES (?, ?, ?, ?, ?, ?)
+                    boards_processed, boards_unchanged, near_duplicates_skipped, jobs_closed,
+                    details_skipped, status, timestamp
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 summary['total_scraped'],
                 summary['new_jobs_added'],
                 summary['duplicates_skipped'],
                 summary['boards_processed'],
+                summary.get('boards_unchanged', 0),
+                summary.get('near_duplicates_skipped', 0),
+                summary.get('jobs_closed', 0),
+                summary.get('details_skipped', 0),
                 'success',
                 summary['timestamp']
             ))
+            run_id = self.cursor.lastrowid
+            
+            self.cursor.executemany("""
+                INSERT INTO scrape_company_stats (
+                    run_id, company_id, company_name, ats_type, status,
+                    fetch_ms, parse_ms, dedup_ms, compensation_ms, insert_ms, total_ms,
+                    http_bytes, jobs_found, jobs_new, jobs_duplicate, jobs_near_duplicate,
+                    details_skipped, error
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (
+                    run_id,
+                    stats['company_id'],
+                    stats.get('company_name'),
+                    stats.get('ats_type'),
+                    stats.get('status'),
+                    *[round(stats.get(column, 0.0), 3) for column in self.STAGE_COLUMNS],
+                    round(sum(stats.get(column, 0.0) for column in self.STAGE_COLUMNS), 3),
+                    stats.get('http_bytes', 0),
+                    stats.get('jobs_found', 0),
+                    stats.get('jobs_new', 0),
+                    stats.get('jobs_duplicate', 0),
+                    stats.get('jobs_near_duplicate', 0),
+                    stats.get('details_skipped', 0),
+                    stats.get('error')
+                )
+                for stats in summary.get('company_stats', [])
+            ])
             
             self.conn.commit()
+            return run_id
             
         except Exception as e:
             print(f"Error logging scrape run: {e}")
             self.conn.rollback()
+            return None
     
     def get_scrape_history(self, limit: int = 10) -> List[Dict]:
         """Get recent scrape logs"""
-        self.cursor.execute("""
+        rows = self._fetchall("""
             SELECT * FROM scrape_logs
             ORDER BY created_at DESC
             LIMIT ?
         """, (limit,))
         
-        rows = self.cursor.fetchall()
         return [dict(row) for row in rows]
     
+    def get_board_costs(self, runs: int = 7) -> Dict[int, float]:
+        """
+        Get each company's average scrape time over recent runs
+        
+        Args:
+            runs: Number of most recent runs to average over
+            
+        Returns:
+            Dictionary mapping company_id to average seconds per scrape
+        """
+        rows = self._fetchall("""
+            SELECT company_id, AVG(total_ms) / 1000.0
+            FROM scrape_company_stats
+            WHERE run_id IN (SELECT id FROM scrape_logs ORDER BY id DESC LIMIT ?)
+              AND status = 'scraped'
+            GROUP BY company_id
+        """, (runs,))
+        
+        return {row[0]: row[1] for row in rows}
+    
+    def get_company_schedules(self) -> Dict[int, Dict]:
+        """Get the polling schedule of every scheduled company, keyed by company_id"""
+        rows = self._fetchall("SELECT * FROM company_schedule")
+        return {row['company_id']: dict(row) for row in rows}
+    
+    @_serialized
+    def save_company_schedules(self, schedules: List[Dict]):
+        """
+        Insert or update company polling schedules
+        
+        Args:
+            schedules: Schedule dictionaries (see ScrapeScheduler.next_schedule)
+        """
+        try:
+            self.cursor.executemany("""
+                INSERT INTO company_schedule (
+                    company_id, interval_minutes, next_due_at, change_rate,
+                    failures, last_scraped_at, last_changed_at
+                ) VALUES (
+                    :company_id, :interval_minutes, :next_due_at, :change_rate,
+                    :failures, :last_scraped_at, :last_changed_at
+                )
+                ON CONFLICT(company_id) DO UPDATE SET
+                    interval_minutes = excluded.interval_minutes,
+                    next_due_at = excluded.next_due_at,
+                    change_rate = excluded.change_rate,
+                    failures = excluded.failures,
+                    last_scraped_at = excluded.last_scraped_at,
+                    last_changed_at = excluded.last_changed_at
+            """, schedules)
+            self.conn.commit()
+            
+        except Exception as e:
+            print(f"Error saving company schedules: {e}")
+            self.conn.rollback()
+    
+    def get_latest_scrape_id(self) -> int:
+        """Get the ID of the most recent scrape run (0 if there is none)"""
+        row = self._fetchone("SELECT COALESCE(MAX(id), 0) FROM scrape_logs")
+        return row[0]
+    
+    def get_slowest_boards(self, runs: int = 7, limit: int = 10) -> List[Dict]:
+        """
+        Get the boards with the highest average scrape time over recent runs
+        
+        Args:
+            runs: Number of most recent scrape runs to look at
+            limit: Maximum number of boards to return
+            
+        Returns:
+            List of dictionaries with average/max total time, average time
+            per stage, bytes downloaded and error count per company
+        """
+        rows = self._fetchall("""
+            SELECT
+                company_id,
+                company_name,
+                ats_type,
+                COUNT(*) AS runs,
+                AVG(total_ms) AS avg_total_ms,
+                MAX(total_ms) AS max_total_ms,
+                AVG(fetch_ms) AS avg_fetch_ms,
+                AVG(parse_ms) AS avg_parse_ms,
+                AVG(dedup_ms) AS avg_dedup_ms,
+                AVG(compensation_ms) AS avg_compensation_ms,
+                AVG(insert_ms) AS avg_insert_ms,
+                AVG(http_bytes) AS avg_http_bytes,
+                AVG(jobs_found) AS avg_jobs_found,
+                SUM(error IS NOT NULL) AS errors
+            FROM scrape_company_stats
+            WHERE run_id IN (SELECT id FROM scrape_logs ORDER BY id DESC LIMIT ?)
+            GROUP BY company_id
+            ORDER BY avg_total_ms DESC
+            LIMIT ?
+        """, (runs, limit))
+        
+        return [dict(row) for row in rows]
+    
+    @_invalidates
+    @_serialized
     def query(self, sql: str, params: tuple = ()) -> List[Dict]:
         """
         Execute a custom query
@@ -487,8 +2866,13 @@ class Database:
         """Convert a database row to a dictionary with parsed JSON fields"""
         job_dict = dict(row)
         
+        # List queries return skills aggregated from job_skills
+        if 'skill_names' in job_dict:
+            names = job_dict.pop('skill_names')
+            job_dict['skills'] = names.split(self.SKILL_SEPARATOR) if names else []
+        
         # Parse skills JSON
-        if 'skills' in job_dict and job_dict['skills']:
+        elif 'skills' in job_dict and job_dict['skills']:
             try:
                 job_dict['skills'] = json.loads(job_dict['skills'])
             except json.JSONDecodeError:
@@ -498,6 +2882,16 @@ class Database:
     
     def close(self):
         """Close database connection"""
+        if self._readers is not None:
+            while True:
+                try:
+                    self._readers.get_nowait().close()
+                except queue.Empty:
+                    break
+        
+        if self._watcher is not None:
+            self._watcher.close()
+        
         if self.conn:
             self.conn.close()
     
@@ -0,0 +1,180 @@
+"""
+Near-Duplicate Detection for Web3 Job Board
+SimHash fingerprints of job postings with a banded index for sub-linear lookups
+"""
+
+import re
+import hashlib
+from collections import defaultdict
+from typing import Dict, Hashable, List, Optional
+
+FINGERPRINT_BITS = 64
+BAND_COUNT = 8
+BAND_BITS = FINGERPRINT_BITS // BAND_COUNT
+
+# With 8 bands, two fingerprints at most 7 bits apart always share one band
+# exactly, so a bucket lookup finds every match within this distance.
+# Lightly edited reposts land within a few bits; unrelated postings with
+# the same title and company are typically 20+ bits apart.
+MAX_DISTANCE = BAND_COUNT - 1
+
+TITLE_WEIGHT = 4
+COMPANY_WEIGHT = 2
+
+# Only the start of a description is fingerprinted; that's where postings
+# differ, and it bounds the cost for very long descriptions
+DESCRIPTION_CHARS = 4000
+
+_TAG_PATTERN = re.compile(r'<[^>]+>')
+_TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercase words of a text with HTML tags and punctuation removed"""
+    if not text:
+        return []
+    return _TOKEN_PATTERN.findall(_TAG_PATTERN.sub(' ', text).lower())
+
+
+def posting_key(title: Optional[str], company_name: Optional[str],
+                location: Optional[str] = None) -> str:
+    """
+    Normalized title, company and location; near-duplicates must match on all three
+    
+    Keeps generic roles at different companies, and one role advertised in
+    several cities (often with an identical description), from being merged.
+    """
+    return '|'.join(' '.join(tokenize(part)) for part in (title, company_name, location))
+
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), 'big')
+
+
+def simhash(features: Dict[str, int]) -> int:
+    """
+    Compute a 64-bit SimHash over weighted features
+    
+    Args:
+        features: Mapping of feature string to weight
+    
+    Returns:
+        Unsigned 64-bit fingerprint
+    """
+    totals = [0] * FINGERPRINT_BITS
+    total_weight = 0
+
+    for feature, weight in features.items():
+        total_weight += weight
+        value = _feature_hash(feature)
+        # Walk only the set bits
+        while value:
+            lowest = value & -value
+            totals[lowest.bit_length() - 1] += weight
+            value ^= lowest
+
+    fingerprint = 0
+    for bit, weight in enumerate(totals):
+        if weight * 2 > total_weight:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def job_fingerprint(job: Dict) -> int:
+    """
+    Fingerprint a job from its title, company and description
+    
+    Args:
+        job: Job dictionary
+    
+    Returns:
+        Unsigned 64-bit fingerprint
+    """
+    features = defaultdict(int)
+
+    for token in tokenize(job.get('title')):
+        features[f"t:{token}"] += TITLE_WEIGHT
+    for token in tokenize(job.get('company_name')):
+        features[f"c:{token}"] += COMPANY_WEIGHT
+
+    description = job.get('full_description') or job.get('description') or ''
+    for word in set(tokenize(description[:DESCRIPTION_CHARS])):
+        features[f"d:{word}"] += 1
+
+    return simhash(features)
+
+
+def bucket_keys(fingerprint: int, key: str) -> List[int]:
+    """
+    Lookup buckets of a fingerprint: one per band, scoped to the posting key
+    
+    Scoping buckets by posting key keeps them small even though each band
+    is only 8 bits, and means only matching postings are ever compared.
+    
+    Returns:
+        BAND_COUNT signed 64-bit bucket keys (ready for SQLite)
+    """
+    mask = (1 << BAND_BITS) - 1
+    keys = []
+    for band in range(BAND_COUNT):
+        value = (fingerprint >> (band * BAND_BITS)) & mask
+        keys.append(to_signed(_feature_hash(f"{key}|{band}|{value}")))
+    return keys
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two fingerprints"""
+    return bin(a ^ b).count('1')
+
+
+def to_signed(fingerprint: int) -> int:
+    """Convert an unsigned fingerprint to SQLite's signed 64-bit INTEGER"""
+    return fingerprint - (1 << 64) if fingerprint >= 1 << 63 else fingerprint
+
+
+def to_unsigned(value: int) -> int:
+    """Convert a stored signed fingerprint back to unsigned"""
+    return value + (1 << 64) if value < 0 else value
+
+
+class NearDuplicateIndex:
+    """In-memory SimHash index using the same buckets as the database"""
+
+    def __init__(self, max_distance: int = MAX_DISTANCE):
+        self.max_distance = max_distance
+        self.fingerprints = {}
+        self._buckets = defaultdict(list)
+
+    def __len__(self) -> int:
+        return len(self.fingerprints)
+
+    def add(self, key: Hashable, fingerprint: int, posting: str):
+        """
+        Add an entry
+        
+        Args:
+            key: Identifier returned by find (job ID, job hash, ...)
+            fingerprint: Unsigned fingerprint
+            posting: Posting key from posting_key
+        """
+        self.fingerprints[key] = fingerprint
+        for bucket in bucket_keys(fingerprint, posting):
+            self._buckets[bucket].append(key)
+
+    def find(self, fingerprint: int, posting: str) -> Optional[Hashable]:
+        """
+        Find an entry that is a near-duplicate of the given fingerprint
+        
+        Returns:
+            Key of the closest matching entry, or None
+        """
+        best_key = None
+        best_distance = self.max_distance + 1
+
+        for bucket in bucket_keys(fingerprint, posting):
+            for key in self._buckets.get(bucket, ()):
+                distance = hamming_distance(fingerprint, self.fingerprints[key])
+                if distance < best_distance:
+                    best_key, best_distance = key, distance
+
+        return best_key
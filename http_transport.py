@@ -0,0 +1,340 @@
+"""
+Shared HTTP Transport for Web3 Job Board scrapers
+Keep-alive connection pooling per host, retries with jittered backoff,
+response decompression and per-host request statistics
+"""
+
+import gzip
+import zlib
+import json
+import time
+import random
+import socket
+import threading
+import http.client
+from collections import defaultdict
+from typing import Dict, List, Optional
+from urllib.parse import urlencode, urljoin, urlsplit
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+class HttpError(Exception):
+    """Raised by get_json/get_text for a non-2xx response"""
+
+    def __init__(self, status: int, url: str):
+        super().__init__(f"HTTP {status} for {url}")
+        self.status = status
+        self.url = url
+
+
+class HttpResponse:
+    """A fully read, decompressed HTTP response"""
+
+    def __init__(self, url: str, status: int, headers: Dict[str, str], body: bytes):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    @property
+    def text(self) -> str:
+        return self.body.decode('utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.body)
+
+
+class HttpTransport:
+    """
+    Thread-safe HTTP client shared by the orchestrator and every scraper
+    
+    Idle keep-alive connections are pooled per (scheme, host, port), so
+    boards on the same ATS host reuse TCP/TLS connections instead of
+    handshaking again. Connection errors and 429/5xx responses are retried
+    with exponential backoff and full jitter (honouring Retry-After);
+    DNS failures are not retried. Non-idempotent requests (POST, PATCH)
+    are only retried when they cannot have reached the server: a failed
+    connect, or a 429 with Retry-After. Redirects are followed up to
+    MAX_REDIRECTS hops.
+    """
+
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+    REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+    IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+    # Errors raised when a pooled connection was closed by the server while idle
+    STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+    MAX_RETRY_AFTER = 30.0
+    MAX_REDIRECTS = 5
+
+    def __init__(self, user_agent: str = 'Mozilla/5.0 (compatible; Web3JobBoardBot/1.0)',
+                 timeout: float = 20, max_idle_per_host: int = 4, retries: int = 3,
+                 backoff: float = 0.5, max_backoff: float = 10.0):
+        """
+        Initialize the transport
+        
+        Args:
+            user_agent: User-Agent sent with every request
+            timeout: Socket timeout in seconds for connect and each read
+            max_idle_per_host: Idle connections kept open per host
+            retries: Retries after the first attempt for transient failures
+            backoff: Base delay in seconds; attempt n waits up to backoff * 2**n
+            max_backoff: Upper bound for a single retry delay
+        """
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self.max_idle_per_host = max(1, max_idle_per_host)
+        self.retries = max(0, retries)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._idle = defaultdict(list)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stats = {}
+
+    def _host_stats(self, host: str) -> Dict:
+        stats = self._stats.get(host)
+        if stats is None:
+            stats = {
+                'requests': 0,
+                'errors': 0,
+                'retries': 0,
+                'connections_opened': 0,
+                'connections_reused': 0,
+                'bytes': 0,
+                'total_ms': 0.0
+            }
+            self._stats[host] = stats
+        return stats
+
+    def _checkout(self, scheme: str, host: str, port: Optional[int], reuse: bool = True):
+        """Get an idle pooled connection (if reuse is allowed), or open a new one"""
+        key = (scheme, host, port)
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle and reuse:
+                self._host_stats(host)['connections_reused'] += 1
+                return idle.pop()
+            self._host_stats(host)['connections_opened'] += 1
+
+        connection_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        return connection_class(host, port, timeout=self.timeout)
+
+    def _checkin(self, scheme: str, host: str, port: Optional[int], connection):
+        """Return a connection to the pool, closing it if the pool is full"""
+        key = (scheme, host, port)
+        with self._lock:
+            idle = self._idle[key]
+            if len(idle) < self.max_idle_per_host:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def _discard_idle(self, scheme: str, host: str, port: Optional[int]):
+        """Close every idle pooled connection to a host"""
+        with self._lock:
+            connections = self._idle.pop((scheme, host, port), [])
+        for connection in connections:
+            connection.close()
+
+    @staticmethod
+    def _decode(body: bytes, encoding: str) -> bytes:
+        encoding = (encoding or '').lower()
+        if encoding == 'gzip':
+            return gzip.decompress(body)
+        if encoding == 'deflate':
+            try:
+                return zlib.decompress(body)
+            except zlib.error:
+                return zlib.decompress(body, -zlib.MAX_WBITS)
+        if encoding == 'br' and brotli is not None:
+            return brotli.decompress(body)
+        return body
+
+    def _delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        if retry_after:
+            try:
+                return min(float(retry_after), self.MAX_RETRY_AFTER)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                body: Optional[bytes] = None, params: Optional[Dict] = None) -> HttpResponse:
+        """
+        Send a request, retrying transient failures and following redirects
+        
+        Args:
+            method: HTTP method
+            url: Absolute http(s) URL
+            headers: Extra request headers
+            body: Request body
+            params: Query parameters appended to the URL
+        
+        Returns:
+            HttpResponse for any status (including 304 and 4xx); its url is
+            the final URL after redirects
+        
+        Raises:
+            OSError / http.client.HTTPException: if every attempt failed to connect
+        """
+        if params:
+            url = f"{url}{'&' if '?' in url else '?'}{urlencode(params)}"
+
+        method = method.upper()
+        response = self._send(method, url, headers, body)
+        for _ in range(self.MAX_REDIRECTS):
+            location = response.headers.get('location')
+            if response.status not in self.REDIRECT_STATUSES or not location:
+                break
+            # 303, and 301/302 after a POST, are re-sent as a GET without the body
+            if response.status == 303 or (response.status in (301, 302) and method == 'POST'):
+                if method != 'HEAD':
+                    method = 'GET'
+                body = None
+            response = self._send(method, urljoin(response.url, location), headers, body)
+        return response
+
+    def _send(self, method: str, url: str, headers: Optional[Dict[str, str]],
+              body: Optional[bytes]) -> HttpResponse:
+        """Send a single request (no redirects), retrying transient failures"""
+        parts = urlsplit(url)
+        scheme, host, port = parts.scheme, parts.hostname, parts.port
+        path = parts.path or '/'
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        request_headers = {
+            'User-Agent': self.user_agent,
+            'Accept-Encoding': 'gzip, deflate, br' if brotli is not None else 'gzip, deflate',
+            'Connection': 'keep-alive'
+        }
+        request_headers.update(headers or {})
+
+        idempotent = method in self.IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            # A pooled connection may have been closed by the server while
+            # idle, and a non-idempotent request can't be re-sent on that
+            connection = self._checkout(scheme, host, port, reuse=idempotent)
+            reused = connection.sock is not None
+            start = time.perf_counter()
+            sent = False
+
+            try:
+                if not reused:
+                    connection.connect()
+                # From here on the server may have received the request
+                sent = True
+                connection.request(method, path, body=body, headers=request_headers)
+                raw = connection.getresponse()
+                payload = raw.read()
+            except (OSError, http.client.HTTPException) as e:
+                connection.close()
+                with self._lock:
+                    stats = self._host_stats(host)
+                    stats['errors'] += 1
+                    stats['total_ms'] += (time.perf_counter() - start) * 1000
+                # An unknown host won't resolve on the next attempt either
+                if isinstance(e, socket.gaierror) or attempt >= self.retries:
+                    raise
+                # Non-idempotent requests are only re-sent if they never left
+                if sent and not idempotent:
+                    raise
+                attempt += 1
+                with self._lock:
+                    self._host_stats(host)['retries'] += 1
+                # A pooled connection the server already closed: the others
+                # idled as long, so drop them and retry at once on a new one
+                if reused and isinstance(e, self.STALE_CONNECTION_ERRORS):
+                    self._discard_idle(scheme, host, port)
+                else:
+                    time.sleep(self._delay(attempt))
+                continue
+
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            response_headers = {name.lower(): value for name, value in raw.getheaders()}
+
+            if raw.will_close:
+                connection.close()
+            else:
+                self._checkin(scheme, host, port, connection)
+
+            with self._lock:
+                stats = self._host_stats(host)
+                stats['requests'] += 1
+                stats['bytes'] += len(payload)
+                stats['total_ms'] += elapsed_ms
+            self._local.bytes = getattr(self._local, 'bytes', 0) + len(payload)
+
+            # A 429 with Retry-After was rejected unprocessed; other
+            # statuses are only retried for idempotent requests
+            retry_after = response_headers.get('retry-after')
+            retryable = idempotent or (raw.status == 429 and retry_after)
+            if raw.status in self.RETRY_STATUSES and retryable and attempt < self.retries:
+                attempt += 1
+                with self._lock:
+                    self._host_stats(host)['retries'] += 1
+                time.sleep(self._delay(attempt, retry_after))
+                continue
+
+            return HttpResponse(
+                url,
+                raw.status,
+                response_headers,
+                self._decode(payload, response_headers.get('content-encoding'))
+            )
+
+    def get(self, url: str, params: Optional[Dict] = None,
+            headers: Optional[Dict[str, str]] = None) -> HttpResponse:
+        """Send a GET request"""
+        return self.request('GET', url, headers=headers, params=params)
+
+    def get_text(self, url: str, params: Optional[Dict] = None,
+                 headers: Optional[Dict[str, str]] = None) -> str:
+        """GET a URL and return the body as text, raising HttpError if not 2xx"""
+        response = self.get(url, params, headers)
+        if not response.ok:
+            raise HttpError(response.status, url)
+        return response.text
+
+    def get_json(self, url: str, params: Optional[Dict] = None,
+                 headers: Optional[Dict[str, str]] = None):
+        """GET a URL and decode the JSON body, raising HttpError if not 2xx"""
+        request_headers = {'Accept': 'application/json'}
+        request_headers.update(headers or {})
+        response = self.get(url, params, request_headers)
+        if not response.ok:
+            raise HttpError(response.status, url)
+        return response.json()
+
+    def thread_bytes(self) -> int:
+        """Total bytes downloaded by the calling thread (for per-board telemetry)"""
+        return getattr(self._local, 'bytes', 0)
+
+    def host_stats(self) -> Dict[str, Dict]:
+        """Per-host request counts, retries, connection reuse and average latency"""
+        with self._lock:
+            report = {}
+            for host, stats in self._stats.items():
+                entry = dict(stats)
+                attempts = stats['requests'] + stats['errors']
+                entry['avg_ms'] = round(stats['total_ms'] / attempts, 1) if attempts else 0.0
+                entry['total_ms'] = round(stats['total_ms'], 1)
+                report[host] = entry
+            return report
+
+    def close(self):
+        """Close every pooled connection"""
+        with self._lock:
+            connections: List = [conn for idle in self._idle.values() for conn in idle]
+            self._idle.clear()
+        for connection in connections:
+            connection.close()
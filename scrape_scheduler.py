@@ -0,0 +1,176 @@
+"""
+Adaptive Scrape Scheduler for Web3 Job Board
+Gives each board its own polling interval based on how often it changes
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+
+class ScrapeScheduler:
+    """
+    Decides which boards are due and updates their schedules after a run
+    
+    Each board has its own interval: it halves (down to min_interval) when
+    a scrape finds new jobs and doubles (up to max_interval) when it finds
+    none, so busy boards are polled often and quiet boards back off. Failed
+    scrapes are retried sooner without changing the interval.
+    """
+
+    DEFAULT_INTERVAL_MINUTES = 24 * 60
+    MIN_INTERVAL_MINUTES = 60
+    MAX_INTERVAL_MINUTES = 7 * 24 * 60
+    BACKOFF = 2.0
+
+    # Weight of the latest observation in the smoothed change rate
+    RATE_SMOOTHING = 0.3
+
+    # Assumed cost of a board that has no telemetry yet
+    DEFAULT_BOARD_SECONDS = 30.0
+
+    def __init__(self, db, min_interval_minutes: float = MIN_INTERVAL_MINUTES,
+                 max_interval_minutes: float = MAX_INTERVAL_MINUTES, backoff: float = BACKOFF):
+        """
+        Initialize the scheduler
+        
+        Args:
+            db: Database instance
+            min_interval_minutes: Shortest polling interval for any board
+            max_interval_minutes: Longest polling interval for any board
+            backoff: Factor the interval grows (quiet) or shrinks (busy) by
+        """
+        self.db = db
+        self.min_interval = min_interval_minutes
+        self.max_interval = max_interval_minutes
+        self.backoff = backoff
+
+    def due_companies(self, now: Optional[datetime] = None) -> List[Dict]:
+        """
+        Get active companies whose board is due, highest priority first
+        
+        Boards never scraped under the scheduler come first, then boards
+        with the highest observed change rate, then the most overdue.
+        
+        Returns:
+            Company dictionaries, each with its `schedule` (or None)
+        """
+        now = (now or datetime.now()).isoformat()
+        schedules = self.db.get_company_schedules()
+
+        due = []
+        for company in self.db.get_all_companies(active_only=True):
+            schedule = schedules.get(company['id'])
+            if schedule is None or schedule['next_due_at'] <= now:
+                due.append(dict(company, schedule=schedule))
+
+        due.sort(key=lambda company: (
+            company['schedule'] is not None,
+            -(company['schedule'] or {}).get('change_rate', 0.0),
+            (company['schedule'] or {}).get('next_due_at', '')
+        ))
+        return due
+
+    def plan(self, budget_seconds: float, workers: int = 1, now: Optional[datetime] = None) -> List[Dict]:
+        """
+        Pick the due boards that fit in a time budget
+        
+        Each board's cost is its average scrape time from recent telemetry.
+        Boards are taken in priority order; one that doesn't fit is left
+        due for the next run.
+        
+        Args:
+            budget_seconds: Wall-clock time available for scraping
+            workers: Number of boards scraped in parallel
+            now: Current time (defaults to now)
+        
+        Returns:
+            Company dictionaries to scrape, in priority order
+        """
+        costs = self.db.get_board_costs()
+        capacity = budget_seconds * max(1, workers)
+
+        planned = []
+        used = 0.0
+        for company in self.due_companies(now):
+            cost = costs.get(company['id'], self.DEFAULT_BOARD_SECONDS)
+            if used + cost > capacity and planned:
+                continue
+            planned.append(company)
+            used += cost
+
+        return planned
+
+    def record_run(self, summary: Dict, now: Optional[datetime] = None) -> int:
+        """
+        Update the schedules of every board scraped in a run
+        
+        Args:
+            summary: Summary returned by JobBoardOrchestrator.scrape_all_boards
+            now: Time the run finished (defaults to now)
+        
+        Returns:
+            Number of schedules updated
+        """
+        now = now or datetime.now()
+        schedules = self.db.get_company_schedules()
+        updates = []
+
+        for stats in summary.get('company_stats', []):
+            schedule = schedules.get(stats['company_id']) or {
+                'company_id': stats['company_id'],
+                'interval_minutes': float(self.DEFAULT_INTERVAL_MINUTES),
+                'change_rate': 0.0,
+                'failures': 0,
+                'last_scraped_at': None,
+                'last_changed_at': None
+            }
+            updates.append(self.next_schedule(schedule, stats, now))
+
+        self.db.save_company_schedules(updates)
+        return len(updates)
+
+    def next_schedule(self, schedule: Dict, stats: Dict, now: datetime) -> Dict:
+        """
+        Compute a board's new schedule from the outcome of one scrape
+        
+        Args:
+            schedule: Current schedule row
+            stats: The board's telemetry from the run (status, jobs_new, ...)
+            now: Time the run finished
+        
+        Returns:
+            Updated schedule row
+        """
+        schedule = dict(schedule)
+        interval = schedule['interval_minutes']
+
+        if stats.get('status') in ('failed', 'skipped'):
+            schedule['failures'] += 1
+            retry = min(interval, self.min_interval * 2 ** schedule['failures'])
+            schedule['next_due_at'] = (now + timedelta(minutes=retry)).isoformat()
+            return schedule
+
+        new_jobs = stats.get('jobs_new', 0)
+
+        # Smoothed new jobs per day since the previous scrape
+        if schedule['last_scraped_at']:
+            elapsed = now - datetime.fromisoformat(schedule['last_scraped_at'])
+            elapsed_days = max(elapsed.total_seconds() / 86400, self.min_interval / 1440)
+        else:
+            elapsed_days = interval / 1440
+        schedule['change_rate'] = (
+            self.RATE_SMOOTHING * (new_jobs / elapsed_days)
+            + (1 - self.RATE_SMOOTHING) * schedule['change_rate']
+        )
+
+        if new_jobs > 0:
+            interval = max(self.min_interval, interval / self.backoff)
+            schedule['last_changed_at'] = now.isoformat()
+        else:
+            interval = min(self.max_interval, interval * self.backoff)
+
+        schedule['interval_minutes'] = interval
+        schedule['failures'] = 0
+        schedule['last_scraped_at'] = now.isoformat()
+        schedule['next_due_at'] = (now + timedelta(minutes=interval)).isoformat()
+        return schedule
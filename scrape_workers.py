@@ -0,0 +1,190 @@
+"""
+Multi-Process Scraping for Web3 Job Board
+Shards a scrape across worker processes that claim boards from a lease table
+"""
+
+import os
+import time
+import uuid
+import multiprocessing
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from database import Database
+
+
+def run_worker(db_path: str, run_token: str, worker_id: str, lease_seconds: float = 120,
+               deadline: Optional[float] = None, use_fetch_cache: bool = True):
+    """
+    Entry point of a worker process
+    
+    Opens its own WAL-mode connection and scrapes leased boards until the
+    run has none left. Writes are short transactions; SQLite's busy
+    timeout queues them behind the other workers.
+    """
+    from scraper_orchestrator import JobBoardOrchestrator
+
+    db = Database(db_path, production=True, query_cache_size=0)
+    try:
+        orchestrator = JobBoardOrchestrator(db, use_fetch_cache=use_fetch_cache)
+        scraped = orchestrator.scrape_leased_boards(run_token, worker_id, lease_seconds, deadline)
+        print(f"👷 Worker {worker_id} finished {scraped} boards")
+        orchestrator.transport.close()
+    finally:
+        db.close()
+
+
+class ScrapeWorkerPool:
+    """Runs a scrape across several processes and merges their results"""
+
+    def __init__(self, db: Database, processes: int = 2, lease_seconds: float = 120,
+                 use_fetch_cache: bool = True):
+        """
+        Initialize the pool
+        
+        Args:
+            db: Database instance (should be in production/WAL mode)
+            processes: Number of worker processes
+            lease_seconds: How long a board stays claimed without a heartbeat
+            use_fetch_cache: Skip boards whose listing hasn't changed
+        """
+        self.db = db
+        self.processes = max(1, processes)
+        self.lease_seconds = lease_seconds
+        self.use_fetch_cache = use_fetch_cache
+        # spawn, not fork: workers must not inherit open SQLite connections
+        self.context = multiprocessing.get_context('spawn')
+
+    def _start_worker(self, run_token: str, number: int, deadline: Optional[float]):
+        worker_id = f"{os.getpid()}-{number}"
+        process = self.context.Process(
+            target=run_worker,
+            args=(self.db.db_path, run_token, worker_id, self.lease_seconds, deadline, self.use_fetch_cache),
+            name=f"scrape-worker-{number}"
+        )
+        process.worker_id = worker_id
+        process.start()
+        return process
+
+    def _has_claimable(self, run_token: str) -> bool:
+        return any(lease['status'] in ('queued', 'leased') for lease in self.db.get_scrape_leases(run_token))
+
+    def scrape_all_boards(self, companies: List[Dict], deadline: Optional[float] = None) -> Dict:
+        """
+        Scrape all given boards across worker processes
+        
+        When a worker crashes, its lease is expired at once so the board can
+        be claimed again, and the worker is replaced while boards remain.
+        
+        Args:
+            companies: List of company configurations from companies table
+            deadline: Optional time.monotonic() value after which no new
+                boards are claimed (the rest are counted as deferred)
+        
+        Returns:
+            Summary dictionary in the same format as
+            JobBoardOrchestrator.scrape_all_boards
+        """
+        print(f"\n🚀 Starting scrape of {len(companies)} companies ({self.processes} processes)...\n")
+
+        run_token = uuid.uuid4().hex
+        self.db.create_scrape_leases(run_token, [company['id'] for company in companies])
+
+        # Worker processes compare against the wall clock
+        wall_deadline = time.time() + (deadline - time.monotonic()) if deadline is not None else None
+
+        started = 0
+        workers = []
+        for _ in range(min(self.processes, len(companies))):
+            workers.append(self._start_worker(run_token, started, wall_deadline))
+            started += 1
+
+        try:
+            while workers:
+                workers[0].join(timeout=1.0)
+                alive = [process for process in workers if process.is_alive()]
+                crashed = [process for process in workers if not process.is_alive() and process.exitcode != 0]
+                workers = alive
+
+                # Its board would otherwise stay leased for lease_seconds
+                for process in crashed:
+                    self.db.expire_scrape_leases(run_token, process.worker_id)
+
+                # Replace crashed workers, up to one restart per process slot
+                for _ in crashed:
+                    if started >= self.processes * 2 or not self._has_claimable(run_token):
+                        break
+                    if wall_deadline is not None and time.time() >= wall_deadline:
+                        break
+                    print("⚠️  A scraper process exited unexpectedly; starting a replacement")
+                    workers.append(self._start_worker(run_token, started, wall_deadline))
+                    started += 1
+        finally:
+            for process in workers:
+                process.join()
+
+        summary = self.merge_results(self.db.get_scrape_leases(run_token))
+        self.db.delete_scrape_leases(run_token)
+
+        print(f"\n✨ Scraping Complete!")
+        print(f"   📊 Total jobs scraped: {summary['total_scraped']}")
+        print(f"   🆕 New jobs added: {summary['new_jobs_added']}")
+        print(f"   ⏭️  Duplicates skipped: {summary['duplicates_skipped']}")
+        print(f"   🔁 Near-duplicates skipped: {summary['near_duplicates_skipped']}")
+        print(f"   🔒 Jobs closed: {summary['jobs_closed']}")
+        print(f"   📄 Detail pages skipped: {summary['details_skipped']}")
+        print(f"   📋 Companies processed: {summary['boards_processed']}")
+        print(f"   ⏸️  Unchanged boards skipped: {summary['boards_unchanged']}")
+        print(f"   ⏳ Boards deferred (time budget): {summary['boards_deferred']}\n")
+
+        return summary
+
+    @staticmethod
+    def merge_results(leases: List[Dict]) -> Dict:
+        """
+        Build a run summary from the per-board results stored on the leases
+        
+        Boards never claimed are deferred; boards whose every worker died
+        are reported as failed.
+        """
+        company_stats = []
+        summary = {
+            'total_scraped': 0,
+            'duplicates_skipped': 0,
+            'new_jobs_added': 0,
+            'boards_processed': 0,
+            'boards_unchanged': 0,
+            'boards_deferred': 0,
+            'near_duplicates_skipped': 0,
+            'jobs_closed': 0,
+            'details_skipped': 0,
+            'timestamp': datetime.now().isoformat(),
+            'company_stats': company_stats
+        }
+
+        for lease in leases:
+            if lease['status'] == 'queued':
+                summary['boards_deferred'] += 1
+                continue
+
+            summary['boards_processed'] += 1
+            stats = lease['result']
+            if not stats:
+                company_stats.append({
+                    'company_id': lease['company_id'],
+                    'status': 'failed',
+                    'error': f"Lease abandoned after {lease['attempts']} attempts"
+                })
+                continue
+
+            summary['total_scraped'] += stats.pop('jobs_written', 0)
+            summary['jobs_closed'] += stats.pop('jobs_closed', 0)
+            summary['new_jobs_added'] += stats.get('jobs_new', 0)
+            summary['duplicates_skipped'] += stats.get('jobs_duplicate', 0)
+            summary['near_duplicates_skipped'] += stats.get('jobs_near_duplicate', 0)
+            summary['details_skipped'] += stats.get('details_skipped', 0)
+            if stats.get('status') == 'unchanged':
+                summary['boards_unchanged'] += 1
+            company_stats.append(stats)
+
+        return summary
@@ -5,10 +5,21 @@ Automatically detects ATS type and runs specialized scrapers
 
 import re
 import json
+import inspect
+import queue
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 import hashlib
 
+from compensation import parse_compensation, format_compensation
+from fingerprint import NearDuplicateIndex, job_fingerprint, posting_key
+from http_transport import HttpTransport
+from ats_api import API_SCRAPERS, FeedUnavailable
+
 # Import specialized scrapers
 from scrapers.lever_scraper import LeverScraper
 from scrapers.greenhouse_scraper import GreenhouseScraper
@@ -36,17 +47,64 @@ class JobBoardOrchestrator:
         'workable': WorkableScraper
     }
     
-    def __init__(self, db_connection):
+    STREAM_CHUNK_SIZE = 100
+    REQUEST_TIMEOUT = 20
+    USER_AGENT = 'Mozilla/5.0 (compatible; Web3JobBoardBot/1.0)'
+    
+    def __init__(self, db_connection, max_workers: int = 1, per_host_limit: int = 2,
+                 insert_chunk_size: int = 500, use_fetch_cache: bool = True,
+                 queue_size: int = 8, transport: Optional[HttpTransport] = None,
+                 use_ats_api: bool = True, api_base_urls: Optional[Dict[str, str]] = None):
         """
         Initialize the orchestrator
         
         Args:
             db_connection: Database connection object
+            max_workers: Maximum number of boards fetched at the same time
+                (1 keeps the original sequential behaviour)
+            per_host_limit: Maximum concurrent fetches against one ATS host
+            insert_chunk_size: Number of jobs written per database transaction
+            use_fetch_cache: Send each board's stored ETag / Last-Modified /
+                digest to scrapers that make conditional requests, and skip
+                boards they report unchanged
+            queue_size: Maximum number of job chunks waiting for the writer;
+                scrapers block when it is full
+            transport: Shared HTTP transport (a pooled one is created if
+                not given); passed to every scraper that accepts it
+            use_ats_api: Pull Lever, Greenhouse and Ashby boards from their
+                public JSON feeds, falling back to SCRAPER_MAP scrapers
+            api_base_urls: Optional API base URL per ATS type, e.g. to
+                serve recorded feeds locally
         """
         self.db = db_connection
+        self.max_workers = max(1, max_workers)
+        self.per_host_limit = max(1, per_host_limit)
+        self.insert_chunk_size = insert_chunk_size
+        self.use_fetch_cache = use_fetch_cache
+        self.queue_size = max(1, queue_size)
+        self.use_ats_api = use_ats_api
+        self.api_base_urls = api_base_urls or {}
+        self.transport = transport or HttpTransport(
+            user_agent=self.USER_AGENT,
+            timeout=self.REQUEST_TIMEOUT,
+            max_idle_per_host=self.per_host_limit
+        )
+        self.fetch_cache = {}
+        self._accepts_transport = {}
+        self.known_hashes = {}
         self.scraped_jobs = []
         self.duplicate_count = 0
         self.new_jobs_count = 0
+        self.unchanged_count = 0
+        self.near_duplicate_count = 0
+        self.closed_count = 0
+        self.deferred_count = 0
+        self.details_skipped_count = 0
+        self.failed_insert_companies = set()
+        self.seen_hashes = set()
+        self.board_listings = {}
+        self.seen_fingerprints = NearDuplicateIndex()
+        self.company_stats = {}
         
     def detect_ats_type(self, url: str) -> Optional[str]:
         """
@@ -100,147 +158,860 @@ class JobBoardOrchestrator:
         Returns:
             Compensation string or None
         """
-        # Common compensation patterns
-        patterns = [
-            r'\$\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*(?:-|to)\s*\$?\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*(?:k|K)?',
-            r'\$\s*(\d{1,3})\s*[kK]\s*(?:-|to)\s*\$?\s*(\d{1,3})\s*[kK]',
-            r'(\d{1,3})\s*[kK]\s*(?:-|to)\s*(\d{1,3})\s*[kK]',
-            r'\$\s*(\d{1,3}(?:,\d{3})*)\s*(?:-|to)\s*\$?\s*(\d{1,3}(?:,\d{3})*)',
-        ]
+        compensation = parse_compensation(f"{title} {description}")
+        return format_compensation(compensation) if compensation else None
+    
+    def apply_compensation(self, job: Dict):
+        """
+        Fill a job's structured salary columns, and its display salary if missing
         
-        text = f"{title} {description}"
+        The scraper's own salary string is preferred; the title and
+        description are only parsed when it is absent or unparseable.
         
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                low = match.group(1).replace(',', '')
-                high = match.group(2).replace(',', '')
-                
-                # Convert to k format if needed
-                if len(low) > 3:
-                    low = f"{int(low)//1000}k"
-                    high = f"{int(high)//1000}k"
-                else:
-                    low = f"{low}k"
-                    high = f"{high}k"
-                    
-                return f"${low} - ${high}"
+        Args:
+            job: Job dictionary, updated in place
+        """
+        compensation = parse_compensation(job.get('salary') or '')
+        if not compensation:
+            compensation = parse_compensation(
+                f"{job.get('title', '')} "
+                f"{job.get('full_description') or job.get('description', '')}"
+            )
         
-        return None
+        if not compensation:
+            return
+        
+        job.update(compensation)
+        if not job.get('salary'):
+            job['salary'] = format_compensation(compensation)
     
-    def scrape_job_board(self, company_config: Dict) -> List[Dict]:
+    def get_host_key(self, company_config: Dict) -> str:
         """
-        Scrape a single job board
+        Get the ATS host a board is served from, used for per-host throttling
+        
+        Args:
+            company_config: Dictionary containing company info
+            
+        Returns:
+            ATS type string, or 'unknown' if not recognized
+        """
+        return (company_config.get('ats_type')
+                or self.detect_ats_type(company_config['job_board_url'])
+                or 'unknown')
+    
+    def get_company_stats(self, company_config: Dict) -> Dict:
+        """
+        Get (creating if needed) the telemetry record of a company for this run
+        
+        Stage times are wall-clock milliseconds: fetch is time spent waiting
+        on the ATS scraper (its requests, and for HTML scrapers the parsing
+        interleaved with them, including consuming lazily yielded jobs),
+        parse is decoding that scrapers time separately (the JSON feed
+        scrapers report it as `parse_ms`), then dedup, compensation
+        extraction and the company's share of each batched insert.
+        """
+        stats = self.company_stats.get(company_config['id'])
+        if stats is None:
+            stats = {
+                'company_id': company_config['id'],
+                'company_name': company_config['name'],
+                'ats_type': company_config.get('ats_type'),
+                'status': 'pending',
+                'fetch_ms': 0.0,
+                'parse_ms': 0.0,
+                'dedup_ms': 0.0,
+                'compensation_ms': 0.0,
+                'insert_ms': 0.0,
+                'http_bytes': 0,
+                'jobs_found': 0,
+                'jobs_new': 0,
+                'jobs_duplicate': 0,
+                'jobs_near_duplicate': 0,
+                'details_skipped': 0,
+                'error': None
+            }
+            self.company_stats[company_config['id']] = stats
+        return stats
+    
+    def create_scraper(self, scraper_class, url: str, company_name: str):
+        """
+        Instantiate an ATS scraper, sharing the transport if it accepts one
+        
+        Scrapers opt in with a `transport` keyword argument; older ones
+        that do their own HTTP are created exactly as before.
+        """
+        accepts = self._accepts_transport.get(scraper_class)
+        if accepts is None:
+            try:
+                accepts = 'transport' in inspect.signature(scraper_class).parameters
+            except (TypeError, ValueError):
+                accepts = False
+            self._accepts_transport[scraper_class] = accepts
+        
+        if accepts:
+            return scraper_class(url, company_name, '', transport=self.transport)
+        return scraper_class(url, company_name, '')
+    
+    def fetch_job_board(self, company_config: Dict) -> Dict:
+        """
+        Run the ATS scraper for a single job board
+        
+        Only talks to the network, never to the database, so it is safe to
+        call from worker threads.
+        
+        Lever, Greenhouse and Ashby boards are first pulled from their JSON
+        feeds (ats_api.py) in one request; the SCRAPER_MAP scraper only runs
+        if the feed is unavailable.
+        
+        Scrapers that provide `scrape_conditional(validators)` are sent the
+        board's stored validators (ETag, Last-Modified, content digest) and
+        make the request conditional themselves; they return None when the
+        board is unchanged, else (jobs, new validators). The validators are
+        saved once the jobs are stored.
+        
+        Scrapers that provide `scrape_listings()` (cheap: job_url, title,
+        location per posting) and `scrape_details(listings)` (full jobs for
+        the given listings) are run in two phases: detail pages are only
+        fetched for listings whose hash isn't in known_hashes. Other
+        scrapers fall back to a single `scrape()`.
         
         Args:
             company_config: Dictionary containing company info (from companies table)
             
         Returns:
-            List of scraped job dictionaries
+            Dictionary with `ats_type`, `jobs` (the raw jobs returned by the
+            scraper, which may be a lazy iterator), `status` ('scraped',
+            'unchanged' or 'skipped'), `validators` (fetch cache entry to
+            store once the jobs are saved), `known_hashes` (listed jobs
+            whose details were skipped) and `stats` (fetch_ms, parse_ms
+            and http_bytes measured on the worker; http_bytes is filled in
+            by the caller once it has consumed the jobs, which may be lazy)
         """
         url = company_config['job_board_url']
         company_name = company_config['name']
-        company_id = company_config['id']
+        stats = {'fetch_ms': 0.0, 'parse_ms': 0.0, 'http_bytes': 0}
+        result = {'ats_type': None, 'jobs': [], 'status': 'skipped', 'validators': None,
+                  'known_hashes': [], 'stats': stats}
         
         # Detect ATS type
         ats_type = company_config.get('ats_type') or self.detect_ats_type(url)
         
         if not ats_type:
             print(f"⚠️  Unknown ATS type for {url}")
-            return []
+            return result
         
-        print(f"🔍 Scraping {company_name} ({ats_type.upper()} ATS)")
+        result['ats_type'] = ats_type
         
-        # Get appropriate scraper
+        # Get appropriate scraper (the JSON feed is preferred when there is one)
         scraper_class = self.SCRAPER_MAP.get(ats_type)
-        if not scraper_class:
+        api_class = API_SCRAPERS.get(ats_type) if self.use_ats_api else None
+        if not scraper_class and not api_class:
             print(f"❌ No scraper available for {ats_type}")
-            return []
+            return result
+        
+        if api_class:
+            api_scraper = api_class(url, company_name, '', transport=self.transport,
+                                    base_url=self.api_base_urls.get(ats_type))
+            try:
+                self.run_scraper(company_config, api_scraper, result)
+                if result['status'] == 'scraped':
+                    print(f"🔍 Scraped {company_name} from the {ats_type.upper()} API")
+                return result
+            except FeedUnavailable as e:
+                if not scraper_class:
+                    raise
+                print(f"↩️  {company_name}: {ats_type} feed unavailable ({e}), using board scraper")
+        
+        print(f"🔍 Scraping {company_name} ({ats_type.upper()} ATS)")
         
         # Initialize and run scraper (without logo parameter)
-        scraper = scraper_class(url, company_name, '')
-        jobs = scraper.scrape()
+        scraper = self.create_scraper(scraper_class, url, company_name)
+        self.run_scraper(company_config, scraper, result)
+        return result
+    
+    def run_scraper(self, company_config: Dict, scraper, result: Dict):
+        """
+        Run one scraper the cheapest way it supports, filling in `result`
+        
+        Conditional scrapers are tried first, then two-phase scrapers, then
+        a plain `scrape()` (see fetch_job_board).
+        """
+        stats = result['stats']
+        start = time.perf_counter()
+        parse_start = getattr(scraper, 'parse_ms', 0.0)
+        try:
+            if self.use_fetch_cache and hasattr(scraper, 'scrape_conditional'):
+                scraped = scraper.scrape_conditional(self.fetch_cache.get(company_config['id']) or {})
+                if scraped is None:
+                    print(f"⏸️  {company_config['name']} unchanged since last scrape")
+                    result['status'] = 'unchanged'
+                    return
+                result['jobs'], result['validators'] = scraped
+            elif hasattr(scraper, 'scrape_listings') and hasattr(scraper, 'scrape_details'):
+                known = self.known_hashes.get(company_config['id'], set())
+                new_listings = []
+                for listing in scraper.scrape_listings():
+                    job_hash = self.generate_job_hash(listing['job_url'])
+                    if job_hash in known:
+                        result['known_hashes'].append(job_hash)
+                    else:
+                        new_listings.append(listing)
+                result['jobs'] = scraper.scrape_details(new_listings) if new_listings else []
+            else:
+                result['jobs'] = scraper.scrape()
+            result['status'] = 'scraped'
+        finally:
+            # Scrapers that time their own decoding report it as parse_ms;
+            # the rest of the call is their requests (and HTML parsing)
+            parse_ms = getattr(scraper, 'parse_ms', 0.0) - parse_start
+            stats['parse_ms'] += parse_ms
+            stats['fetch_ms'] += (time.perf_counter() - start) * 1000 - parse_ms
+    
+    def record_board_result(self, company_config: Dict, result: Optional[Dict],
+                            error: Optional[Exception] = None):
+        """Merge a finished board's worker-side measurements into its telemetry"""
+        stats = self.get_company_stats(company_config)
         
-        print(f"✅ Scraped {len(jobs)} jobs from {company_name}")
+        if error is not None:
+            stats['status'] = 'failed'
+            stats['error'] = str(error)
+        
+        if result:
+            stats['ats_type'] = result['ats_type'] or stats['ats_type']
+            for key in ('fetch_ms', 'parse_ms', 'http_bytes'):
+                stats[key] += result['stats'][key]
+            # A board whose rows failed to insert stays failed
+            if error is None and company_config['id'] not in self.failed_insert_companies:
+                stats['status'] = result['status']
+            
+            # Listings skipped before the detail phase are still on the board
+            known = result.get('known_hashes') or []
+            if known:
+                self.get_board_listing(company_config)['hashes'].update(known)
+                stats['jobs_found'] += len(known)
+                stats['jobs_duplicate'] += len(known)
+                stats['details_skipped'] += len(known)
+                self.duplicate_count += len(known)
+                self.details_skipped_count += len(known)
+    
+    def get_board_listing(self, company_config: Dict) -> Dict:
+        """
+        Get (creating if needed) what has been seen on a company's board this run
+        
+        Holds every job hash on the board (new or not), near-duplicate
+        candidates waiting for the full listing, and whether every chunk was
+        processed.
+        """
+        listing = self.board_listings.get(company_config['id'])
+        if listing is None:
+            listing = {'hashes': set(), 'near_duplicates': [], 'complete': True}
+            self.board_listings[company_config['id']] = listing
+        return listing
+    
+    def reconcile_board(self, company_config: Dict, result: Dict) -> int:
+        """
+        Close stored jobs that have disappeared from a board
+        
+        Skipped unless the board was actually scraped, every chunk was
+        processed and it listed at least one job; an empty listing is more
+        likely a broken scraper than a company with no openings.
+        
+        Returns:
+            Number of jobs closed
+        """
+        listing = self.board_listings.pop(company_config['id'], None)
+        if result['status'] != 'scraped' or not listing or not listing['complete'] or not listing['hashes']:
+            return 0
+        
+        changes = self.db.reconcile_board_jobs(company_config['id'], listing['hashes'])
+        if changes['closed'] or changes['reopened']:
+            print(f"🔒 {company_config['name']}: closed {changes['closed']}, reopened {changes['reopened']} jobs")
+        
+        self.closed_count += changes['closed']
+        return changes['closed']
+    
+    def process_jobs(self, company_config: Dict, ats_type: str, jobs: Iterable[Dict]) -> List[Dict]:
+        """
+        Drop duplicates and enrich freshly scraped jobs for a single board
+        
+        Jobs that look like near-duplicates are held back until the board is
+        finished; see resolve_near_duplicates.
+        
+        Args:
+            company_config: Dictionary containing company info (from companies table)
+            ats_type: ATS type the jobs were scraped from
+            jobs: Raw job dictionaries returned by the scraper
+            
+        Returns:
+            List of new job dictionaries ready to be inserted
+        """
+        stats = self.get_company_stats(company_config)
+        listing = self.get_board_listing(company_config)
+        jobs = list(jobs)
+        stats['jobs_found'] += len(jobs)
+        
+        # Check the whole batch against the database in one query
+        start = time.perf_counter()
+        hashes = [self.generate_job_hash(job['job_url']) for job in jobs]
+        existing = self.db.get_existing_hashes(hashes)
+        listing['hashes'].update(hashes)
+        
+        # Check for duplicates, including repeats within this run
+        candidates = []
+        for job, job_hash in zip(jobs, hashes):
+            if job_hash in existing or job_hash in self.seen_hashes:
+                self.duplicate_count += 1
+                stats['jobs_duplicate'] += 1
+                continue
+            self.seen_hashes.add(job_hash)
+            candidates.append((job, job_hash))
+        
+        # Then for reposts and syndicated copies under a different URL
+        fingerprints = [
+            (job_fingerprint(job), posting_key(job.get('title'), job.get('company_name'), job.get('location')))
+            for job, _ in candidates
+        ]
+        near_duplicates = self.db.find_near_duplicates(fingerprints)
+        matched_hashes = self.db.get_job_hashes_by_id([match for match in near_duplicates if match is not None])
+        stats['dedup_ms'] += (time.perf_counter() - start) * 1000
         
         # Process each job
         processed_jobs = []
-        for job in jobs:
-            # Check for duplicates
-            if self.is_duplicate(job['job_url']):
-                self.duplicate_count += 1
+        for (job, job_hash), (fingerprint, posting), match in zip(candidates, fingerprints, near_duplicates):
+            if match is not None and match in matched_hashes:
+                listing['near_duplicates'].append((ats_type, job, job_hash, fingerprint, posting,
+                                                   match, matched_hashes[match]))
                 continue
             
-            # Set company_id
-            job['company_id'] = company_id
+            match_hash = self.seen_fingerprints.find(fingerprint, posting)
+            if match_hash is not None:
+                listing['near_duplicates'].append((ats_type, job, job_hash, fingerprint, posting,
+                                                   None, match_hash))
+                continue
             
-            # Extract compensation if not already present
-            if not job.get('salary'):
-                compensation = self.extract_compensation(
-                    job.get('full_description', job.get('description', '')),
-                    job.get('title', '')
-                )
-                if compensation:
-                    job['salary'] = compensation
+            processed_jobs.append(self.prepare_job(company_config, ats_type, job, job_hash, fingerprint, posting))
+        
+        return processed_jobs
+    
+    def resolve_near_duplicates(self, company_config: Dict) -> List[Dict]:
+        """
+        Decide the near-duplicate candidates of a finished board
+        
+        A candidate whose similar posting is still on this board's listing
+        is a distinct opening (same role, templated text) and is kept,
+        flagged with `near_duplicate_of`. Otherwise it is a repost or a copy
+        from another board and is skipped; the stored original of a repost
+        is moved to the repost's URL (see Database.move_reposted_jobs).
+        
+        Returns:
+            List of kept job dictionaries ready to be inserted
+        """
+        listing = self.get_board_listing(company_config)
+        stats = self.get_company_stats(company_config)
+        kept = []
+        moved = {}
+        reposts = []
+        
+        for ats_type, job, job_hash, fingerprint, posting, match_id, match_hash in listing['near_duplicates']:
+            # A second repost of the same original sits next to the first
+            match_hash = moved.get(match_id, match_hash)
+            if match_hash in listing['hashes']:
+                job['near_duplicate_of'] = match_hash
+                kept.append(self.prepare_job(company_config, ats_type, job, job_hash, fingerprint, posting))
+                continue
             
-            # Add metadata
-            job['job_hash'] = self.generate_job_hash(job['job_url'])
-            job['scraped_at'] = datetime.now().isoformat()
-            job['ats_type'] = ats_type
+            if match_id is not None:
+                moved[match_id] = job_hash
+                reposts.append((match_id, job_hash, job['job_url']))
+            self.near_duplicate_count += 1
+            stats['jobs_near_duplicate'] += 1
+        
+        listing['near_duplicates'] = []
+        self.db.move_reposted_jobs(company_config['id'], reposts)
+        return kept
+    
+    def prepare_job(self, company_config: Dict, ats_type: str, job: Dict, job_hash: str,
+                    fingerprint: int, posting: str) -> Dict:
+        """Enrich a new job with its company, compensation and scrape metadata"""
+        stats = self.get_company_stats(company_config)
+        
+        self.seen_fingerprints.add(job_hash, fingerprint, posting)
+        job['fingerprint'] = fingerprint
+        
+        # Set company_id
+        job['company_id'] = company_config['id']
+        
+        # Extract structured compensation (and display salary if not already present)
+        start = time.perf_counter()
+        self.apply_compensation(job)
+        stats['compensation_ms'] += (time.perf_counter() - start) * 1000
+        
+        # Add metadata
+        job['job_hash'] = job_hash
+        job['scraped_at'] = datetime.now().isoformat()
+        job['ats_type'] = ats_type
+        
+        self.new_jobs_count += 1
+        return job
+    
+    def scrape_job_board(self, company_config: Dict,
+                         pending_validators: Optional[List[Tuple[int, Dict]]] = None) -> List[Dict]:
+        """
+        Scrape a single job board
+        
+        The board's fetch validators are not saved here, since its jobs
+        aren't stored yet: they are appended to `pending_validators` for the
+        caller to save once the jobs are inserted (e.g. with _flush_jobs).
+        Without a list the board is simply fetched in full next time.
+        
+        Args:
+            company_config: Dictionary containing company info (from companies table)
+            pending_validators: Optional list collecting (company ID, validators)
             
-            processed_jobs.append(job)
-            self.new_jobs_count += 1
+        Returns:
+            List of scraped job dictionaries
+        """
+        if self.use_fetch_cache and company_config['id'] not in self.fetch_cache:
+            self.fetch_cache.update(self.db.get_board_fetch_cache([company_config['id']]))
+        if company_config['id'] not in self.known_hashes:
+            self.known_hashes.update(self.db.get_company_job_hashes([company_config['id']]))
         
-        return processed_jobs
+        bytes_start = self.transport.thread_bytes()
+        result = self.fetch_job_board(company_config)
+        
+        if result['status'] == 'unchanged':
+            result['stats']['http_bytes'] += self.transport.thread_bytes() - bytes_start
+            self.record_board_result(company_config, result)
+            self.unchanged_count += 1
+            return []
+        
+        jobs = []
+        if result['jobs']:
+            start = time.perf_counter()
+            scraped = list(result['jobs'])
+            result['stats']['fetch_ms'] += (time.perf_counter() - start) * 1000
+            print(f"✅ Scraped {len(scraped)} jobs from {company_config['name']}")
+            jobs = self.process_jobs(company_config, result['ats_type'], scraped)
+        result['stats']['http_bytes'] += self.transport.thread_bytes() - bytes_start
+        
+        self.record_board_result(company_config, result)
+        jobs.extend(self.resolve_near_duplicates(company_config))
+        self.reconcile_board(company_config, result)
+        
+        if result['validators'] and pending_validators is not None:
+            pending_validators.append((company_config['id'], result['validators']))
+        
+        return jobs
+    
+    def _put(self, out_queue: queue.Queue, item: tuple, cancel: threading.Event):
+        """Put an item on the pipeline queue, giving up if the run was cancelled"""
+        while not cancel.is_set():
+            try:
+                out_queue.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+    
+    def stream_board(self, company_config: Dict, out_queue: queue.Queue, cancel: threading.Event):
+        """
+        Scrape one board and stream its jobs to the writer in small chunks
+        
+        Runs on a worker thread. Scrapers may return a list or yield jobs
+        lazily; either way, at most STREAM_CHUNK_SIZE jobs are held here
+        before being handed to the bounded queue.
+        
+        Queue items are ('jobs', company, ats_type, chunk) followed by one
+        ('done', company, result, error) once the board is finished.
+        """
+        result = None
+        error = None
+        
+        try:
+            bytes_start = self.transport.thread_bytes()
+            result = self.fetch_job_board(company_config)
+            
+            chunk = []
+            count = 0
+            start = time.perf_counter()
+            for job in result['jobs']:
+                chunk.append(job)
+                count += 1
+                if len(chunk) >= self.STREAM_CHUNK_SIZE:
+                    # Time blocked on a full queue is not scraper time
+                    result['stats']['fetch_ms'] += (time.perf_counter() - start) * 1000
+                    self._put(out_queue, ('jobs', company_config, result['ats_type'], chunk), cancel)
+                    start = time.perf_counter()
+                    chunk = []
+            result['stats']['fetch_ms'] += (time.perf_counter() - start) * 1000
+            result['stats']['http_bytes'] += self.transport.thread_bytes() - bytes_start
+            
+            if chunk:
+                self._put(out_queue, ('jobs', company_config, result['ats_type'], chunk), cancel)
+            
+            if result['status'] == 'scraped':
+                print(f"✅ Scraped {count} jobs from {company_config['name']}")
+            
+            result['jobs'] = []
+            
+        except Exception as e:
+            error = e
+        
+        self._put(out_queue, ('done', company_config, result, error), cancel)
+    
+    def _dispatch_boards(self, companies: List[Dict], out_queue: queue.Queue, cancel: threading.Event,
+                         deadline: Optional[float] = None):
+        """
+        Run stream_board for every company on a thread pool
+        
+        Boards are handed out round-robin across ATS hosts so no host ever
+        has more than per_host_limit scrapes in flight. Once `deadline`
+        (a time.monotonic() value) passes, boards not yet started are
+        deferred. Puts a final ('finished', ...) item on the queue when
+        every started board is done.
+        
+        Before a board starts, its stored job hashes are loaded by the
+        writer thread (which owns the database) through a ('load', company,
+        event, None) item, so only the boards in flight have theirs in memory.
+        """
+        pending = {}
+        for company in companies:
+            pending.setdefault(self.get_host_key(company), deque()).append(company)
+        
+        in_flight = {}
+        host_load = defaultdict(int)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                while (pending or in_flight) and not cancel.is_set():
+                    if deadline is not None and pending and time.monotonic() >= deadline:
+                        self.deferred_count += sum(len(boards) for boards in pending.values())
+                        pending.clear()
+                        if not in_flight:
+                            break
+                    
+                    # Fill free worker slots, one board per host per pass
+                    submitted = True
+                    while submitted and len(in_flight) < self.max_workers:
+                        submitted = False
+                        for host in list(pending):
+                            if len(in_flight) >= self.max_workers:
+                                break
+                            if host_load[host] >= self.per_host_limit:
+                                continue
+                            
+                            company = pending[host].popleft()
+                            if not pending[host]:
+                                del pending[host]
+                            
+                            if not self._load_known_hashes(company, out_queue, cancel):
+                                return
+                            future = pool.submit(self.stream_board, company, out_queue, cancel)
+                            in_flight[future] = host
+                            host_load[host] += 1
+                            submitted = True
+                    
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    
+                    for future in done:
+                        host_load[in_flight.pop(future)] -= 1
+        finally:
+            self._put(out_queue, ('finished', None, None, None), cancel)
+    
+    def _load_known_hashes(self, company_config: Dict, out_queue: queue.Queue,
+                           cancel: threading.Event) -> bool:
+        """Have the writer thread load a board's known hashes; False if the run was cancelled"""
+        loaded = threading.Event()
+        self._put(out_queue, ('load', company_config, loaded, None), cancel)
+        while not loaded.wait(timeout=0.5):
+            if cancel.is_set():
+                return False
+        return True
+    
+    def _flush_jobs(self, buffer: List[Dict], pending_validators: List[Tuple[int, Dict]]) -> int:
+        """
+        Write buffered jobs in one bulk insert, then record fetch validators
+        
+        Boards with rows that failed to write are marked failed and keep
+        their old validators, so the next run scrapes them again.
+        
+        Returns:
+            Number of jobs written
+        """
+        written = 0
+        
+        if buffer:
+            start = time.perf_counter()
+            results = self.db.insert_jobs_bulk(buffer, chunk_size=self.insert_chunk_size)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            
+            # Charge each company its share of the batch
+            share_ms = elapsed_ms / len(buffer)
+            for job, job_id in zip(buffer, results):
+                if job_id == self.db.INSERT_FAILED:
+                    self.new_jobs_count -= 1
+                    self.failed_insert_companies.add(job['company_id'])
+                elif job_id is None:
+                    # Rows that lost a race on job_hash were duplicates after all
+                    self.new_jobs_count -= 1
+                    self.duplicate_count += 1
+                else:
+                    written += 1
+                
+                stats = self.company_stats.get(job['company_id'])
+                if stats is None:
+                    continue
+                stats['insert_ms'] += share_ms
+                if job_id == self.db.INSERT_FAILED:
+                    stats['status'] = 'failed'
+                    stats['error'] = 'Jobs failed to insert'
+                elif job_id is None:
+                    stats['jobs_duplicate'] += 1
+                else:
+                    stats['jobs_new'] += 1
+        
+        # Only remember listings once their jobs are safely stored
+        for company_id, validators in pending_validators:
+            if company_id not in self.failed_insert_companies:
+                self.db.save_board_fetch_cache(company_id, validators)
+        
+        buffer.clear()
+        pending_validators.clear()
+        return written
     
-    def scrape_all_boards(self, companies: List[Dict]) -> Dict:
+    def scrape_all_boards(self, companies: List[Dict], deadline: Optional[float] = None) -> Dict:
         """
         Scrape all configured job boards
         
+        Works as a streaming pipeline: worker threads scrape boards and push
+        jobs through a bounded queue to this thread, which dedups them and
+        commits them in batches of insert_chunk_size. Memory stays flat
+        however many boards there are, and jobs land in the database while
+        scraping is still going. All database access stays on this thread.
+        
         Args:
             companies: List of company configurations from companies table
+            deadline: Optional time.monotonic() value after which no new
+                boards are started (the rest are counted as deferred)
             
         Returns:
             Summary dictionary with statistics
         """
-        print(f"\n🚀 Starting scrape of {len(companies)} companies...\n")
+        mode = f"{self.max_workers} workers" if self.max_workers > 1 else "sequential"
+        print(f"\n🚀 Starting scrape of {len(companies)} companies ({mode})...\n")
         
-        all_jobs = []
+        if self.use_fetch_cache:
+            self.fetch_cache = self.db.get_board_fetch_cache([c['id'] for c in companies])
+        # Loaded per board as it is dispatched (see _dispatch_boards)
+        self.known_hashes = {}
         
-        for company in companies:
-            try:
-                jobs = self.scrape_job_board(company)
-                all_jobs.extend(jobs)
-                
-                # Update company last scraped
-                self.db.update_company_last_scraped(company['id'])
-                
-            except Exception as e:
-                print(f"❌ Error scraping {company['name']}: {str(e)}")
-                continue
+        out_queue = queue.Queue(maxsize=self.queue_size)
+        cancel = threading.Event()
+        dispatcher = threading.Thread(
+            target=self._dispatch_boards,
+            args=(companies, out_queue, cancel, deadline),
+            daemon=True
+        )
+        dispatcher.start()
         
-        # Save to database (newest first)
-        all_jobs.sort(key=lambda x: x['scraped_at'], reverse=True)
+        buffer = []
+        pending_validators = []
+        total_written = 0
+        self.company_stats = {}
+        self.board_listings = {}
+        self.failed_insert_companies = set()
         
-        for job in all_jobs:
-            self.db.insert_job(job)
+        try:
+            while True:
+                kind, company, payload, extra = out_queue.get()
+                
+                if kind == 'finished':
+                    break
+                
+                if kind == 'load':
+                    try:
+                        self.known_hashes.update(self.db.get_company_job_hashes([company['id']]))
+                    finally:
+                        payload.set()
+                    continue
+                
+                try:
+                    if kind == 'jobs':
+                        buffer.extend(self.process_jobs(company, payload, extra))
+                    else:
+                        self.known_hashes.pop(company['id'], None)
+                        self.record_board_result(company, payload, extra)
+                        buffer.extend(self.resolve_near_duplicates(company))
+                        if extra:
+                            raise extra
+                        
+                        if payload['status'] == 'unchanged':
+                            self.unchanged_count += 1
+                        
+                        self.reconcile_board(company, payload)
+                        
+                        if payload['validators']:
+                            pending_validators.append((company['id'], payload['validators']))
+                        
+                        # Update company last scraped
+                        self.db.update_company_last_scraped(company['id'])
+                    
+                except Exception as e:
+                    # A partial listing must not close the jobs it missed
+                    self.get_board_listing(company)['complete'] = False
+                    print(f"❌ Error scraping {company['name']}: {str(e)}")
+                
+                if len(buffer) >= self.insert_chunk_size:
+                    total_written += self._flush_jobs(buffer, pending_validators)
+            
+            total_written += self._flush_jobs(buffer, pending_validators)
+            
+        finally:
+            cancel.set()
+            dispatcher.join()
         
         summary = {
-            'total_scraped': len(all_jobs),
+            'total_scraped': total_written,
             'duplicates_skipped': self.duplicate_count,
             'new_jobs_added': self.new_jobs_count,
-            'boards_processed': len(companies),
-            'timestamp': datetime.now().isoformat()
+            'boards_processed': len(companies) - self.deferred_count,
+            'boards_unchanged': self.unchanged_count,
+            'boards_deferred': self.deferred_count,
+            'near_duplicates_skipped': self.near_duplicate_count,
+            'jobs_closed': self.closed_count,
+            'details_skipped': self.details_skipped_count,
+            'http_hosts': self.transport.host_stats(),
+            'timestamp': datetime.now().isoformat(),
+            'company_stats': list(self.company_stats.values())
         }
         
         print(f"\n✨ Scraping Complete!")
         print(f"   📊 Total jobs scraped: {summary['total_scraped']}")
         print(f"   🆕 New jobs added: {summary['new_jobs_added']}")
         print(f"   ⏭️  Duplicates skipped: {summary['duplicates_skipped']}")
-        print(f"   📋 Companies processed: {summary['boards_processed']}\n")
+        print(f"   🔁 Near-duplicates skipped: {summary['near_duplicates_skipped']}")
+        print(f"   🔒 Jobs closed: {summary['jobs_closed']}")
+        print(f"   📄 Detail pages skipped: {summary['details_skipped']}")
+        print(f"   📋 Companies processed: {summary['boards_processed']}")
+        print(f"   ⏸️  Unchanged boards skipped: {summary['boards_unchanged']}")
+        print(f"   ⏳ Boards deferred (time budget): {summary['boards_deferred']}")
+        for host, stats in summary['http_hosts'].items():
+            print(f"   🌐 {host}: {stats['requests']} requests, avg {stats['avg_ms']:.0f} ms, "
+                  f"{stats['connections_opened']} connections opened / {stats['connections_reused']} reused, "
+                  f"{stats['retries']} retries, {stats['errors']} errors")
+        print()
         
         return summary
     
+    def scrape_leased_board(self, company_config: Dict) -> Dict:
+        """
+        Scrape one board claimed from the lease table and store its jobs
+        
+        Used by worker processes: fetching, parsing and dedup run in this
+        process, and the jobs are written in short transactions before the
+        board's fetch validators are saved.
+        
+        Returns:
+            The board's telemetry plus `jobs_written` and `jobs_closed`
+        """
+        closed_before = self.closed_count
+        written = 0
+        
+        try:
+            bytes_start = self.transport.thread_bytes()
+            result = self.fetch_job_board(company_config)
+            
+            jobs = []
+            if result['jobs']:
+                start = time.perf_counter()
+                scraped = list(result['jobs'])
+                result['stats']['fetch_ms'] += (time.perf_counter() - start) * 1000
+                print(f"✅ Scraped {len(scraped)} jobs from {company_config['name']}")
+                jobs = self.process_jobs(company_config, result['ats_type'], scraped)
+            result['stats']['http_bytes'] += self.transport.thread_bytes() - bytes_start
+            
+            self.record_board_result(company_config, result)
+            jobs.extend(self.resolve_near_duplicates(company_config))
+            if result['status'] == 'unchanged':
+                self.unchanged_count += 1
+            
+            validators = [(company_config['id'], result['validators'])] if result['validators'] else []
+            written = self._flush_jobs(jobs, validators)
+            self.reconcile_board(company_config, result)
+            self.db.update_company_last_scraped(company_config['id'])
+            
+        except Exception as e:
+            self.board_listings.pop(company_config['id'], None)
+            self.record_board_result(company_config, None, e)
+            print(f"❌ Error scraping {company_config['name']}: {str(e)}")
+        
+        return dict(
+            self.get_company_stats(company_config),
+            jobs_written=written,
+            jobs_closed=self.closed_count - closed_before
+        )
+    
+    def scrape_leased_boards(self, run_token: str, worker_id: str, lease_seconds: float = 120,
+                             deadline: Optional[float] = None) -> int:
+        """
+        Claim and scrape boards from the lease table until none are left
+        
+        A heartbeat thread keeps the current lease alive while a board is
+        being scraped; if this process dies, the lease expires and another
+        worker claims the board again.
+        
+        Args:
+            run_token: Identifier of the run whose leases to claim
+            worker_id: Unique identifier of this worker
+            lease_seconds: Lease length; heartbeats renew it every third of that
+            deadline: Optional time.time() value after which no new boards
+                are claimed
+            
+        Returns:
+            Number of boards scraped by this worker
+        """
+        current = {'company_id': None}
+        stop = threading.Event()
+        
+        def heartbeat():
+            while not stop.wait(lease_seconds / 3):
+                company_id = current['company_id']
+                if company_id is not None:
+                    self.db.heartbeat_scrape_lease(run_token, company_id, worker_id, lease_seconds)
+        
+        heartbeat_thread = threading.Thread(target=heartbeat, daemon=True)
+        heartbeat_thread.start()
+        
+        scraped = 0
+        try:
+            while deadline is None or time.time() < deadline:
+                company_id = self.db.claim_scrape_lease(run_token, worker_id, lease_seconds)
+                if company_id is None:
+                    break
+                
+                company = self.db.get_company_by_id(company_id)
+                if company is None:
+                    self.db.complete_scrape_lease(run_token, company_id, worker_id, {}, status='failed')
+                    continue
+                
+                current['company_id'] = company_id
+                if self.use_fetch_cache:
+                    self.fetch_cache.update(self.db.get_board_fetch_cache([company_id]))
+                self.known_hashes.update(self.db.get_company_job_hashes([company_id]))
+                
+                result = self.scrape_leased_board(company)
+                current['company_id'] = None
+                self.known_hashes.pop(company_id, None)
+                
+                status = 'failed' if result['status'] == 'failed' else 'done'
+                if not self.db.complete_scrape_lease(run_token, company_id, worker_id, result, status):
+                    print(f"⚠️  Lease on {company['name']} was taken over by another worker")
+                scraped += 1
+        finally:
+            stop.set()
+            heartbeat_thread.join()
+        
+        return scraped
+    
     def run_daily_scrape(self):
         """Run the daily scheduled scrape"""
         # Get all active companies from database
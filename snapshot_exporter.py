@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Static Snapshot Exporter for Web3 Job Board
+Writes the job list as pre-compressed, content-hashed JSON shards for CDN hosting
+
+Layout (under the output directory, public/data by default):
+    manifest.json                         maps logical names to hashed files
+    companies.<hash>.json                 company index
+    jobs-all-<page>.<hash>.json           every job, newest first
+    jobs-<sector>-<page>.<hash>.json      jobs per sector, newest first
+
+Every shard is also written as .json.gz and, when the optional brotli
+package is installed, .json.br. Hashed files never change, so they can be
+served with a long immutable Cache-Control; only manifest.json needs to
+be revalidated.
+"""
+
+import re
+import sys
+import gzip
+import json
+import hashlib
+import argparse
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from database import Database
+
+
+MANIFEST_NAME = 'manifest.json'
+
+
+class SnapshotExporter:
+    """Exports the database to static, pre-compressed JSON shards"""
+
+    def __init__(self, db: Database, output_dir: str = 'public/data', page_size: int = 100):
+        """
+        Initialize exporter
+        
+        Args:
+            db: Database instance
+            output_dir: Directory to write shards and manifest into
+            page_size: Number of jobs per shard
+        """
+        self.db = db
+        self.output_dir = Path(output_dir)
+        self.page_size = page_size
+        self.files_written = 0
+        self.files_reused = 0
+        self.bytes_raw = 0
+        self.bytes_gzip = 0
+        self.bytes_brotli = 0
+
+    @staticmethod
+    def slugify(value: str) -> str:
+        """Make a sector name safe for use in a file name"""
+        return re.sub(r'[^a-z0-9]+', '-', value.lower()).strip('-') or 'other'
+
+    def write_shard(self, stem: str, data) -> str:
+        """
+        Write one JSON shard and its compressed variants, named by content hash
+        
+        Args:
+            stem: Logical file name without extension
+            data: JSON-serializable content
+        
+        Returns:
+            File name of the uncompressed shard (relative to output_dir)
+        """
+        raw = json.dumps(data, default=str, separators=(',', ':'), sort_keys=True).encode()
+        digest = hashlib.sha256(raw).hexdigest()[:12]
+        name = f"{stem}.{digest}.json"
+        path = self.output_dir / name
+
+        self.bytes_raw += len(raw)
+
+        # Same content hash means the file is already on disk from a previous export
+        if path.exists():
+            self.files_reused += 1
+            return name
+
+        variants = [(path, raw)]
+        # mtime=0 keeps the gzip bytes identical across exports of the same content
+        compressed = gzip.compress(raw, compresslevel=9, mtime=0)
+        variants.append((path.with_name(name + '.gz'), compressed))
+        self.bytes_gzip += len(compressed)
+
+        if brotli is not None:
+            compressed = brotli.compress(raw, quality=11)
+            variants.append((path.with_name(name + '.br'), compressed))
+            self.bytes_brotli += len(compressed)
+
+        for variant_path, content in variants:
+            tmp_path = variant_path.with_name(variant_path.name + '.tmp')
+            tmp_path.write_bytes(content)
+            tmp_path.replace(variant_path)
+
+        self.files_written += 1
+        return name
+
+    def export_jobs(self, sector: Optional[str] = None) -> Dict:
+        """
+        Export one job list (all sectors or a single sector) as paged shards
+        
+        Args:
+            sector: Sector to export, or None for every job
+        
+        Returns:
+            Dictionary with `pages` (shard file names in order) and `total`
+        """
+        stem = f"jobs-{self.slugify(sector) if sector else 'all'}"
+        pages = []
+        total = 0
+
+        # One streaming query; only the current shard's jobs are held in memory
+        rows = self.db.iter_jobs(sector=sector, chunk_size=self.page_size)
+
+        while True:
+            jobs = [row._asdict() for row in islice(rows, self.page_size)]
+
+            if jobs or not pages:
+                pages.append(self.write_shard(f"{stem}-{len(pages) + 1}", {
+                    'page': len(pages) + 1,
+                    'jobs': jobs
+                }))
+                total += len(jobs)
+
+            if len(jobs) < self.page_size:
+                break
+
+        return {'pages': pages, 'total': total}
+
+    def export(self) -> Dict:
+        """
+        Export the full snapshot and write the manifest
+        
+        Returns:
+            The manifest dictionary
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        previous = self.load_manifest()
+
+        print(f"📦 Exporting snapshot to {self.output_dir}...")
+
+        companies = self.db.get_all_companies(active_only=True)
+
+        manifest = {
+            'generated_at': datetime.now().isoformat(),
+            'scrape_id': self.db.get_latest_scrape_id(),
+            'page_size': self.page_size,
+            'compression': ['gzip', 'br'] if brotli is not None else ['gzip'],
+            'companies': self.write_shard('companies', companies),
+            'jobs': self.export_jobs(),
+            'sectors': {}
+        }
+
+        for sector in self.db.get_sectors():
+            manifest['sectors'][sector] = self.export_jobs(sector)
+
+        # Write the manifest last so it never points at missing shards
+        raw = json.dumps(manifest, indent=2).encode()
+        for name, content in ((MANIFEST_NAME, raw), (MANIFEST_NAME + '.gz', gzip.compress(raw, mtime=0))):
+            tmp_path = self.output_dir / (name + '.tmp')
+            tmp_path.write_bytes(content)
+            tmp_path.replace(self.output_dir / name)
+
+        removed = self.prune(manifest, previous)
+
+        print(f"✅ Snapshot exported: {manifest['jobs']['total']} jobs, "
+              f"{len(manifest['sectors'])} sectors, {self.files_written} new shards, "
+              f"{self.files_reused} unchanged, {removed} stale removed")
+        if self.bytes_raw:
+            summary = f"   {self.bytes_raw / 1024:.0f} KB raw"
+            if self.bytes_gzip:
+                summary += f", {self.bytes_gzip / 1024:.0f} KB gzip (new shards)"
+            if self.bytes_brotli:
+                summary += f", {self.bytes_brotli / 1024:.0f} KB brotli (new shards)"
+            print(summary)
+        if brotli is None:
+            print("ℹ️  brotli not installed; wrote gzip variants only")
+
+        return manifest
+
+    def load_manifest(self) -> Optional[Dict]:
+        """Load the manifest from a previous export, if any"""
+        try:
+            return json.loads((self.output_dir / MANIFEST_NAME).read_text())
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def manifest_files(manifest: Optional[Dict]) -> set:
+        """Get every shard file name referenced by a manifest"""
+        if not manifest:
+            return set()
+
+        names = {manifest['companies']}
+        names.update(manifest['jobs']['pages'])
+        for sector in manifest['sectors'].values():
+            names.update(sector['pages'])
+        return names
+
+    def prune(self, manifest: Dict, previous: Optional[Dict]) -> int:
+        """
+        Remove shards referenced by neither the new nor the previous manifest
+        
+        The previous generation is kept so clients that loaded the old
+        manifest a moment ago can still fetch its shards.
+        
+        Returns:
+            Number of shards removed
+        """
+        keep = self.manifest_files(manifest) | self.manifest_files(previous)
+        removed = 0
+
+        for path in self.output_dir.glob('*.json'):
+            if path.name == MANIFEST_NAME or path.name in keep:
+                continue
+            for variant in (path, path.with_name(path.name + '.gz'), path.with_name(path.name + '.br')):
+                if variant.exists():
+                    variant.unlink()
+            removed += 1
+
+        return removed
+
+
+def export_snapshot(db_path: str = 'web3_jobs.db', output_dir: str = 'public/data',
+                    page_size: int = 100) -> Dict:
+    """
+    Export a static snapshot of the database
+    
+    Args:
+        db_path: Path to SQLite database file
+        output_dir: Directory to write shards and manifest into
+        page_size: Number of jobs per shard
+    
+    Returns:
+        The manifest dictionary
+    """
+    db = Database(db_path)
+    try:
+        return SnapshotExporter(db, output_dir, page_size).export()
+    finally:
+        db.close()
+
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Export the job board as static JSON shards")
+    parser.add_argument('--db', default='web3_jobs.db', help="Database path (default: web3_jobs.db)")
+    parser.add_argument('--output', default='public/data', help="Output directory (default: public/data)")
+    parser.add_argument('--page-size', type=int, default=100, help="Jobs per shard (default: 100)")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    export_snapshot(args.db, args.output, args.page_size)
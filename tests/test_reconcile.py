@@ -0,0 +1,75 @@
+"""
+Regression tests for closing and reopening jobs in Database.reconcile_board_jobs
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database import Database
+from fingerprint import job_fingerprint, posting_key
+
+
+DESCRIPTION = 'Design and ship smart contracts for our lending protocol. ' * 10
+
+
+def make_job(company_id: int, job_url: str, title: str = 'Protocol Engineer') -> dict:
+    job = {
+        'job_hash': job_url,
+        'title': title,
+        'company_id': company_id,
+        'company_name': 'Acme',
+        'location': 'Remote',
+        'description': DESCRIPTION,
+        'full_description': DESCRIPTION,
+        'job_url': job_url
+    }
+    job['fingerprint'] = job_fingerprint(job)
+    return job
+
+
+def test_repost_reopens_closed_original(tmp_path):
+    db = Database(str(tmp_path / 'jobs.db'))
+    company_id = db.add_company('Acme', 'https://jobs.lever.co/acme')
+    original_id, other_id = db.insert_jobs_bulk([
+        make_job(company_id, 'https://jobs.lever.co/acme/1'),
+        make_job(company_id, 'https://jobs.lever.co/acme/other', title='Office Manager')
+    ])
+
+    # The original drops off the board and is closed
+    assert db.reconcile_board_jobs(company_id, {'https://jobs.lever.co/acme/other'}) == \
+        {'closed': 1, 'reopened': 0}
+
+    # It comes back under a new URL: matched as a near-duplicate of the closed original
+    repost = make_job(company_id, 'https://jobs.lever.co/acme/2')
+    matches = db.find_near_duplicates([
+        (repost['fingerprint'], posting_key(repost['title'], repost['company_name'], repost['location']))
+    ])
+    assert matches == [original_id]
+
+    # The orchestrator moves the original to the repost's URL before reconciling
+    assert db.move_reposted_jobs(company_id, [(original_id, repost['job_hash'], repost['job_url'])]) == 1
+    changes = db.reconcile_board_jobs(company_id, {'https://jobs.lever.co/acme/other', repost['job_hash']})
+    assert changes == {'closed': 0, 'reopened': 1}
+
+    job = db.get_job_detail(original_id)
+    assert job['status'] == 'open'
+    assert job['job_url'] == 'https://jobs.lever.co/acme/2'
+    assert db.get_existing_hashes([repost['job_hash']]) == {repost['job_hash']}
+    db.close()
+
+
+def test_repost_moves_open_original_to_live_url(tmp_path):
+    db = Database(str(tmp_path / 'jobs.db'))
+    company_id = db.add_company('Acme', 'https://jobs.lever.co/acme')
+    original_id, = db.insert_jobs_bulk([make_job(company_id, 'https://jobs.lever.co/acme/1')])
+
+    # The board now lists only the repost
+    repost = make_job(company_id, 'https://jobs.lever.co/acme/3')
+    db.move_reposted_jobs(company_id, [(original_id, repost['job_hash'], repost['job_url'])])
+
+    assert db.reconcile_board_jobs(company_id, {repost['job_hash']}) == {'closed': 0, 'reopened': 0}
+    job = db.get_job_detail(original_id)
+    assert (job['status'], job['job_url']) == ('open', 'https://jobs.lever.co/acme/3')
+    db.close()